@@ -1,3 +1,5 @@
+import os
+import sys
 import time
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -8,17 +10,12 @@ from selenium.webdriver.support import expected_conditions as EC
 import pandas as pd
 from webdriver_manager.chrome import ChromeDriverManager
 
-# List of NBA teams
-nba_teams = [
-    "cleveland-cavaliers", "los-angeles-lakers", "miami-heat", "chicago-bulls", 
-    "new-york-knicks", "golden-state-warriors", "brooklyn-nets", "boston-celtics",
-    "atlanta-hawks", "charlotte-hornets", "chicago-bulls", "dallas-mavericks", 
-    "denver-nuggets", "detroit-pistons", "indiana-pacers", "los-angeles-clippers", 
-    "memphis-grizzlies", "minnesota-timberwolves", "new-orleans-pelicans", "orlando-magic", 
-    "philadelphia-76ers", "phoenix-suns", "portland-trail-blazers", "sacramento-kings", 
-    "san-antonio-spurs", "toronto-raptors", "utah-jazz", "washington-wizards", 
-    "houston-rockets", "oklahoma-city-thunder"
-]
+# Make the shared modules in <repo>/common importable when run as a script
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from common.team_registry import load_registry
+
+# TeamRankings slugs of every NBA team (common/team_registry.py)
+nba_teams = load_registry("nba").teamrankings_slugs()
 
 # Function to generate the script for each team
 def generate_team_script(team_slug):
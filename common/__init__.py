@@ -0,0 +1,3 @@
+# Shared scraping and data modules used by the nba/, ncaam/ and Team_Win_Stats/ scripts.
+# Scripts add the repo root to sys.path and import from here, e.g.
+#     from common.espn_splits import fetch_splits
@@ -0,0 +1,256 @@
+# ats_model.py
+# Batch training pipeline for the ATS (against the spread) trend model
+# Training rows are (team, situation) pairs from the saved TeamRankings trend CSVs for all 30
+# teams, e.g. ("miami-heat", "As Home Underdog"). The label is whether the team covers in that
+# situation more often than not (Cover % > 50). Nothing derived from the ATS outcome is a
+# feature: the ATS record's win/loss split, Cover % and ATS +/- (also repeated in the win-trend
+# table) are left out. Features are the situation, sample size, MOV, win % and over/under
+# numbers for the same situation, the team's overall win % and MOV, and the current scoring
+# form of the team's rotation from the game-log form features.
+# The feature matrix is cached on disk, keyed by the input files, and the trained model is saved
+# with joblib. A slate is scored from out-of-fold probabilities: every team's situations are scored
+# by a model fitted without that team, so a prediction never comes from a row the model saw.
+
+import hashlib
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.metrics import accuracy_score, roc_auc_score
+from sklearn.model_selection import GroupKFold
+
+from common.form_engine import form_path
+from common.gamelog_store import current_season
+from common.paths import CACHE_DIR, FORM_FEATURES_DIR, MODEL_DIR, TEAMRANKINGS_TREND_DIRS
+from common.team_registry import teamrankings_slug
+from common.teamrankings_trends import TREND_FILE_SUFFIXES
+
+MODEL_PATH = os.path.join(MODEL_DIR, "ats_model.joblib")
+
+# Bump when the feature definitions change so stale cached matrices are not reused
+FEATURE_VERSION = 1
+
+FEATURES = [
+    "trend_code", "home", "ats_games", "mov", "win_pct", "over_pct", "ou_margin",
+    "team_win_pct", "team_mov", "rotation_pts_l10", "rotation_fg_pct_l10",
+]
+
+# Players counted in the rotation form features
+ROTATION_SIZE = 8
+
+# Team folds for the out-of-fold scores
+SCORE_FOLDS = 5
+
+
+def _pct(series):
+    return pd.to_numeric(series.astype(str).str.rstrip("%"), errors="coerce")
+
+
+def _record_games(series):
+    """Games in a "W-L-P" record."""
+    parts = series.astype(str).str.extract(r"^(\d+)-(\d+)-?(\d*)$")
+    return parts.apply(pd.to_numeric, errors="coerce").fillna(0).sum(axis=1)
+
+
+def read_trend_tables(trend_dirs=TEAMRANKINGS_TREND_DIRS):
+    """Every saved ATS, O/U and win trend CSV as one frame per trend type: {trend: DataFrame}."""
+    tables = {}
+    for trend, base_dir in trend_dirs.items():
+        frames = []
+        for team in sorted(os.listdir(base_dir)) if os.path.isdir(base_dir) else []:
+            csv_path = os.path.join(base_dir, team, f"{team}_{TREND_FILE_SUFFIXES[trend]}.csv")
+            if os.path.exists(csv_path):
+                frames.append(pd.read_csv(csv_path, dtype=str).assign(team=team))
+        tables[trend] = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=["team", "Trend"])
+    return tables
+
+
+def rotation_form(season=None, form_dir=FORM_FEATURES_DIR):
+    """Latest scoring form of each team's top minute-getters: team -> rotation_pts_l10, rotation_fg_pct_l10."""
+    path = form_path(season or current_season(), form_dir)
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=["rotation_pts_l10", "rotation_fg_pct_l10"])
+    form = pd.read_parquet(path)
+    latest = form.sort_values("date").groupby("player_id").tail(1)
+    rotation = latest.sort_values("min_l10_mean", ascending=False).groupby("team").head(ROTATION_SIZE)
+    by_team = rotation.groupby("team").agg(rotation_pts_l10=("pts_l10_mean", "sum"),
+                                           rotation_fg_pct_l10=("fg_pct_l10_mean", "mean"))
+    # Form features use ESPN team slugs; the trend tables use TeamRankings slugs
+    return by_team.rename(index=teamrankings_slug)
+
+
+def build_feature_matrix(trend_dirs=TEAMRANKINGS_TREND_DIRS, form_dir=FORM_FEATURES_DIR, season=None):
+    """One row per (team, situation) with FEATURES, the label and the situation name."""
+    tables = read_trend_tables(trend_dirs)
+    ats = tables["ats"]
+    if ats.empty:
+        return pd.DataFrame(columns=["team", "trend"] + FEATURES + ["covered"])
+
+    matrix = pd.DataFrame({
+        "team": ats["team"],
+        "trend": ats["Trend"],
+        "ats_games": _record_games(ats["ATS Record"]),
+        "mov": pd.to_numeric(ats["MOV"], errors="coerce"),
+        "covered": (_pct(ats["Cover %"]) > 50).astype(int),
+    })
+    matrix["home"] = np.select([matrix["trend"].str.contains("Home"), matrix["trend"].str.contains("Away")], [1, 0], 0.5)
+
+    win = tables["win"]
+    if not win.empty:
+        win = pd.DataFrame({"team": win["team"], "trend": win["Trend"], "win_pct": _pct(win["Win %"])})
+        matrix = matrix.merge(win, on=["team", "trend"], how="left")
+    ou = tables["ou"]
+    if not ou.empty:
+        ou = pd.DataFrame({"team": ou["team"], "trend": ou["Trend"], "over_pct": _pct(ou["Over/Under %"]),
+                           "ou_margin": pd.to_numeric(ou["Over/Under +/-"], errors="coerce")})
+        matrix = matrix.merge(ou, on=["team", "trend"], how="left")
+    for column in ["win_pct", "over_pct", "ou_margin"]:
+        if column not in matrix:
+            matrix[column] = np.nan
+
+    overall = matrix[matrix["trend"] == "All Games"].set_index("team")
+    matrix["team_win_pct"] = matrix["team"].map(overall["win_pct"])
+    matrix["team_mov"] = matrix["team"].map(overall["mov"])
+
+    form = rotation_form(season, form_dir)
+    matrix["rotation_pts_l10"] = matrix["team"].map(form["rotation_pts_l10"])
+    matrix["rotation_fg_pct_l10"] = matrix["team"].map(form["rotation_fg_pct_l10"])
+
+    matrix["trend_code"] = matrix["trend"].astype("category").cat.codes
+    return matrix[["team", "trend"] + FEATURES + ["covered"]]
+
+
+def _inputs_key(trend_dirs, form_dir, season):
+    """Hash of every input file's path, size and modification time."""
+    entries = [FEATURE_VERSION]
+    for base_dir in trend_dirs.values():
+        for root, _, files in os.walk(base_dir):
+            for name in sorted(files):
+                if name.endswith(".csv"):
+                    stat = os.stat(os.path.join(root, name))
+                    entries.append((os.path.join(root, name), stat.st_size, stat.st_mtime_ns))
+    path = form_path(season or current_season(), form_dir)
+    if os.path.exists(path):
+        entries.append((path, os.path.getsize(path), os.stat(path).st_mtime_ns))
+    return hashlib.sha1(json.dumps(entries, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def load_feature_matrix(trend_dirs=TEAMRANKINGS_TREND_DIRS, form_dir=FORM_FEATURES_DIR, season=None, cache_dir=CACHE_DIR):
+    """build_feature_matrix(), reused from the on-disk cache while none of the inputs changed."""
+    cache_path = os.path.join(cache_dir, f"ats_features_{_inputs_key(trend_dirs, form_dir, season)}.parquet")
+    if os.path.exists(cache_path):
+        return pd.read_parquet(cache_path)
+    matrix = build_feature_matrix(trend_dirs, form_dir, season)
+    os.makedirs(cache_dir, exist_ok=True)
+    matrix.to_parquet(cache_path, index=False)
+    return matrix
+
+
+def out_of_fold(X, y, teams, n_estimators=200, random_state=42, folds=SCORE_FOLDS):
+    """Cover probability for every row from a model fitted without that row's team (NaN if it can't be fitted)."""
+    proba = np.full(len(y), np.nan)
+    n_splits = min(folds, len(set(teams)))
+    if n_splits < 2:
+        return proba
+    for train_idx, test_idx in GroupKFold(n_splits=n_splits).split(X, y, teams):
+        if len(set(y[train_idx])) < 2:
+            continue
+        model = RandomForestClassifier(n_estimators=n_estimators, min_samples_leaf=3, n_jobs=-1,
+                                       random_state=random_state).fit(X[train_idx], y[train_idx])
+        proba[test_idx] = model.predict_proba(X[test_idx])[:, 1]
+    return proba
+
+
+def train(matrix=None, n_estimators=200, model_path=MODEL_PATH, random_state=42):
+    """Score every situation out of fold and save the scores in the bundle. Returns the bundle.
+
+    The folds are by team, so no team's situations are scored by a model that saw them; the
+    held-out accuracy and AUC come from those scores, and slates are answered from them. No
+    model is fitted on every team, since nothing would score with it.
+    """
+    matrix = load_feature_matrix() if matrix is None else matrix
+    if matrix["covered"].nunique() < 2:
+        raise ValueError(f"Need both covering and non-covering situations to train (got {len(matrix)} rows)")
+
+    X = matrix[FEATURES].to_numpy(dtype="float64")
+    y = matrix["covered"].to_numpy()
+    metrics = {"rows": len(matrix), "teams": int(matrix["team"].nunique())}
+
+    start = time.perf_counter()
+    scores = out_of_fold(X, y, matrix["team"].to_numpy(), n_estimators, random_state)
+    metrics["fit_seconds"] = round(time.perf_counter() - start, 3)
+    scored = ~np.isnan(scores)
+    if scored.any():
+        metrics["holdout_accuracy"] = accuracy_score(y[scored], scores[scored] > 0.5)
+        if len(set(y[scored])) == 2:
+            metrics["holdout_auc"] = roc_auc_score(y[scored], scores[scored])
+
+    bundle = {
+        "features": FEATURES,
+        "feature_version": FEATURE_VERSION,
+        # Feature rows indexed by (team, trend) for slate lookups
+        "situations": matrix.set_index(["team", "trend"])[FEATURES],
+        # Out-of-fold cover probability per (team, trend), used to score slates
+        "scores": pd.Series(scores, index=pd.MultiIndex.from_frame(matrix[["team", "trend"]])),
+        "trained_at": datetime.now().isoformat(timespec="seconds"),
+        "metrics": metrics,
+    }
+    os.makedirs(os.path.dirname(model_path), exist_ok=True)
+    # Write then rename so a running inference server never loads a half-written file
+    joblib.dump(bundle, f"{model_path}.tmp")
+    os.replace(f"{model_path}.tmp", model_path)
+    print(f"Trained ATS model on {metrics['rows']} situations from {metrics['teams']} teams: {metrics}")
+    return bundle
+
+
+def load_model(model_path=MODEL_PATH):
+    """Saved model bundle (see train())."""
+    return joblib.load(model_path)
+
+
+def slate_keys(games):
+    """(team, situation) keys for a slate: games is a list of {"team", "home"} dicts (one per side of a matchup).
+
+    Each team is looked up in its "As Home Team" / "As Away Team" situation.
+    """
+    return [(game["team"], "As Home Team" if game["home"] else "As Away Team") for game in games]
+
+
+def score_situations(bundle):
+    """Out-of-fold cover probability for every (team, trend) row in the bundle, as a Series.
+
+    Each row was scored by a model fitted without its team (see train()), so these are not
+    in-sample predictions. A long-lived caller can load them once and answer slates with lookups.
+    """
+    if "scores" not in bundle:
+        raise ValueError("Model bundle has no out-of-fold scores; retrain with python -m common.ats_model train")
+    return bundle["scores"]
+
+
+def predict_slate(bundle, games):
+    """Cover probability for every game in the slate, in order (NaN where the team has no trend data)."""
+    return score_situations(bundle).reindex(slate_keys(games)).to_numpy(dtype="float64")
+
+
+def main():
+    # python -m common.ats_model train
+    # python -m common.ats_model predict miami-heat:home chicago-bulls:away ...
+    command = sys.argv[1] if len(sys.argv) > 1 else "train"
+    if command == "train":
+        train()
+    elif command == "predict":
+        games = [{"team": arg.split(":")[0], "home": arg.endswith(":home")} for arg in sys.argv[2:]]
+        for game, proba in zip(games, predict_slate(load_model(), games)):
+            print(f"{game['team']:<25} {'home' if game['home'] else 'away'}  cover probability {proba:.3f}")
+    else:
+        print("Usage: python -m common.ats_model <train|predict team:home|away ...>")
+
+
+if __name__ == "__main__":
+    main()
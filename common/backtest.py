@@ -0,0 +1,304 @@
+# backtest.py
+# Walk-forward backtests of game predictions (win, ATS, over/under) from the game-log store
+# Team games are rebuilt from the player game logs (credited to the team each player actually
+# played for, per the league schedule, without preseason games), and every game gets features
+# that only use games played before it (win %, margins, points for/against, rest) for the team
+# and its opponent.
+# The season is then replayed in steps of step_days: each fold trains a fresh model on
+# everything before the fold and predicts the fold's games. Folds run in a process pool.
+# The report covers hit rate, ROI betting every pick at -110, Brier score and a calibration table.
+# Predictions are cached per (config, date range, input data), so re-running a sweep only
+# computes configurations that have not been run yet.
+#
+# ATS and O/U need the closing lines, which are not scraped: put them in data/lines.csv
+# (date, team, spread, total). Win predictions need nothing but the game logs.
+
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import HistGradientBoostingClassifier, RandomForestClassifier
+from sklearn.impute import SimpleImputer
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+
+from common.gamelog_store import current_season, load_gamelogs
+from common.paths import BACKTEST_CACHE_DIR, BETTING_LINES_PATH, GAMELOG_STORE_DIR
+from common.team_registry import NBA_TEAMS, SPLIT_ABBREVIATIONS
+
+TARGETS = ["win", "ats", "ou"]
+
+# Model name -> factory taking the config's params
+MODELS = {
+    "random_forest": lambda **params: RandomForestClassifier(**params),
+    "hist_gradient_boosting": lambda **params: HistGradientBoostingClassifier(**params),
+    "logistic": lambda **params: make_pipeline(SimpleImputer(), StandardScaler(), LogisticRegression(**params)),
+}
+
+# Per-team form going into a game; the opponent's copy is prefixed with opp_
+TEAM_FEATURES = ["rest_days", "games", "win_pct", "avg_margin", "l10_win_pct", "l10_margin", "l10_pts_for", "l10_pts_against"]
+FEATURES = ["home"] + TEAM_FEATURES + [f"opp_{name}" for name in TEAM_FEATURES]
+
+DEFAULT_CONFIG = {
+    "target": "win",
+    "model": "random_forest",
+    "params": {"n_estimators": 200, "min_samples_leaf": 5, "random_state": 42},
+    "features": FEATURES,
+    "step_days": 7,
+    # Folds with fewer labelled training games than this are skipped
+    "min_train_games": 100,
+    # Only bet picks whose probability is at least this far from a coin flip (0.5 = bet everything)
+    "min_confidence": 0.5,
+}
+
+# A -110 bet risks 1.1 to win 1
+ODDS_RISK = 1.1
+
+CALIBRATION_BINS = 10
+
+
+def _slugs_by_abbreviation():
+    """Game-log opponent abbreviation -> ESPN team slug."""
+    slugs = {abbr: slug for slug, (abbr, _, _) in NBA_TEAMS.items()}
+    slugs.update({log_abbr: slugs[split_abbr] for log_abbr, split_abbr in SPLIT_ABBREVIATIONS.items()})
+    return slugs
+
+
+def team_games(games):
+    """One row per team and game from a load_gamelogs() frame (every player row repeats the result).
+
+    Games are credited to played_for, the team the player was on that day, so a traded player's
+    games for their old team don't land in their new team's partition. Rows the league schedule couldn't
+    place and preseason games are left out.
+    """
+    columns = ["season", "team", "date", "home", "opponent", "win", "team_score", "opp_score", "margin"]
+    verified = games["played_for"].notna() & (games["season_type"] != "preseason")
+    teams = games[verified].assign(team=games["played_for"])[columns]
+    teams = teams.dropna(subset=["date"]).drop_duplicates(["team", "date"])
+    teams = teams.assign(opponent=teams["opponent"].map(_slugs_by_abbreviation()))
+    return teams.sort_values(["team", "date"]).reset_index(drop=True)
+
+
+def team_form(teams):
+    """TEAM_FEATURES for every row of team_games(), from the team's earlier games that season only."""
+    keys = [teams["team"], teams["season"]]
+    # shift(1) leaves each game out of its own features
+    prior = lambda values: values.groupby(keys).shift(1)
+    last10 = lambda values: prior(values).groupby(keys).rolling(10, min_periods=1).mean().reset_index(level=[0, 1], drop=True)
+    win = teams["win"].astype("float64")
+    margin = teams["margin"].astype("float64")
+    games = teams.groupby(keys).cumcount().astype("float64")
+    played = games.replace(0, np.nan)
+    form = pd.DataFrame({
+        "rest_days": pd.to_datetime(teams["date"]).groupby(keys).diff().dt.days - 1,
+        "games": games,
+        "win_pct": (win.groupby(keys).cumsum() - win) / played,
+        "avg_margin": (margin.groupby(keys).cumsum() - margin) / played,
+        "l10_win_pct": last10(win),
+        "l10_margin": last10(margin),
+        "l10_pts_for": last10(teams["team_score"].astype("float64")),
+        "l10_pts_against": last10(teams["opp_score"].astype("float64")),
+    }, index=teams.index)
+    return form[TEAM_FEATURES]
+
+
+def read_lines(lines_path=BETTING_LINES_PATH):
+    """Closing lines (date, team, spread, total), or None if no lines file exists."""
+    if not os.path.exists(lines_path):
+        return None
+    lines = pd.read_csv(lines_path, dtype={"team": str})
+    lines["date"] = pd.to_datetime(lines["date"]).dt.date
+    return lines[["date", "team", "spread", "total"]].drop_duplicates(["date", "team"], keep="last")
+
+
+def build_dataset(games, target="win", lines=None):
+    """One row per game (the home team's view where both teams are stored) with FEATURES and a label.
+
+    Labels: win; ats = the team covered its spread; ou = the game went over the total.
+    Pushes and games without a line have no label and are left out of training and scoring.
+    """
+    if target not in TARGETS:
+        raise ValueError(f"Unknown target {target!r}; expected one of {TARGETS}")
+    teams = team_games(games)
+    dataset = pd.concat([teams, team_form(teams)], axis=1)
+    opponent_form = dataset[["team", "date"] + TEAM_FEATURES].rename(
+        columns={"team": "opponent", **{name: f"opp_{name}" for name in TEAM_FEATURES}})
+    dataset = dataset.merge(opponent_form, on=["opponent", "date"], how="left")
+    dataset["home"] = dataset["home"].astype("float64")
+
+    if target == "win":
+        dataset["label"] = dataset["win"].astype("float64")
+    else:
+        if lines is None:
+            raise ValueError(f"The {target} target needs closing lines in {BETTING_LINES_PATH}")
+        dataset = dataset.merge(lines, on=["date", "team"], how="left")
+        if target == "ats":
+            result = dataset["margin"] + dataset["spread"]
+        else:
+            result = dataset["team_score"] + dataset["opp_score"] - dataset["total"]
+        dataset["label"] = np.select([result > 0, result < 0], [1.0, 0.0], np.nan)
+
+    # Both teams' logs hold the same game; keep one row per game, preferring the home side
+    opponent = dataset["opponent"].fillna(dataset["team"])
+    dataset["game"] = (dataset["date"].astype(str) + "|" + np.minimum(dataset["team"], opponent)
+                       + "|" + np.maximum(dataset["team"], opponent))
+    dataset = dataset.sort_values(["date", "home"], ascending=[True, False], kind="stable").drop_duplicates("game")
+    return dataset.drop(columns="game").reset_index(drop=True)
+
+
+def walk_forward_folds(start, end, step_days):
+    """[fold_start, fold_end) date ranges covering start..end inclusive."""
+    folds = []
+    fold_start = start
+    while fold_start <= end:
+        fold_end = min(fold_start + timedelta(days=step_days), end + timedelta(days=1))
+        folds.append((fold_start, fold_end))
+        fold_start = fold_end
+    return folds
+
+
+def make_model(config):
+    """Unfitted model for a config; single-threaded, since parallelism comes from the fold pool."""
+    params = dict(config.get("params", {}))
+    if config["model"] == "random_forest":
+        params.setdefault("n_jobs", 1)
+    return MODELS[config["model"]](**params)
+
+
+# Set once per worker process by _init_worker so folds don't re-send the dataset
+_WORKER_STATE = {}
+
+
+def _init_worker(dataset, config):
+    _WORKER_STATE["dataset"] = dataset
+    _WORKER_STATE["config"] = config
+
+
+def _run_fold(fold):
+    """Train on every labelled game before the fold and predict the fold's games."""
+    dataset, config = _WORKER_STATE["dataset"], _WORKER_STATE["config"]
+    fold_start, fold_end = fold
+    labelled = dataset["label"].notna()
+    train = dataset[labelled & (dataset["date"] < fold_start)]
+    test = dataset[labelled & (dataset["date"] >= fold_start) & (dataset["date"] < fold_end)]
+    if test.empty or len(train) < config["min_train_games"] or train["label"].nunique() < 2:
+        return None
+    model = make_model(config)
+    model.fit(train[config["features"]].to_numpy(dtype="float64"), train["label"].to_numpy())
+    probability = model.predict_proba(test[config["features"]].to_numpy(dtype="float64"))[:, 1]
+    return pd.DataFrame({
+        "date": test["date"].to_numpy(), "team": test["team"].to_numpy(), "opponent": test["opponent"].to_numpy(),
+        "label": test["label"].to_numpy(), "probability": probability, "train_games": len(train),
+    })
+
+
+def _store_key(store_dir, lines_path):
+    """Sizes and modification times of the store files and the lines file, for cache keys."""
+    entries = []
+    for root, _, files in os.walk(store_dir):
+        for name in sorted(files):
+            if name.endswith(".parquet"):
+                stat = os.stat(os.path.join(root, name))
+                entries.append((os.path.relpath(os.path.join(root, name), store_dir), stat.st_size, stat.st_mtime_ns))
+    if os.path.exists(lines_path):
+        entries.append((lines_path, os.stat(lines_path).st_mtime_ns))
+    return entries
+
+
+def cache_path(config, start, end, seasons, store_dir=GAMELOG_STORE_DIR, lines_path=BETTING_LINES_PATH,
+               cache_dir=BACKTEST_CACHE_DIR):
+    """Cached predictions file for a (config, date range, input data) combination."""
+    key = json.dumps({"config": config, "start": str(start), "end": str(end), "seasons": seasons,
+                      "data": _store_key(store_dir, lines_path)}, sort_keys=True, default=str)
+    return os.path.join(cache_dir, f"{hashlib.sha1(key.encode()).hexdigest()[:16]}.parquet")
+
+
+def run_backtest(config=None, start=None, end=None, seasons=None, store_dir=GAMELOG_STORE_DIR,
+                 lines_path=BETTING_LINES_PATH, cache_dir=BACKTEST_CACHE_DIR, workers=None, games=None):
+    """Walk-forward predictions for every labelled game from start to end. Returns (predictions, report).
+
+    config overrides DEFAULT_CONFIG. seasons (default: the current one) are the game-log seasons
+    loaded; earlier seasons only add training data. games skips loading the store (e.g. when a
+    sweep already has it in memory).
+    """
+    config = {**DEFAULT_CONFIG, **(config or {})}
+    seasons = seasons or [current_season()]
+    path = cache_path(config, start, end, seasons, store_dir, lines_path, cache_dir)
+    if os.path.exists(path):
+        predictions = pd.read_parquet(path)
+        return predictions, report(predictions, config["min_confidence"])
+
+    started = time.perf_counter()
+    if games is None:
+        games = pd.concat([load_gamelogs(season, store_dir=store_dir) for season in seasons], ignore_index=True)
+    dataset = build_dataset(games, config["target"], read_lines(lines_path) if config["target"] != "win" else None)
+    dates = dataset.loc[dataset["label"].notna(), "date"]
+    if dates.empty:
+        raise ValueError("No labelled games to backtest")
+    start = start or dates.min()
+    end = end or dates.max()
+
+    folds = walk_forward_folds(start, end, config["step_days"])
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(dataset, config)) as pool:
+        results = [frame for frame in pool.map(_run_fold, folds) if frame is not None]
+    if results:
+        predictions = pd.concat(results, ignore_index=True)
+    else:
+        predictions = pd.DataFrame(columns=["date", "team", "opponent", "label", "probability", "train_games"])
+
+    os.makedirs(cache_dir, exist_ok=True)
+    predictions.to_parquet(f"{path}.tmp", index=False)
+    os.replace(f"{path}.tmp", path)
+    print(f"Backtested {len(predictions)} games over {len(folds)} folds in {time.perf_counter() - started:.2f}s")
+    return predictions, report(predictions, config["min_confidence"])
+
+
+def report(predictions, min_confidence=0.5):
+    """Hit rate, ROI at -110, Brier score and calibration bins for backtest predictions."""
+    label = predictions["label"].to_numpy(dtype="float64")
+    probability = predictions["probability"].to_numpy(dtype="float64")
+    pick = probability >= 0.5
+    bets = np.maximum(probability, 1 - probability) >= min_confidence
+    hits = (pick == (label == 1))[bets]
+    profit = np.where(hits, 1.0, -ODDS_RISK).sum()
+
+    bins = np.minimum((probability * CALIBRATION_BINS).astype(int), CALIBRATION_BINS - 1)
+    calibration = (pd.DataFrame({"bin": bins, "probability": probability, "label": label})
+                   .groupby("bin").agg(games=("label", "size"), predicted=("probability", "mean"), observed=("label", "mean"))
+                   .reset_index())
+    calibration["bin"] = [f"{b / CALIBRATION_BINS:.1f}-{(b + 1) / CALIBRATION_BINS:.1f}" for b in calibration["bin"]]
+    return {
+        "games": len(predictions),
+        "bets": int(bets.sum()),
+        "hit_rate": float(hits.mean()) if len(hits) else float("nan"),
+        "profit_units": float(profit),
+        "roi": float(profit / (ODDS_RISK * len(hits))) if len(hits) else float("nan"),
+        "brier": float(np.mean((probability - label) ** 2)) if len(label) else float("nan"),
+        "calibration": calibration,
+    }
+
+
+def print_report(result):
+    print(f"Games: {result['games']}  Bets: {result['bets']}  Hit rate: {result['hit_rate']:.3f}  "
+          f"ROI at -110: {result['roi']:+.3f} ({result['profit_units']:+.1f} units)  Brier: {result['brier']:.4f}")
+    print(result["calibration"].to_string(index=False, float_format=lambda x: f"{x:.3f}"))
+
+
+def main():
+    # python -m common.backtest [win|ats|ou] [start YYYY-MM-DD] [end YYYY-MM-DD]
+    target = sys.argv[1] if len(sys.argv) > 1 else "win"
+    start = date.fromisoformat(sys.argv[2]) if len(sys.argv) > 2 else None
+    end = date.fromisoformat(sys.argv[3]) if len(sys.argv) > 3 else None
+    predictions, result = run_backtest({"target": target}, start, end)
+    print_report(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+# console.py
+# Prints scraped rows as a boxed, Excel-style table in the terminal
+
+
+def print_excel_style(headers, data):
+    """Print headers and rows in an Excel-like table format."""
+    if not headers or not data:
+        print("No headers or data to display.")
+        return
+
+    max_cols = len(headers)
+    col_widths = [len(str(h)) for h in headers]
+
+    padded_rows = []
+    for row in data:
+        padded_row = list(row) + [""] * (max_cols - len(row)) if len(row) < max_cols else list(row)[:max_cols]
+        padded_rows.append(padded_row)
+        for i, cell in enumerate(padded_row):
+            col_widths[i] = max(col_widths[i], len(str(cell)))
+
+    top_border = "┌" + "─".join("─" * (w + 2) for w in col_widths) + "┐"
+    bottom_border = "└" + "─".join("─" * (w + 2) for w in col_widths) + "┘"
+    separator = "├" + "─".join("─" * (w + 2) for w in col_widths) + "┤"
+
+    print(top_border)
+    header_row = "│ " + " │ ".join(str(h).center(w) for h, w in zip(headers, col_widths)) + " │"
+    print(header_row)
+    print(separator)
+
+    for row in padded_rows:
+        data_row = "│ " + " │ ".join(str(cell).ljust(w) for cell, w in zip(row, col_widths)) + " │"
+        print(data_row)
+
+    print(bottom_border)
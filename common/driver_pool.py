@@ -0,0 +1,152 @@
+# driver_pool.py
+# Pool of warm headless Chrome drivers for the scrapers that still need a real browser
+# The chromedriver binary is resolved once per process, drivers are reused across pages
+# instead of launched and quit per team, waits use explicit conditions instead of fixed
+# sleeps, and every page load is timed.
+
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from webdriver_manager.chrome import ChromeDriverManager
+
+from common.http_client import USER_AGENT
+
+# XPath for a TeamRankings data table that has at least one data row
+TR_TABLE_ROWS = '//table[contains(@class, "tr-table")]//tr[td]'
+
+_driver_path = None
+_driver_path_lock = threading.Lock()
+
+
+def driver_path():
+    """Path to the chromedriver binary, downloaded/resolved only on the first call."""
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path is None:
+            _driver_path = ChromeDriverManager().install()
+        return _driver_path
+
+
+class DriverPool:
+    """Keeps up to `size` Chrome drivers alive and lends them out to workers."""
+
+    def __init__(self, size=4, headless=True, page_load_timeout=30):
+        self.size = size
+        self.headless = headless
+        self.page_load_timeout = page_load_timeout
+        self.timings = []  # (url, seconds) for every page fetched through the pool
+        self._idle = queue.Queue()
+        self._created = 0
+        self._lock = threading.Lock()
+        self._all = []
+
+    def _new_driver(self):
+        options = Options()
+        if self.headless:
+            options.add_argument("--headless=new")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument(f"--user-agent={USER_AGENT}")
+        driver = webdriver.Chrome(service=Service(driver_path()), options=options)
+        driver.set_page_load_timeout(self.page_load_timeout)
+        return driver
+
+    @contextmanager
+    def driver(self):
+        """Borrow a driver, starting a new one only while fewer than `size` exist."""
+        with self._lock:
+            create = self._idle.empty() and self._created < self.size
+            if create:
+                self._created += 1
+        if not create:
+            driver = self._idle.get()
+            # None is the slot of a discarded driver, handed on so its borrower starts a replacement
+            create = driver is None
+        if create:
+            try:
+                driver = self._new_driver()
+            except Exception:
+                # Pass the slot on so a waiting worker retries instead of blocking forever
+                self._idle.put(None)
+                raise
+            with self._lock:
+                self._all.append(driver)
+
+        try:
+            yield driver
+        except BaseException:
+            # The browser may be crashed, hung or mid-page, so it is replaced rather than handed on
+            self._discard(driver)
+            raise
+        else:
+            self._idle.put(driver)
+
+    def _discard(self, driver):
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+        with self._lock:
+            if driver in self._all:
+                self._all.remove(driver)
+        # Keep the slot and wake a worker waiting in driver() to start the replacement
+        self._idle.put(None)
+
+    def fetch(self, url, wait_xpath=TR_TABLE_ROWS, timeout=20):
+        """Load url in a pooled driver, wait for wait_xpath to be present, and return the page source."""
+        with self.driver() as driver:
+            start = time.perf_counter()
+            driver.get(url)
+            if wait_xpath:
+                try:
+                    WebDriverWait(driver, timeout).until(EC.presence_of_element_located((By.XPATH, wait_xpath)))
+                except TimeoutException:
+                    print(f"Timed out after {timeout}s waiting for {wait_xpath} on {url}")
+            html = driver.page_source
+            elapsed = time.perf_counter() - start
+        self.timings.append((url, elapsed))
+        print(f"Loaded {url} in {elapsed:.2f}s")
+        return html
+
+    def map(self, fn, items):
+        """Run fn(item) for every item on `size` worker threads sharing the pool; results keep item order."""
+        with ThreadPoolExecutor(max_workers=self.size) as pool:
+            return list(pool.map(fn, items))
+
+    def report(self):
+        """Print page count and load-time summary."""
+        if not self.timings:
+            return
+        seconds = sorted(t for _, t in self.timings)
+        print(f"{len(seconds)} pages with {self._created} browser(s): "
+              f"median {seconds[len(seconds) // 2]:.2f}s, max {seconds[-1]:.2f}s, total {sum(seconds):.1f}s")
+
+    def close(self):
+        """Quit every driver the pool started."""
+        with self._lock:
+            drivers, self._all = self._all, []
+            self._created = 0
+        for driver in drivers:
+            try:
+                driver.quit()
+            except WebDriverException:
+                pass
+        self._idle = queue.Queue()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.report()
+        self.close()
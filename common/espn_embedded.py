@@ -0,0 +1,138 @@
+# espn_embedded.py
+# Reads the structured data ESPN embeds in its player pages instead of the rendered tables
+# Every www.espn.com page ships its state as `window['__espnfitt__'] = {...};` (see misc/espn api notes).
+# The splits page carries `"tbl": [{"dspNm": ..., "row": [[split, stat, ...], ...]}]` and the gamelog
+# page carries per-event metadata plus per-event stat lists. Decoding that JSON is much cheaper than
+# walking the DOM, and rows are keyed by split name / event id instead of being paired by position.
+# Each function returns None when the payload is missing or shaped differently, so callers can
+# fall back to HTML parsing.
+
+import json
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+FITT_MARKER = "window['__espnfitt__']"
+
+# ESPN displays game dates in US Eastern time
+ESPN_TZ = ZoneInfo("America/New_York")
+
+_decoder = json.JSONDecoder()
+
+
+def extract_fitt(html):
+    """Decode the window['__espnfitt__'] blob from a page, or None if it isn't there."""
+    start = html.find(FITT_MARKER)
+    if start == -1:
+        return None
+    brace = html.find("{", start + len(FITT_MARKER))
+    if brace == -1:
+        return None
+    try:
+        data, _ = _decoder.raw_decode(html, brace)
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def iter_key(obj, key):
+    """Yield every value stored under `key` anywhere in a decoded JSON tree."""
+    stack = [obj]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            for k, v in node.items():
+                if k == key:
+                    yield v
+                if isinstance(v, (dict, list)):
+                    stack.append(v)
+        elif isinstance(node, list):
+            stack.extend(item for item in node if isinstance(item, (dict, list)))
+
+
+def splits_from_fitt(data, stat_count):
+    """Map split name -> stats (padded/capped to stat_count) from the embedded "tbl" payload."""
+    for tbl in iter_key(data, "tbl"):
+        if not isinstance(tbl, list) or not all(isinstance(t, dict) and "row" in t for t in tbl):
+            continue
+        by_split = {}
+        for category in tbl:
+            for row in category.get("row") or []:
+                if not isinstance(row, list) or len(row) < 2 or not isinstance(row[0], str):
+                    continue
+                stats = [str(value).strip() for value in row[1:stat_count + 1]]
+                by_split[row[0].strip()] = stats + ["N/A"] * (stat_count - len(stats))
+        if by_split:
+            return by_split
+    return None
+
+
+def _first(obj, *keys):
+    """First present key among alternatives (ESPN uses both long and abbreviated names)."""
+    for key in keys:
+        if isinstance(obj, dict) and obj.get(key) is not None:
+            return obj[key]
+    return None
+
+
+def _display_date(value):
+    """ISO timestamp -> ESPN's table format, e.g. "2025-03-10T00:00Z" -> "Sun 3/9"."""
+    try:
+        when = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if when.tzinfo is not None:
+        when = when.astimezone(ESPN_TZ)
+    return f"{when:%a} {when.month}/{when.day}"
+
+
+def gamelog_from_fitt(data, stat_labels):
+    """Rows of [DATE, OPP, RESULT] + stats (ordered as stat_labels), newest first, from the embedded game log.
+
+    Expects an "events" mapping of event id -> game metadata (date, home/away, opponent, result, score)
+    and per-event stat lists ({"eventId": ..., "stats": [...]}) alongside a "labels" list.
+    """
+    events = next((e for e in iter_key(data, "events") if isinstance(e, dict) and e), None)
+    if events is None:
+        return None
+
+    labels = next((l for l in iter_key(data, "labels") if isinstance(l, list) and l), None)
+    if labels:
+        positions = [labels.index(label) if label in labels else None for label in stat_labels]
+    else:
+        positions = list(range(len(stat_labels)))
+
+    stats_by_event = {}
+    for event_list in iter_key(data, "events"):
+        if not isinstance(event_list, list):
+            continue
+        for entry in event_list:
+            event_id = _first(entry, "eventId", "id")
+            stats = _first(entry, "stats")
+            if event_id is not None and isinstance(stats, list):
+                stats_by_event[str(event_id)] = stats
+    if not stats_by_event:
+        return None
+
+    games = []
+    for event_id, stats in stats_by_event.items():
+        meta = events.get(event_id)
+        if not isinstance(meta, dict):
+            continue
+        when = _first(meta, "gameDate", "dt", "date")
+        date = _display_date(when)
+        opponent = _first(_first(meta, "opponent", "opp") or {}, "abbreviation", "abbr")
+        result = _first(meta, "gameResult", "res")
+        if isinstance(result, dict):
+            score = _first(result, "score")
+            result = _first(result, "abbreviation", "abbr")
+        else:
+            score = _first(meta, "score")
+        if date is None or opponent is None or result is None:
+            return None
+
+        opp = f"{_first(meta, 'atVs') or ''}{opponent}"
+        row_stats = [str(stats[p]) if p is not None and p < len(stats) else "N/A" for p in positions]
+        games.append((str(when), [date, opp, f"{result}{score or ''}"] + row_stats))
+
+    games.sort(key=lambda game: game[0], reverse=True)
+    return [row for _, row in games] or None
@@ -0,0 +1,225 @@
+# espn_gamelog.py
+# Fetches ESPN player game logs and saves them as <player>_gamelog.csv
+# Replaces the per-player *_gamelog.py scripts that nba_player_gamelog.py used to generate:
+# every page is requested concurrently with asyncio/aiohttp, capped by a concurrency limit,
+# paced per host and retried with backoff, then parsed with the same table-extraction logic.
+# Parsed logs are also written to the typed Parquet store in common/gamelog_store.py.
+
+import asyncio
+import csv
+import os
+import sys
+import time
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from common import http_client
+from common.console import print_excel_style
+from common.espn_embedded import extract_fitt, gamelog_from_fitt
+from common.espn_splits import player_folder_name, player_slug, read_team_rosters
+from common.html_tables import extract_tables
+from common.paths import ESPN_TEAMS_DIR, GAMELOG_STORE_DIR
+
+GAMELOG_URL = "https://www.espn.com/nba/player/gamelog/_/id/{player_id}/{slug}"
+
+EXPECTED_HEADERS = ["DATE", "OPP", "RESULT", "MIN", "FG", "FG%", "3PT", "3P%", "FT", "FT%", "REB", "AST", "BLK", "STL", "PF", "TO", "PTS"]
+
+WEEKDAYS = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+
+# Status codes worth retrying; anything else is treated as a final answer
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+def parse_gamelog(html, backend=None):
+    """Parse a gamelog page into rows matching EXPECTED_HEADERS, or None if no game log was found.
+
+    Reads ESPN's embedded JSON when present and falls back to the rendered tables.
+    """
+    game_data = gamelog_from_fitt(extract_fitt(html) or {}, EXPECTED_HEADERS[3:])
+    if game_data:
+        return game_data
+    return parse_gamelog_html(html, backend)
+
+
+def parse_gamelog_html(html, backend=None):
+    """Parse the rendered gamelog tables into rows matching EXPECTED_HEADERS, or None if no tables were found.
+
+    backend picks the HTML parser (see common.html_tables); the fastest installed one by default.
+    """
+    tables = extract_tables(html, table_class="Table", backend=backend)
+    if not tables:
+        return None
+
+    stat_count = len(EXPECTED_HEADERS) - 3  # Subtract DATE, OPP, RESULT
+    game_data = []
+    for table in tables:
+        for cells in table[1:]:  # Skip header row
+            if len(cells) < 3:
+                continue
+
+            date = cells[0]
+            # Skip month summary rows (e.g., "march") which have no weekday
+            if not any(day in date.lower() for day in WEEKDAYS):
+                continue
+
+            stats = cells[3:]
+            if len(stats) < stat_count:
+                stats.extend(["N/A"] * (stat_count - len(stats)))
+            game_data.append([date, cells[1], cells[2]] + stats[:stat_count])
+
+    return game_data
+
+
+def save_gamelog(game_data, team, player_name, base_dir=ESPN_TEAMS_DIR):
+    """Write a player's game log to nba_teams/<team>/<player>/<player>_gamelog.csv."""
+    player_dir = player_folder_name(player_name)
+    player_folder = os.path.join(base_dir, team, player_dir)
+    os.makedirs(player_folder, exist_ok=True)
+
+    csv_filename = os.path.join(player_folder, f"{player_dir}_gamelog.csv")
+    with open(csv_filename, mode="w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(EXPECTED_HEADERS)
+        writer.writerows(game_data)
+    return csv_filename
+
+
+class HostPacer:
+    """Spaces out request starts to the same host by at least min_interval seconds."""
+
+    def __init__(self, min_interval):
+        self.min_interval = min_interval
+        self._next_slot = {}
+
+    async def wait(self, host):
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        # Reserve the next free slot before sleeping so concurrent callers queue up behind it
+        slot = max(now, self._next_slot.get(host, now))
+        self._next_slot[host] = slot + self.min_interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+async def fetch_text(session, url, semaphore, pacer, retries=3, backoff=1.0):
+    """GET a page under the concurrency limit, retrying transient failures with exponential backoff.
+
+    Returns (status, text); status is None when every attempt raised a network error.
+    """
+    host = urlsplit(url).netloc
+    status = None
+    for attempt in range(retries + 1):
+        delay = backoff * (2 ** attempt)
+        async with semaphore:
+            await pacer.wait(host)
+            try:
+                async with session.get(url) as response:
+                    status = response.status
+                    if status not in RETRY_STATUSES:
+                        return status, await response.text()
+                    retry_after = response.headers.get("Retry-After", "")
+                    if retry_after.isdigit():
+                        delay = max(delay, int(retry_after))
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                status = None
+                print(f"Request failed for {url} (attempt {attempt + 1}): {e}")
+        if attempt < retries:
+            await asyncio.sleep(delay)
+    return status, None
+
+
+async def collect_gamelogs_async(players, concurrency=16, min_interval=0.05, retries=3, backoff=1.0, timeout=30):
+    """Fetch and parse game logs for (player_id, slug) pairs concurrently.
+
+    Returns {(player_id, slug): rows or None} in the same order as players.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    pacer = HostPacer(min_interval)
+
+    async def collect_one(session, player_id, slug):
+        url = GAMELOG_URL.format(player_id=player_id, slug=slug)
+        status, html = await fetch_text(session, url, semaphore, pacer, retries, backoff)
+        if status != 200 or html is None:
+            print(f"Error: Unable to fetch game log for {slug} (ID: {player_id}) - Status Code {status}")
+            return None
+        game_data = parse_gamelog(html)
+        if not game_data:
+            print(f"No game log data found for {slug} (ID: {player_id}).")
+        return game_data
+
+    async with http_client.async_session(concurrency, timeout) as session:
+        results = await asyncio.gather(*(collect_one(session, player_id, slug) for player_id, slug in players))
+
+    return dict(zip(players, results))
+
+
+def collect_gamelogs(players, **kwargs):
+    """Blocking wrapper around collect_gamelogs_async for scripts."""
+    return asyncio.run(collect_gamelogs_async(players, **kwargs))
+
+
+def fetch_gamelog(player_id, slug):
+    """Fetch and parse one player's game log. Returns (headers, rows) or (None, None)."""
+    game_data = collect_gamelogs([(player_id, slug)], concurrency=1)[(player_id, slug)]
+    if not game_data:
+        return None, None
+    return EXPECTED_HEADERS, game_data
+
+
+def refresh_all_gamelogs(team_rosters=None, base_dir=ESPN_TEAMS_DIR, concurrency=16, min_interval=0.05,
+                         store_dir=GAMELOG_STORE_DIR, season=None):
+    """Fetch every rostered player's game log concurrently, save each to CSV and rebuild the Parquet store.
+
+    team_rosters is the {team: [{"name", "id"}]} dict from fetch_team_rosters();
+    when omitted the roster CSVs already saved under base_dir are used.
+    The season/team partitions in store_dir (see common.gamelog_store) are rewritten for every
+    team with at least one game log; pass store_dir=None to only write CSVs.
+    Returns the number of players whose game logs were saved.
+    """
+    # Imported here: gamelog_store reads EXPECTED_HEADERS from this module
+    from common.gamelog_store import current_season, schedule_sides, typed_gamelog, write_team_season
+
+    if team_rosters is None:
+        team_rosters = read_team_rosters(base_dir)
+
+    players = {}
+    for team, roster in team_rosters.items():
+        for player in roster:
+            players[(player["id"], player_slug(player["name"]))] = (team, player["name"])
+
+    start = time.perf_counter()
+    results = collect_gamelogs(list(players), concurrency=concurrency, min_interval=min_interval)
+
+    season = season or current_season()
+    sides = schedule_sides(season)
+    saved = 0
+    team_frames = {}
+    for key, game_data in results.items():
+        if not game_data:
+            continue
+        team, player_name = players[key]
+        save_gamelog(game_data, team, player_name, base_dir)
+        team_frames.setdefault(team, []).append(typed_gamelog(game_data, season, player_name, key[0], sides))
+        saved += 1
+
+    if store_dir:
+        for team, frames in team_frames.items():
+            write_team_season(frames, season, team, store_dir)
+
+    print(f"Saved game logs for {saved}/{len(players)} players in {time.perf_counter() - start:.1f}s")
+    return saved
+
+
+def main():
+    # python -m common.espn_gamelog                  -> refresh every roster
+    # python -m common.espn_gamelog 4594268 anthony-edwards -> print one player
+    if len(sys.argv) == 3:
+        headers, data = fetch_gamelog(sys.argv[1], sys.argv[2])
+        print_excel_style(headers, data)
+    else:
+        refresh_all_gamelogs()
+
+
+if __name__ == "__main__":
+    main()
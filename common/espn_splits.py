@@ -0,0 +1,181 @@
+# espn_splits.py
+# Fetches ESPN player splits pages and saves them as <player>_splits.csv
+# Replaces the per-player *_splits.py scripts that nba_roster_and_split_update.py used to generate,
+# so a league-wide refresh runs in one process over the shared pooled session
+
+import csv
+import os
+import sys
+import time
+
+import requests
+
+from common.console import print_excel_style
+from common.espn_embedded import extract_fitt, splits_from_fitt
+from common.html_tables import extract_tables
+from common.http_cache import cached_get
+from common.paths import ESPN_TEAMS_DIR
+
+SPLITS_URL = "https://www.espn.com/nba/player/splits/_/id/{player_id}/{slug}"
+
+EXPECTED_HEADERS = ["SPLIT", "GP", "MIN", "FG", "FG%", "3PT", "3P%", "FT", "FT%", "OR", "DR", "REB", "AST", "BLK", "STL", "PF", "TO", "PTS"]
+
+PRESET_SPLITS = [
+    "All Splits", "Home", "Road", "vs. Division", "vs. Conference", "3+ Days Rest",
+    "October", "November", "December", "January", "February", "March",
+    "Pre All-Star", "Post All-Star", "Wins", "Losses",
+    "As Starter", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday",
+    "vs ATL", "vs BOS", "vs CHA", "vs CHI", "vs CLE", "vs DAL", "vs DEN", "vs DET", "vs GS", "vs HOU",
+    "vs LAC", "vs LAL", "vs MEM", "vs MIA", "vs MIL", "vs NO", "vs NY", "vs ORL", "vs PHI", "vs PHO",
+    "vs POR", "vs SA", "vs SAC", "vs OKC", "vs TOR", "vs UTA", "vs WAS"
+]
+
+DEFAULT_STATS = ["0", "0.0", "0.0-0.0", "0.0", "0.0-0.0", "0.0", "0.0-0.0", "0.0", "0.0", "0.0", "0.0", "0.0", "0.0", "0.0", "0.0", "0.0", "0.0"]
+
+
+def player_slug(player_name):
+    """ESPN URL slug for a player name (e.g., "Anthony Edwards" -> "anthony-edwards")."""
+    return player_name.lower().replace(" ", "-")
+
+
+def player_folder_name(player_name):
+    """Folder/file prefix for a player name (e.g., "Anthony Edwards" -> "anthony_edwards")."""
+    return player_name.lower().replace(" ", "_")
+
+
+def parse_splits(html, backend=None):
+    """Parse a splits page into one row per preset split, or None if no splits data was found.
+
+    Reads ESPN's embedded JSON when present and falls back to the rendered tables.
+    """
+    by_split = splits_from_fitt(extract_fitt(html) or {}, len(EXPECTED_HEADERS) - 1)
+    if by_split:
+        return [[split] + by_split.get(split, DEFAULT_STATS.copy()) for split in PRESET_SPLITS]
+    return parse_splits_html(html, backend)
+
+
+def parse_splits_html(html, backend=None):
+    """Parse the rendered splits tables into one row per preset split, or None if the page has no tables.
+
+    backend picks the HTML parser (see common.html_tables); the fastest installed one by default.
+    """
+    tables = extract_tables(html, backend=backend)
+    if not tables:
+        return None
+
+    player_data_dict = {split: DEFAULT_STATS.copy() for split in PRESET_SPLITS}
+
+    # ESPN renders split names and their stats in separate tables, paired by position
+    splits = []
+    stats_rows = []
+    for table in tables:
+        for cells in table[1:]:  # Skip header row
+            row_data = [text for text in cells if text]
+            if not row_data:
+                continue
+            if len(row_data) == 1 and row_data[0] in PRESET_SPLITS:
+                splits.append(row_data[0])
+            elif len(row_data) > 1 and row_data[0].isdigit():
+                stats_rows.append(row_data)
+
+    stat_count = len(EXPECTED_HEADERS) - 1
+    for idx, split in enumerate(splits):
+        if idx < len(stats_rows):
+            stats = stats_rows[idx][:stat_count]
+            player_data_dict[split] = stats + ["N/A"] * (stat_count - len(stats))
+
+    return [[split] + player_data_dict[split] for split in PRESET_SPLITS]
+
+
+def fetch_splits(player_id, slug):
+    """Fetch and parse one player's splits page. Returns (headers, rows) or (None, None)."""
+    url = SPLITS_URL.format(player_id=player_id, slug=slug)
+    try:
+        # ttl=0: always revalidate, but let ESPN answer 304 when the page hasn't changed
+        response = cached_get(url, ttl=0)
+    except requests.RequestException as e:
+        print(f"Error: Unable to fetch splits for {slug} (ID: {player_id}) - {e}")
+        return None, None
+
+    if response.status_code != 200:
+        print(f"Error: Unable to fetch splits for {slug} (ID: {player_id}) - Status Code {response.status_code}")
+        return None, None
+
+    player_data = parse_splits(response.text)
+    if not player_data:
+        print(f"No stats tables found for {slug}. The page structure may have changed.")
+        return None, None
+
+    return EXPECTED_HEADERS, player_data
+
+
+def save_splits(player_data, team, player_name, base_dir=ESPN_TEAMS_DIR):
+    """Write a player's splits to nba_teams/<team>/<player>/<player>_splits.csv."""
+    player_dir = player_folder_name(player_name)
+    player_folder = os.path.join(base_dir, team, player_dir)
+    os.makedirs(player_folder, exist_ok=True)
+
+    csv_filename = os.path.join(player_folder, f"{player_dir}_splits.csv")
+    with open(csv_filename, mode="w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(EXPECTED_HEADERS)
+        writer.writerows(player_data)
+    return csv_filename
+
+
+def read_team_rosters(base_dir=ESPN_TEAMS_DIR):
+    """Read every nba_teams/<team>/<team>_roster.csv into {team: [{"name", "id"}]}."""
+    team_rosters = {}
+    if not os.path.isdir(base_dir):
+        return team_rosters
+
+    for team in sorted(os.listdir(base_dir)):
+        roster_csv = os.path.join(base_dir, team, f"{team}_roster.csv")
+        if not os.path.exists(roster_csv):
+            continue
+        with open(roster_csv, mode="r", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            next(reader, None)  # Skip header ("Player Name", "Player ID")
+            team_rosters[team] = [{"name": row[0], "id": row[1]} for row in reader if len(row) == 2]
+    return team_rosters
+
+
+def refresh_all_splits(team_rosters=None, base_dir=ESPN_TEAMS_DIR):
+    """Fetch and save splits for every rostered player in a single process.
+
+    team_rosters is the {team: [{"name", "id"}]} dict from fetch_team_rosters();
+    when omitted the roster CSVs already saved under base_dir are used.
+    Returns the number of players whose splits were saved.
+    """
+    if team_rosters is None:
+        team_rosters = read_team_rosters(base_dir)
+
+    total = sum(len(players) for players in team_rosters.values())
+    saved = 0
+    start = time.perf_counter()
+
+    for team, players in team_rosters.items():
+        for player in players:
+            headers, player_data = fetch_splits(player["id"], player_slug(player["name"]))
+            if not player_data:
+                continue
+            save_splits(player_data, team, player["name"], base_dir)
+            saved += 1
+        print(f"Updated splits for {team}: {saved}/{total} players so far")
+
+    print(f"Saved splits for {saved}/{total} players in {time.perf_counter() - start:.1f}s")
+    return saved
+
+
+def main():
+    # python -m common.espn_splits                 -> refresh every roster
+    # python -m common.espn_splits 4594268 anthony-edwards -> print one player
+    if len(sys.argv) == 3:
+        headers, data = fetch_splits(sys.argv[1], sys.argv[2])
+        print_excel_style(headers, data)
+    else:
+        refresh_all_splits()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+# form_engine.py
+# Recent-form features per player and game from the Parquet game-log store
+# For every player and game: last-3/5/10-game means and variances plus EWMAs of PTS, REB, AST,
+# MIN and FG%, describing form *through* that game (use a game's row to predict the next one).
+# Window sums are differences of one cumulative sum over the player-sorted table (sum over the
+# last N = cumsum - cumsum N rows back), so the whole league is a handful of vectorized passes. update_form() extends an existing
+# feature table with new games using only each player's last few stored games and last EWMA values.
+
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from common.gamelog_store import current_season, load_gamelogs
+from common.paths import FORM_FEATURES_DIR, GAMELOG_STORE_DIR
+
+STATS = ["pts", "reb", "ast", "min", "fg_pct"]
+WINDOWS = [3, 5, 10]
+EWM_SPANS = [5, 10]
+
+KEYS = ["player_id", "player", "team", "date"]
+
+
+def feature_columns():
+    """Names of the feature columns, in output order."""
+    columns = []
+    for stat in STATS:
+        for n in WINDOWS:
+            columns += [f"{stat}_l{n}_mean", f"{stat}_l{n}_var"]
+        columns += [f"{stat}_ewm{span}" for span in EWM_SPANS]
+    return columns
+
+
+def _prepare(games):
+    """Drop DNPs and sort by player and date so per-player cumulative sums line up."""
+    games = games.dropna(subset=["date", "min"])
+    return games.sort_values(["player_id", "date"], kind="stable").reset_index(drop=True)
+
+
+def _group_starts(player_ids):
+    """Index of each row's first game, for rows already sorted by player."""
+    ids = player_ids.to_numpy()
+    index = np.arange(len(ids))
+    change = np.ones(len(ids), dtype=bool)
+    change[1:] = ids[1:] != ids[:-1]
+    return np.maximum.accumulate(np.where(change, index, 0))
+
+
+def _window_sum(values, starts, n):
+    """Sum of each player's last n values (up to and including the current row).
+
+    One cumulative sum over the whole table; a window is the difference of two of its
+    entries, clamped so it never reaches back past the player's first game.
+    """
+    cumsum = np.concatenate([[0.0], np.cumsum(values)])
+    index = np.arange(len(values))
+    return cumsum[index + 1] - cumsum[np.maximum(index + 1 - n, starts)]
+
+
+def _rolling(games):
+    """Windowed means and sample variances for every stat and window."""
+    starts = _group_starts(games["player_id"])
+    made = games["fgm"].to_numpy(dtype="float64", na_value=np.nan)
+    attempted = games["fga"].to_numpy(dtype="float64", na_value=np.nan)
+    out = {}
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for stat in STATS:
+            values = games[stat].to_numpy(dtype="float64", na_value=np.nan)
+            valid = ~np.isnan(values)
+            x = np.where(valid, values, 0.0)
+            for n in WINDOWS:
+                count = _window_sum(valid.astype("float64"), starts, n)
+                total = _window_sum(x, starts, n)
+                squares = _window_sum(x * x, starts, n)
+                mean = np.where(count > 0, total / count, np.nan)
+                if stat == "fg_pct":
+                    # Shooting over the window is made / attempted, not the average of per-game percentages
+                    shots = _window_sum(np.nan_to_num(attempted), starts, n)
+                    mean = np.where(shots > 0, _window_sum(np.nan_to_num(made), starts, n) / shots * 100, np.nan)
+                variance = np.where(count > 1, (squares - total * total / count) / (count - 1), np.nan)
+                out[f"{stat}_l{n}_mean"] = mean
+                out[f"{stat}_l{n}_var"] = np.clip(variance, 0, None)
+    return out
+
+
+def _ewm(values, player_ids, span, seed=None):
+    """Per-player EWMA (adjust=False, so each value only depends on the previous EWMA).
+
+    seed maps player_id -> the EWMA before the first row, for continuing an existing series.
+    """
+    frame = pd.DataFrame({"player_id": player_ids.to_numpy(), "value": values.to_numpy()})
+    if seed is not None:
+        # With adjust=False the first value starts the average, so a seed row continues it exactly
+        seed = seed.dropna()
+        frame = pd.concat([pd.DataFrame({"player_id": seed.index, "value": seed.to_numpy()}), frame], ignore_index=True)
+    smoothed = (frame.groupby("player_id", sort=False)["value"]
+                .ewm(span=span, adjust=False, ignore_na=True).mean()
+                .reset_index(level=0, drop=True).sort_index())
+    return pd.Series(smoothed.to_numpy()[len(frame) - len(values):], index=values.index)
+
+
+def compute_form(games):
+    """Form features for every game in a load_gamelogs() frame."""
+    games = _prepare(games)
+    features = games[KEYS].copy()
+    rolling = _rolling(games)
+    for stat in STATS:
+        for n in WINDOWS:
+            features[f"{stat}_l{n}_mean"] = rolling[f"{stat}_l{n}_mean"]
+            features[f"{stat}_l{n}_var"] = rolling[f"{stat}_l{n}_var"]
+        values = games[stat].astype("float64")
+        for span in EWM_SPANS:
+            features[f"{stat}_ewm{span}"] = _ewm(values, games["player_id"], span)
+    return features
+
+
+def update_form(features, history, new_games):
+    """Append features for new_games to an existing feature table.
+
+    history holds the games already covered by features (only each player's last max(WINDOWS)
+    games are used); the work done is proportional to the number of new games.
+    """
+    new_games = _prepare(new_games)
+    if new_games.empty:
+        return features
+
+    players = new_games["player_id"].unique()
+    tail = _prepare(history[history["player_id"].isin(players)]).groupby("player_id").tail(max(WINDOWS))
+    window = _prepare(pd.concat([tail.assign(new=False), new_games.assign(new=True)], ignore_index=True))
+    is_new = window["new"].to_numpy()
+
+    rolling = _rolling(window)
+    new_window = window[is_new].reset_index(drop=True)
+    added = new_window[KEYS].copy()
+    ewm_columns = [f"{stat}_ewm{span}" for stat in STATS for span in EWM_SPANS]
+    known = features[features["player_id"].isin(players)]
+    last = known.sort_values("date").groupby("player_id")[ewm_columns].last()
+    for stat in STATS:
+        for n in WINDOWS:
+            added[f"{stat}_l{n}_mean"] = rolling[f"{stat}_l{n}_mean"][is_new]
+            added[f"{stat}_l{n}_var"] = rolling[f"{stat}_l{n}_var"][is_new]
+        values = new_window[stat].astype("float64")
+        for span in EWM_SPANS:
+            seed = last[f"{stat}_ewm{span}"].reindex(players) if not last.empty else None
+            added[f"{stat}_ewm{span}"] = _ewm(values, new_window["player_id"], span, seed).to_numpy()
+
+    return pd.concat([features, added], ignore_index=True)
+
+
+def form_path(season, form_dir=FORM_FEATURES_DIR):
+    """Parquet file holding one season's form features."""
+    return os.path.join(form_dir, f"form_{season}.parquet")
+
+
+def load_form(season=None, form_dir=FORM_FEATURES_DIR):
+    """Saved form features for a season (empty frame if none have been built)."""
+    path = form_path(season or current_season(), form_dir)
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=KEYS + feature_columns())
+    return pd.read_parquet(path)
+
+
+def refresh_form(season=None, store_dir=GAMELOG_STORE_DIR, form_dir=FORM_FEATURES_DIR, full=False):
+    """Bring the saved form features up to date with the game-log store. Returns the feature table.
+
+    Only games newer than each player's latest feature row are processed unless full=True.
+    """
+    season = season or current_season()
+    start = time.perf_counter()
+    games = load_gamelogs(season, store_dir=store_dir)
+    path = form_path(season, form_dir)
+
+    if full or not os.path.exists(path):
+        features = compute_form(games)
+        added = len(features)
+    else:
+        features = pd.read_parquet(path)
+        latest = features.groupby("player_id")["date"].max()
+        seen = games["player_id"].map(latest)
+        is_new = seen.isna() | (games["date"] > seen)
+        features = update_form(features, games[~is_new], games[is_new])
+        added = int(is_new.sum())
+
+    os.makedirs(form_dir, exist_ok=True)
+    features.to_parquet(f"{path}.tmp", index=False)
+    os.replace(f"{path}.tmp", path)
+    print(f"Form features: {added} games processed, {len(features)} rows in {time.perf_counter() - start:.2f}s")
+    return features
+
+
+def main():
+    # python -m common.form_engine [season] [--full]
+    args = [arg for arg in sys.argv[1:] if arg != "--full"]
+    refresh_form(int(args[0]) if args else None, full="--full" in sys.argv)
+
+
+if __name__ == "__main__":
+    main()
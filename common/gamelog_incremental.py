@@ -0,0 +1,131 @@
+# gamelog_incremental.py
+# Nightly game-log refresh that only does work for games played since the last run
+# Each player's high-water mark is the latest game date already in the Parquet store
+# (common/gamelog_store.py). Players whose team hasn't played since their mark, according
+# to the league schedule ingested by nba/teamrankings/Schedule/create_schedule.py
+# (common/league_schedule.py, or the per-team TeamRankings CSVs with --teamrankings), are skipped
+# without a request; for the rest only rows newer than the mark are appended to the
+# store and the player's CSV.
+
+import csv
+import os
+import sys
+import time
+from datetime import date, datetime
+
+from common.espn_gamelog import collect_gamelogs, save_gamelog
+from common.espn_splits import player_folder_name, player_slug, read_team_rosters
+from common.gamelog_store import append_team_season, current_season, high_water_marks, schedule_sides, typed_gamelog
+from common.league_schedule import fetched_at, load_schedule, team_schedules
+from common.paths import ESPN_TEAMS_DIR, GAMELOG_STORE_DIR, SCHEDULE_DIR, TEAMRANKINGS_SCHEDULE_DIR
+from common.team_registry import teamrankings_slug
+from common.team_schedule import read_schedule
+
+
+def _saved_today(path):
+    return os.path.exists(path) and datetime.fromtimestamp(os.path.getmtime(path)).date() == date.today()
+
+
+def last_played_dates(teams, season, schedule_dir=TEAMRANKINGS_SCHEDULE_DIR, league_schedule_dir=SCHEDULE_DIR):
+    """Date of each team's latest completed game, from schedules saved today: {espn_team: date}.
+
+    The league schedule (common/league_schedule.py) is used when it was fully fetched today
+    (league_schedule.fetched_at; an ingest with failed requests doesn't count), otherwise the
+    per-team TeamRankings CSVs in schedule_dir. Every game counts, preseason included, since all
+    of them show up in the game logs. Teams whose schedule is missing or was not refreshed today
+    are left out, so their players are always fetched rather than skipped on stale information.
+    """
+    fetched = fetched_at("nba", season, league_schedule_dir)
+    if fetched is not None and fetched.date() == date.today():
+        views = team_schedules(load_schedule("nba", season, league_schedule_dir), slug="espn")
+        scheduled = set(views["team"])
+        played = views[views["played"].astype(bool)].groupby("team")["date"].max()
+        return {team: played.get(team, date.min) for team in teams if team in scheduled}
+
+    last_played = {}
+    for team in teams:
+        slug = teamrankings_slug(team)
+        schedule_csv = os.path.join(schedule_dir, f"{slug}_schedule_results.csv")
+        if not _saved_today(schedule_csv):
+            continue
+
+        schedule = read_schedule(slug, season, schedule_dir)
+        played = schedule.loc[schedule["played"], "date"]
+        last_played[team] = played.max() if not played.empty else date.min
+    return last_played
+
+
+def read_csv_rows(csv_path):
+    """Rows of an existing <player>_gamelog.csv, or [] if there isn't one."""
+    if not os.path.exists(csv_path):
+        return []
+    with open(csv_path, mode="r", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        next(reader, None)
+        return [row for row in reader]
+
+
+def refresh_incremental(team_rosters=None, base_dir=ESPN_TEAMS_DIR, store_dir=GAMELOG_STORE_DIR,
+                        schedule_dir=TEAMRANKINGS_SCHEDULE_DIR, season=None, concurrency=16,
+                        league_schedule_dir=SCHEDULE_DIR):
+    """Fetch game logs only for players whose team has played since their last stored game.
+
+    New games are appended to the player's CSV (kept newest first) and to the team's partition
+    in the Parquet store. Players with nothing stored yet are fetched and stored in full.
+    Returns the number of new games stored.
+    """
+    season = season or current_season()
+    if team_rosters is None:
+        team_rosters = read_team_rosters(base_dir)
+
+    marks = high_water_marks(season, store_dir)
+    last_played = last_played_dates(team_rosters, season, schedule_dir, league_schedule_dir)
+
+    players = {}
+    skipped = 0
+    for team, roster in team_rosters.items():
+        for player in roster:
+            mark = marks.get(player["id"])
+            if mark is not None and team in last_played and last_played[team] <= mark:
+                skipped += 1
+                continue
+            players[(player["id"], player_slug(player["name"]))] = (team, player["name"], mark)
+
+    start = time.perf_counter()
+    results = collect_gamelogs(list(players), concurrency=concurrency) if players else {}
+
+    sides = schedule_sides(season, league_schedule_dir) if results else None
+    new_games = 0
+    team_frames = {}
+    for key, game_data in results.items():
+        if not game_data:
+            continue
+        team, player_name, mark = players[key]
+        typed = typed_gamelog(game_data, season, player_name, key[0], sides)
+        is_new = (typed["date"] > mark).tolist() if mark is not None else [True] * len(typed)
+        if not any(is_new):
+            continue
+
+        new_rows = [row for row, new in zip(game_data, is_new) if new]
+        player_dir = player_folder_name(player_name)
+        old_rows = read_csv_rows(os.path.join(base_dir, team, player_dir, f"{player_dir}_gamelog.csv"))
+        save_gamelog(new_rows + old_rows, team, player_name, base_dir)
+        team_frames.setdefault(team, []).append(typed[is_new])
+        new_games += len(new_rows)
+
+    for team, frames in team_frames.items():
+        append_team_season(frames, season, team, store_dir)
+
+    total = skipped + len(players)
+    print(f"Skipped {skipped}/{total} players with no new games, fetched {len(players)}, "
+          f"stored {new_games} new games in {time.perf_counter() - start:.1f}s")
+    return new_games
+
+
+def main():
+    # python -m common.gamelog_incremental [season]
+    refresh_incremental(season=int(sys.argv[1]) if len(sys.argv) > 1 else None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+# gamelog_store.py
+# Typed, columnar game-log store (Parquet) built from the ESPN game logs
+# The per-player CSVs keep every value as display text ("10-15", "W141-124", "vsSA", "Sun 3/9"),
+# so league-wide analysis had to open and re-parse ~500 files. Here each game log is parsed once
+# into typed columns (made/attempted split, home/away, opponent, margin, real dates) and written
+# to one Parquet file per season and team:
+#   data/gamelogs/season=2025/team=minnesota-timberwolves/part-0.parquet
+# A full league season then loads with a single dataset scan, optionally reading only some
+# columns or teams.
+# The team partition is the player's roster team when the log was fetched, so a traded player's
+# earlier games sit under their new team. Each row also carries played_for (the team they actually
+# played that game for) and season_type (preseason, regular, postseason, play-in), both looked up
+# in the league schedule (common/league_schedule.py) by date and opponent; load_gamelogs() keeps
+# regular-season games unless asked otherwise.
+
+import os
+import sys
+import time
+from datetime import date
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from common.espn_gamelog import EXPECTED_HEADERS
+from common.espn_splits import player_folder_name, read_team_rosters
+from common.paths import ESPN_TEAMS_DIR, GAMELOG_STORE_DIR, SCHEDULE_DIR
+
+# Partition keys, stored in the directory names rather than the files
+PARTITIONING = ds.partitioning(pa.schema([("season", pa.int16()), ("team", pa.string())]), flavor="hive")
+
+# "10-15" columns split into made / attempted
+MADE_ATTEMPTED = {"FG": ("fgm", "fga"), "3PT": ("fg3m", "fg3a"), "FT": ("ftm", "fta")}
+
+# Plain numeric columns: CSV header -> store column
+NUMERIC = {
+    "MIN": "min", "FG%": "fg_pct", "3P%": "fg3_pct", "FT%": "ft_pct", "REB": "reb", "AST": "ast",
+    "BLK": "blk", "STL": "stl", "PF": "pf", "TO": "tov", "PTS": "pts",
+}
+
+SCHEMA = pa.schema([
+    ("player", pa.string()),
+    ("player_id", pa.string()),
+    ("date", pa.date32()),
+    ("season_type", pa.string()),
+    ("played_for", pa.string()),
+    ("home", pa.bool_()),
+    ("opponent", pa.string()),
+    ("win", pa.bool_()),
+    ("team_score", pa.int16()),
+    ("opp_score", pa.int16()),
+    ("margin", pa.int16()),
+    ("overtimes", pa.int8()),
+    ("min", pa.int16()),
+    ("fgm", pa.int16()), ("fga", pa.int16()), ("fg_pct", pa.float32()),
+    ("fg3m", pa.int16()), ("fg3a", pa.int16()), ("fg3_pct", pa.float32()),
+    ("ftm", pa.int16()), ("fta", pa.int16()), ("ft_pct", pa.float32()),
+    ("reb", pa.int16()), ("ast", pa.int16()), ("blk", pa.int16()), ("stl", pa.int16()),
+    ("pf", pa.int16()), ("tov", pa.int16()), ("pts", pa.int16()),
+])
+
+
+def season_for(day):
+    """NBA season a date belongs to, named by the year it ends in (2024-25 -> 2025)."""
+    return day.year + 1 if day.month >= 8 else day.year
+
+
+def current_season():
+    """Season in progress (or most recently finished) today."""
+    return season_for(date.today())
+
+
+def schedule_sides(season, schedule_dir=SCHEDULE_DIR):
+    """game_sides() of the saved league schedule for a season, ingesting it first if it isn't saved.
+
+    Empty (so rows stay untagged) when the schedule can't be fetched.
+    """
+    # Imported here: league_schedule reads current_season from this module
+    from common.league_schedule import game_sides, ingest_schedule, load_schedule
+
+    games = load_schedule("nba", season, schedule_dir)
+    if games.empty:
+        games = ingest_schedule("nba", season, schedule_dir=schedule_dir, season_types=None)
+    if games.empty:
+        print(f"No {season} league schedule; game-log rows are stored without season type or team played for")
+    return game_sides(games)
+
+
+def typed_gamelog(game_data, season, player, player_id=None, sides=None):
+    """Turn game-log rows (EXPECTED_HEADERS display strings) into a typed DataFrame matching SCHEMA.
+
+    ESPN shows dates without a year ("Sun 3/9"); August-December games are placed in the
+    season's first year and January-July games in its second. sides (from schedule_sides())
+    fills season_type and played_for; without it, or for games not in the schedule, they are null.
+    """
+    raw = pd.DataFrame(game_data, columns=EXPECTED_HEADERS)
+    df = pd.DataFrame({"player": player, "player_id": player_id}, index=raw.index)
+
+    month_day = raw["DATE"].str.extract(r"(\d{1,2})/(\d{1,2})").astype(float)
+    year = season - (month_day[0] >= 8)
+    df["date"] = pd.to_datetime(
+        pd.DataFrame({"year": year, "month": month_day[0], "day": month_day[1]}), errors="coerce"
+    ).dt.date
+
+    opp = raw["OPP"].str.extract(r"^(vs|@)\s*(\S+)$")
+    df["home"] = (opp[0] == "vs").where(opp[0].notna())
+    df["opponent"] = opp[1]
+
+    if sides is not None and not sides.empty:
+        tagged = df[["date", "opponent"]].merge(sides, on=["date", "opponent"], how="left")
+        df["season_type"] = tagged["season_type"].to_numpy()
+        df["played_for"] = tagged["team"].to_numpy()
+    else:
+        df["season_type"] = None
+        df["played_for"] = None
+
+    # The winner's score is listed first: "W141-124", "L111-102", "W131-128 OT", "L120-119 2OT"
+    result = raw["RESULT"].str.extract(r"^([WLT])\s*(\d+)-(\d+)\s*(?:(\d*)OT)?")
+    win = result[0] == "W"
+    high = pd.to_numeric(result[1], errors="coerce")
+    low = pd.to_numeric(result[2], errors="coerce")
+    df["win"] = win.where(result[0].notna())
+    df["team_score"] = high.where(win, low)
+    df["opp_score"] = low.where(win, high)
+    df["margin"] = df["team_score"] - df["opp_score"]
+    overtime = raw["RESULT"].str.contains("OT", regex=False)
+    df["overtimes"] = pd.to_numeric(result[3], errors="coerce").fillna(1).where(overtime, 0)
+
+    for header, (made_col, att_col) in MADE_ATTEMPTED.items():
+        pair = raw[header].str.extract(r"^(\d+)-(\d+)$")
+        df[made_col] = pd.to_numeric(pair[0], errors="coerce")
+        df[att_col] = pd.to_numeric(pair[1], errors="coerce")
+
+    for header, column in NUMERIC.items():
+        df[column] = pd.to_numeric(raw[header], errors="coerce")
+
+    return df[SCHEMA.names]
+
+
+def to_table(frames):
+    """Concatenate typed game-log frames into an Arrow table with SCHEMA."""
+    frames = [df for df in frames if df is not None and not df.empty]
+    if not frames:
+        return SCHEMA.empty_table()
+    return pa.Table.from_pandas(pd.concat(frames, ignore_index=True), schema=SCHEMA, preserve_index=False)
+
+
+def partition_path(season, team, store_dir=GAMELOG_STORE_DIR):
+    """Folder holding one season/team partition."""
+    return os.path.join(store_dir, f"season={season}", f"team={team}")
+
+
+def _write_part(table, folder, name):
+    os.makedirs(folder, exist_ok=True)
+    # pyarrow datasets skip names starting with "_", so a temp file left by a crash is never read
+    tmp_path = os.path.join(folder, f"_{name}.tmp")
+    pq.write_table(table.sort_by([("player", "ascending"), ("date", "ascending")]), tmp_path, compression="zstd")
+    os.replace(tmp_path, os.path.join(folder, name))
+
+
+def write_team_season(frames, season, team, store_dir=GAMELOG_STORE_DIR):
+    """Replace the season/team partition with the given typed frames. Returns the number of rows written."""
+    table = to_table(frames)
+    folder = partition_path(season, team, store_dir)
+    _write_part(table, folder, "part-0.parquet")
+    # Drop files left by earlier incremental appends; part-0 now holds everything
+    for name in os.listdir(folder):
+        if name.endswith(".parquet") and name != "part-0.parquet":
+            os.remove(os.path.join(folder, name))
+    return table.num_rows
+
+
+def append_team_season(frames, season, team, store_dir=GAMELOG_STORE_DIR):
+    """Add the given typed frames to a season/team partition as a new file. Returns the number of rows written."""
+    table = to_table(frames)
+    if table.num_rows == 0:
+        return 0
+    folder = partition_path(season, team, store_dir)
+    existing = os.listdir(folder) if os.path.isdir(folder) else []
+    _write_part(table, folder, f"part-{sum(name.endswith('.parquet') for name in existing)}.parquet")
+    return table.num_rows
+
+
+def read_gamelog_csv(csv_path):
+    """Rows of a saved <player>_gamelog.csv (without the header)."""
+    raw = pd.read_csv(csv_path, dtype=str, keep_default_na=False)
+    return raw.reindex(columns=EXPECTED_HEADERS, fill_value="N/A").values.tolist()
+
+
+def import_csvs(base_dir=ESPN_TEAMS_DIR, season=None, store_dir=GAMELOG_STORE_DIR):
+    """Load every nba_teams/<team>/<player>/<player>_gamelog.csv under base_dir into the store.
+
+    Player names and IDs come from the team roster CSVs when the player is listed there.
+    Returns the number of games written.
+    """
+    season = season or current_season()
+    rosters = read_team_rosters(base_dir)
+    sides = schedule_sides(season)
+    start = time.perf_counter()
+    total = 0
+
+    for team in sorted(os.listdir(base_dir)) if os.path.isdir(base_dir) else []:
+        team_dir = os.path.join(base_dir, team)
+        if not os.path.isdir(team_dir):
+            continue
+        known = {player_folder_name(p["name"]): p for p in rosters.get(team, [])}
+
+        frames = []
+        for folder in sorted(os.listdir(team_dir)):
+            csv_path = os.path.join(team_dir, folder, f"{folder}_gamelog.csv")
+            if not os.path.exists(csv_path):
+                continue
+            player = known.get(folder, {"name": folder.replace("_", " ").title(), "id": None})
+            frames.append(typed_gamelog(read_gamelog_csv(csv_path), season, player["name"], player["id"], sides))
+
+        if frames:
+            total += write_team_season(frames, season, team, store_dir)
+
+    print(f"Stored {total} games for season {season} in {time.perf_counter() - start:.2f}s")
+    return total
+
+
+def high_water_marks(season, store_dir=GAMELOG_STORE_DIR):
+    """Latest stored game date per player ID for a season: {player_id: date}."""
+    df = load_gamelogs(season, columns=["player_id", "date"], store_dir=store_dir, season_types=None)
+    df = df.dropna(subset=["player_id", "date"])
+    return df.groupby("player_id")["date"].max().to_dict()
+
+
+def load_gamelogs(season=None, teams=None, columns=None, store_dir=GAMELOG_STORE_DIR, season_types=("regular",)):
+    """Read the store into a DataFrame, optionally only one season, some teams and some columns.
+
+    season_types keeps games of those types (regular season by default; None keeps every game).
+    Rows whose type is unknown (the schedule wasn't available when they were stored) are kept.
+    """
+    if not os.path.isdir(store_dir):
+        return to_table([]).to_pandas()
+
+    dataset = ds.dataset(store_dir, format="parquet", partitioning=PARTITIONING)
+    condition = None
+    if season is not None:
+        condition = ds.field("season") == season
+    if teams:
+        team_filter = ds.field("team").isin(list(teams))
+        condition = team_filter if condition is None else condition & team_filter
+    if season_types is not None and "season_type" in dataset.schema.names:
+        type_filter = ds.field("season_type").isin(list(season_types)) | ds.field("season_type").is_null()
+        condition = type_filter if condition is None else condition & type_filter
+    return dataset.to_table(columns=columns, filter=condition).to_pandas()
+
+
+def main():
+    # python -m common.gamelog_store import [season]  -> rebuild the store from the CSVs
+    # python -m common.gamelog_store load [season]    -> load a season and print a summary
+    command = sys.argv[1] if len(sys.argv) > 1 else "import"
+    season = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    if command == "import":
+        import_csvs(season=season)
+    elif command == "load":
+        start = time.perf_counter()
+        df = load_gamelogs(season)
+        print(f"Loaded {len(df)} games ({df.memory_usage(deep=True).sum() / 1e6:.1f} MB) in {(time.perf_counter() - start) * 1000:.1f} ms")
+        print(df.head(10).to_string(index=False))
+    else:
+        print("Usage: python -m common.gamelog_store <import|load> [season]")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# html_tables.py
+# Pluggable HTML table extraction used by the ESPN splits and gamelog parsers
+# Backends: "selectolax" (fastest), "lxml" (precompiled XPath) and "bs4" (the original
+# BeautifulSoup html.parser walk). Every backend returns the same shape, with each
+# cell's text stripped exactly once, so parsers can switch backends freely.
+
+from bs4 import BeautifulSoup
+
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+except ImportError:
+    lxml_html = None
+
+# selectolax 1.0 dropped the Modest engine; the Lexbor one has the same css()/text() API
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser
+    except ImportError:
+        HTMLParser = None
+
+BACKENDS = ["selectolax", "lxml", "bs4"]
+
+if lxml_html is not None:
+    _XPATH_TABLES = etree.XPath("//table")
+    _XPATH_ROWS = etree.XPath(".//tr")
+    _XPATH_CELLS = etree.XPath(".//td")
+    _XPATH_CLASS_TABLES = {}
+
+
+def available_backends():
+    """Backends whose parser library is installed, fastest first."""
+    installed = {"selectolax": HTMLParser is not None, "lxml": lxml_html is not None, "bs4": True}
+    return [name for name in BACKENDS if installed[name]]
+
+
+def default_backend():
+    """Fastest installed backend."""
+    return available_backends()[0]
+
+
+def _bs4_tables(html, table_class):
+    soup = BeautifulSoup(html, "html.parser")
+    tables = soup.find_all("table", class_=table_class) if table_class else soup.find_all("table")
+    return [[[td.text.strip() for td in row.find_all("td")] for row in table.find_all("tr")] for table in tables]
+
+
+def _lxml_tables(html, table_class):
+    if not html.strip():
+        return []
+    doc = lxml_html.fromstring(html)
+    if table_class:
+        if table_class not in _XPATH_CLASS_TABLES:
+            _XPATH_CLASS_TABLES[table_class] = etree.XPath(
+                f"//table[contains(concat(' ', normalize-space(@class), ' '), ' {table_class} ')]"
+            )
+        tables = _XPATH_CLASS_TABLES[table_class](doc)
+    else:
+        tables = _XPATH_TABLES(doc)
+    return [[[td.text_content().strip() for td in _XPATH_CELLS(row)] for row in _XPATH_ROWS(table)] for table in tables]
+
+
+def _selectolax_tables(html, table_class):
+    tree = HTMLParser(html)
+    tables = tree.css(f"table.{table_class}" if table_class else "table")
+    return [[[td.text().strip() for td in row.css("td")] for row in table.css("tr")] for table in tables]
+
+
+_EXTRACTORS = {"bs4": _bs4_tables, "lxml": _lxml_tables, "selectolax": _selectolax_tables}
+
+
+def extract_tables(html, table_class=None, backend=None):
+    """Return every <table> (optionally only those with table_class) as rows of stripped <td> texts.
+
+    Each table is a list of rows and each row a list of cell strings; header rows
+    made only of <th> cells come back as empty lists, matching a find_all("td") walk.
+    """
+    backend = backend or default_backend()
+    if backend not in available_backends():
+        raise ValueError(f"Parser backend {backend!r} is not installed (available: {available_backends()})")
+    return _EXTRACTORS[backend](html, table_class)
@@ -0,0 +1,156 @@
+# http_cache.py
+# On-disk conditional-GET cache for the ESPN endpoints
+# Responses are stored per URL with their ETag/Last-Modified validators. Inside the TTL the
+# stored copy is returned without a request; after it a conditional GET is sent, so an
+# unchanged page costs a 304 instead of a full download. Total size is capped with LRU eviction.
+
+import os
+import sqlite3
+import threading
+import time
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from common import http_client
+from common.paths import HTTP_CACHE_PATH
+
+# Rosters rarely change, so by default trust a stored copy for an hour before revalidating
+DEFAULT_TTL = 60 * 60
+
+# Upper bound on stored response bodies; least recently used entries are dropped past this
+MAX_BYTES = 256 * 1024 * 1024
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    content_type TEXT,
+    encoding TEXT,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+"""
+
+
+def _cached_response(url, row):
+    """Build a requests.Response from a stored row so callers can use .status_code/.json()/.text."""
+    response = requests.Response()
+    response.url = url
+    response.status_code = 200
+    response._content = row["body"]
+    response.headers = CaseInsensitiveDict({"Content-Type": row["content_type"] or ""})
+    if row["etag"]:
+        response.headers["ETag"] = row["etag"]
+    if row["last_modified"]:
+        response.headers["Last-Modified"] = row["last_modified"]
+    response.encoding = row["encoding"]
+    return response
+
+
+class HttpCache:
+    """SQLite-backed URL -> response cache with validators, TTL and size-bounded LRU eviction."""
+
+    def __init__(self, path=HTTP_CACHE_PATH, max_bytes=MAX_BYTES, default_ttl=DEFAULT_TTL):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript(SCHEMA)
+
+    def get(self, url, ttl=None, **kwargs):
+        """GET url through the cache.
+
+        The returned response has .from_cache set: True when the body came from disk
+        (fresh within ttl, or revalidated with a 304), False when it was downloaded.
+        """
+        ttl = self.default_ttl if ttl is None else ttl
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM responses WHERE url = ?", (url,)).fetchone()
+
+        if row is not None and now - row["fetched_at"] < ttl:
+            self._touch(url, now)
+            response = _cached_response(url, row)
+            response.from_cache = True
+            return response
+
+        headers = dict(kwargs.pop("headers", None) or {})
+        if row is not None:
+            if row["etag"]:
+                headers["If-None-Match"] = row["etag"]
+            if row["last_modified"]:
+                headers["If-Modified-Since"] = row["last_modified"]
+
+        response = http_client.get(url, headers=headers, **kwargs)
+
+        if response.status_code == 304 and row is not None:
+            with self._lock:
+                self._conn.execute("UPDATE responses SET fetched_at = ?, accessed_at = ? WHERE url = ?", (now, now, url))
+                self._conn.commit()
+            response = _cached_response(url, row)
+            response.from_cache = True
+            return response
+
+        if response.status_code == 200:
+            self._store(url, response, now)
+        response.from_cache = False
+        return response
+
+    def _touch(self, url, now):
+        with self._lock:
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE url = ?", (now, url))
+            self._conn.commit()
+
+    def _store(self, url, response, now):
+        body = response.content
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, response.headers.get("ETag"), response.headers.get("Last-Modified"),
+                 response.headers.get("Content-Type"), response.encoding, body, len(body), now, now),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        """Drop least recently used entries until the stored bodies fit in max_bytes."""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for row in self._conn.execute("SELECT url, size FROM responses ORDER BY accessed_at").fetchall():
+            self._conn.execute("DELETE FROM responses WHERE url = ?", (row["url"],))
+            total -= row["size"]
+            if total <= self.max_bytes:
+                break
+
+    def clear(self):
+        """Remove every stored response."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache():
+    """Return the process-wide cache, opening it on first use."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = HttpCache()
+        return _cache
+
+
+def cached_get(url, ttl=None, **kwargs):
+    """GET through the shared on-disk cache (see HttpCache.get)."""
+    return get_cache().get(url, ttl=ttl, **kwargs)
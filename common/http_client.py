@@ -0,0 +1,75 @@
+# http_client.py
+# One pooled, keep-alive HTTP session shared by every ESPN and TeamRankings fetcher,
+# with a single header/User-Agent policy so scrapers stop copying their own header dicts
+
+import threading
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
+
+# Only advertise brotli when a decoder is installed, otherwise urllib3 can't decode "br" bodies
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+DEFAULT_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept-Encoding": ACCEPT_ENCODING,
+    "Accept-Language": "en-US,en;q=0.9",
+    "Connection": "keep-alive",
+}
+
+DEFAULT_TIMEOUT = 30
+
+# Connections kept open per host; enough for the concurrent fetchers without opening a socket per request
+POOL_SIZE = 32
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """Return the process-wide requests.Session, creating it on first use."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            session.headers.update(DEFAULT_HEADERS)
+            retries = Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+                            allowed_methods=("GET", "HEAD"), respect_retry_after_header=True)
+            adapter = HTTPAdapter(pool_connections=8, pool_maxsize=POOL_SIZE, max_retries=retries)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+
+def get(url, **kwargs):
+    """GET through the shared session with the default timeout."""
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    return get_session().get(url, **kwargs)
+
+
+def close_session():
+    """Close the shared session's pooled connections (a new one is created on the next call)."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def async_session(concurrency=16, timeout=DEFAULT_TIMEOUT):
+    """aiohttp.ClientSession with the same header policy, keeping up to `concurrency` connections alive.
+
+    Must be created inside a running event loop and used as `async with async_session() as session:`.
+    """
+    connector = aiohttp.TCPConnector(limit=concurrency, keepalive_timeout=60, ttl_dns_cache=300)
+    return aiohttp.ClientSession(headers=DEFAULT_HEADERS, connector=connector,
+                                 timeout=aiohttp.ClientTimeout(total=timeout), auto_decompress=True)
@@ -0,0 +1,181 @@
+# inference_server.py
+# Long-lived local prediction service for the ATS model (common/ats_model.py)
+# The saved model bundle is loaded once with the out-of-fold score of every (team, situation) row
+# in it, so a request is a dictionary lookup per game instead of a model call. A watcher thread polls the
+# model file and swaps in a new bundle when it changes, without dropping requests.
+#
+#   POST /predict  {"games": [{"team": "miami-heat", "home": true}, ...]}
+#        -> {"predictions": [{"team", "home", "cover_probability"}, ...], "model", "latency_ms"}
+#   GET  /metrics  request count and latency percentiles
+#   GET  /health   which model is loaded
+
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+from common.ats_model import MODEL_PATH, load_model, score_situations
+
+HOST = "127.0.0.1"
+PORT = 8765
+
+# Seconds between checks of the model file for a new artifact
+RELOAD_INTERVAL = 2.0
+
+# Number of recent request latencies kept for the percentiles in /metrics
+LATENCY_WINDOW = 1000
+
+
+class PredictionService:
+    """Loaded model state plus latency bookkeeping, shared by all request threads."""
+
+    def __init__(self, model_path=MODEL_PATH):
+        self.model_path = model_path
+        self.lock = threading.Lock()
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+        self.requests = 0
+        self.games = 0
+        self.reloads = 0
+        self.loaded_mtime = None
+        self.trained_at = None
+        self.probabilities = {}
+        self.reload()
+
+    def reload(self):
+        """Load the model file and score its situations if it changed since the last load. Returns True on reload."""
+        if not os.path.exists(self.model_path):
+            return False
+        mtime = os.stat(self.model_path).st_mtime_ns
+        if mtime == self.loaded_mtime:
+            return False
+        bundle = load_model(self.model_path)
+        # Situations whose out-of-fold model couldn't be fitted score NaN, which isn't valid JSON; serve them as None
+        probabilities = score_situations(bundle).dropna().to_dict()
+        # Swap the whole lookup table at once so requests never see a half-loaded model
+        with self.lock:
+            self.probabilities = probabilities
+            self.trained_at = bundle["trained_at"]
+            self.loaded_mtime = mtime
+            self.reloads += 1
+        print(f"Loaded ATS model trained {bundle['trained_at']} ({len(probabilities)} situations)")
+        return True
+
+    def watch(self, interval=RELOAD_INTERVAL):
+        """Poll the model file forever, reloading on change (run in a daemon thread)."""
+        while True:
+            time.sleep(interval)
+            try:
+                self.reload()
+            except Exception as e:
+                # A broken artifact must not take the service down; keep serving the old one
+                print(f"Model reload failed, keeping the loaded model: {e}")
+
+    def predict(self, games):
+        """Cover probability for each {"team", "home"} game (None where the team has no trend data)."""
+        start = time.perf_counter()
+        probabilities, trained_at = self.probabilities, self.trained_at
+        predictions = []
+        for game in games:
+            situation = "As Home Team" if game.get("home") else "As Away Team"
+            probability = probabilities.get((game.get("team"), situation))
+            predictions.append({"team": game.get("team"), "home": bool(game.get("home")),
+                                "cover_probability": None if probability is None else round(float(probability), 4)})
+        latency_ms = (time.perf_counter() - start) * 1000
+        with self.lock:
+            self.requests += 1
+            self.games += len(games)
+            self.latencies.append(latency_ms)
+        return {"predictions": predictions, "model": trained_at, "latency_ms": round(latency_ms, 3)}
+
+    def metrics(self):
+        with self.lock:
+            latencies = np.array(self.latencies)
+            metrics = {"requests": self.requests, "games": self.games, "reloads": self.reloads, "model": self.trained_at}
+        if len(latencies):
+            for name, q in [("p50_ms", 50), ("p95_ms", 95), ("p99_ms", 99)]:
+                metrics[name] = round(float(np.percentile(latencies, q)), 3)
+            metrics["max_ms"] = round(float(latencies.max()), 3)
+        return metrics
+
+
+def make_handler(service):
+    class Handler(BaseHTTPRequestHandler):
+        def _send(self, status, payload):
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _handle(self, route):
+            try:
+                route()
+            except Exception as e:
+                # Any unexpected failure still answers with JSON instead of dropping the connection
+                self._send(500, {"error": f"{type(e).__name__}: {e}"})
+
+        def do_GET(self):
+            self._handle(self._get)
+
+        def do_POST(self):
+            self._handle(self._post)
+
+        def _get(self):
+            if self.path == "/metrics":
+                self._send(200, service.metrics())
+            elif self.path == "/health":
+                self._send(200 if service.trained_at else 503, {"model": service.trained_at, "path": service.model_path})
+            else:
+                self._send(404, {"error": f"Unknown path {self.path}"})
+
+        def _post(self):
+            if self.path != "/predict":
+                self._send(404, {"error": f"Unknown path {self.path}"})
+                return
+            if not service.trained_at:
+                self._send(503, {"error": f"No model at {service.model_path}; run python -m common.ats_model train"})
+                return
+            try:
+                request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                games = request["games"]
+                if not isinstance(games, list) or not all(isinstance(game, dict) for game in games):
+                    raise TypeError("games must be a list of {\"team\", \"home\"} objects")
+            except (ValueError, KeyError, TypeError) as e:
+                self._send(400, {"error": f"Expected {{\"games\": [...]}}: {e}"})
+                return
+            self._send(200, service.predict(games))
+
+        def log_message(self, format, *args):
+            # Per-request access logs would cost more than the predictions themselves
+            pass
+
+    return Handler
+
+
+def serve(host=HOST, port=PORT, model_path=MODEL_PATH):
+    """Run the prediction service until interrupted."""
+    service = PredictionService(model_path)
+    threading.Thread(target=service.watch, daemon=True).start()
+    server = ThreadingHTTPServer((host, port), make_handler(service))
+    print(f"Serving ATS predictions on http://{host}:{port} (POST /predict, GET /metrics)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def main():
+    # python -m common.inference_server [port]
+    serve(port=int(sys.argv[1]) if len(sys.argv) > 1 else PORT)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+# league_schedule.py
+# The whole league's season schedule from ESPN's scoreboard API, one game per row
+# Scraping every team's TeamRankings page reads each game twice (once from each side) and needs
+# a browser per team. The scoreboard API returns every game in a date range as JSON, so a full
+# NBA season is about ten requests (one per month, fetched concurrently). Games are keyed by
+# (date, home, away) so overlapping ranges and re-runs never duplicate a game, and saved to
+# data/schedules/<league>_<season>.parquet. The time of the last ingest in which every request
+# succeeded is kept next to it (<league>_<season>.fetched.json); team_schedules() derives the per-team view (two rows
+# per game) in the shape common/team_schedule.py builds the rest index from.
+
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from common import http_client
+from common.espn_embedded import ESPN_TZ
+from common.gamelog_store import current_season
+from common.paths import SCHEDULE_DIR
+from common.team_registry import ESPN_LEAGUE_PATHS, load_registry
+
+SCOREBOARD_URL = "https://site.api.espn.com/apis/site/v2/sports/basketball/{path}/scoreboard"
+
+# Days per scoreboard request; college slates are big enough to hit the page limit in a month
+CHUNK_DAYS = {"nba": 31, "ncaam": 7}
+
+# Extra query parameters per league (groups=50 asks for all of Division I, not only ranked teams)
+LEAGUE_PARAMS = {"nba": {}, "ncaam": {"groups": "50"}}
+
+# ESPN season type codes
+SEASON_TYPES = {1: "preseason", 2: "regular", 3: "postseason", 5: "play-in"}
+
+# Season types kept for the per-team schedules and the rest index unless asked otherwise
+DEFAULT_SEASON_TYPES = ("regular",)
+
+COLUMNS = [
+    "date", "home", "away", "game_id", "season", "season_type", "start", "home_score", "away_score",
+    "completed", "neutral_site",
+]
+
+
+def season_range(season):
+    """First and last day a season's games can be played (October through June)."""
+    return date(season - 1, 10, 1), date(season, 6, 30)
+
+
+def date_chunks(start, end, days):
+    """(first, last) day ranges of at most `days` days covering start..end."""
+    chunks = []
+    while start <= end:
+        last = min(start + timedelta(days=days - 1), end)
+        chunks.append((start, last))
+        start = last + timedelta(days=1)
+    return chunks
+
+
+def parse_scoreboard(data, registry):
+    """Game rows (dicts with COLUMNS) from a scoreboard response; teams are ESPN slugs."""
+    rows = []
+    for event in data.get("events", []):
+        competition = (event.get("competitions") or [{}])[0]
+        sides = {}
+        for competitor in competition.get("competitors", []):
+            team = competitor.get("team", {})
+            # Look the team up by ESPN ID, falling back to the abbreviation for the built-in NBA list
+            known = registry.get(team.get("id")) or registry.get(team.get("abbreviation") or "")
+            slug = known.espn_slug if known and known.espn_slug else team.get("slug") or team.get("abbreviation")
+            score = pd.to_numeric(competitor.get("score"), errors="coerce")
+            sides[competitor.get("homeAway")] = (slug, score)
+        if "home" not in sides or "away" not in sides:
+            continue
+        start = datetime.fromisoformat(event["date"].replace("Z", "+00:00")).astimezone(ESPN_TZ)
+        status = competition.get("status") or event.get("status") or {}
+        season = event.get("season") or {}
+        rows.append({
+            # ESPN lists games on the US Eastern date, so late tips don't slip to the next UTC day
+            "date": start.date(),
+            "home": sides["home"][0],
+            "away": sides["away"][0],
+            "game_id": event.get("id"),
+            "season": season.get("year"),
+            "season_type": SEASON_TYPES.get(season.get("type"), str(season.get("type"))),
+            "start": start.isoformat(),
+            "home_score": sides["home"][1],
+            "away_score": sides["away"][1],
+            "completed": bool(status.get("type", {}).get("completed")),
+            "neutral_site": bool(competition.get("neutralSite")),
+        })
+    return rows
+
+
+def fetch_scoreboard(league, first, last, registry):
+    """Games between two days (inclusive) as row dicts, or None if the request failed."""
+    params = {"dates": f"{first:%Y%m%d}-{last:%Y%m%d}", "limit": 1000, **LEAGUE_PARAMS[league]}
+    try:
+        response = http_client.get(SCOREBOARD_URL.format(path=ESPN_LEAGUE_PATHS[league]), params=params)
+    except Exception as e:
+        print(f"Error: Unable to fetch {league} scoreboard {first} to {last} - {e}")
+        return None
+    if response.status_code != 200:
+        print(f"Error: Unable to fetch {league} scoreboard {first} to {last} - Status Code {response.status_code}")
+        return None
+    return parse_scoreboard(response.json(), registry)
+
+
+def dedupe_games(games):
+    """One row per (date, home, away), keeping the last fetched (most up to date) copy.
+
+    A game ESPN has moved to another day keeps its ID, so only its latest date survives.
+    """
+    moved = games["game_id"].notna() & games.duplicated("game_id", keep="last")
+    return (games[~moved].drop_duplicates(["date", "home", "away"], keep="last")
+            .sort_values(["date", "start", "home"], kind="stable").reset_index(drop=True))
+
+
+def schedule_path(league, season, schedule_dir=SCHEDULE_DIR):
+    return os.path.join(schedule_dir, f"{league}_{season}.parquet")
+
+
+def fetched_path(league, season, schedule_dir=SCHEDULE_DIR):
+    return os.path.join(schedule_dir, f"{league}_{season}.fetched.json")
+
+
+def fetched_at(league="nba", season=None, schedule_dir=SCHEDULE_DIR):
+    """When a season's schedule was last ingested with every request succeeding (datetime), or None."""
+    path = fetched_path(league, season or current_season(), schedule_dir)
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return datetime.fromtimestamp(json.load(f)["fetched_at"])
+
+
+def filter_season_types(games, season_types=DEFAULT_SEASON_TYPES):
+    """Only the games of the given season types ("preseason", "regular", ...); None keeps every game."""
+    if season_types is None:
+        return games
+    return games[games["season_type"].isin(list(season_types))].reset_index(drop=True)
+
+
+def load_schedule(league="nba", season=None, schedule_dir=SCHEDULE_DIR, season_types=None):
+    """Saved games for a season (empty frame if it hasn't been ingested), optionally only some season types."""
+    path = schedule_path(league, season or current_season(), schedule_dir)
+    games = pd.read_parquet(path) if os.path.exists(path) else pd.DataFrame(columns=COLUMNS)
+    return filter_season_types(games, season_types)
+
+
+def ingest_schedule(league="nba", season=None, start=None, end=None, workers=8, schedule_dir=SCHEDULE_DIR,
+                    season_types=DEFAULT_SEASON_TYPES):
+    """Fetch a season's games (or start..end within it) and merge them into the saved schedule.
+
+    The schedule file is only rewritten when new games were fetched, and fetched_at() only moves
+    when every request of an ingest covering the season up to today succeeded.
+
+    Every season type is saved; the returned deduplicated games table for the season only holds
+    the games of season_types (regular season by default, None for all of them).
+    """
+    season = season or current_season()
+    first, last = season_range(season)
+    chunks = date_chunks(start or first, end or last, CHUNK_DAYS[league])
+    registry = load_registry(league)
+    began = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as threads:
+        results = list(threads.map(lambda chunk: fetch_scoreboard(league, *chunk, registry), chunks))
+
+    rows = [row for result in results if result for row in result]
+    games = pd.concat([load_schedule(league, season, schedule_dir), pd.DataFrame(rows, columns=COLUMNS)],
+                      ignore_index=True)
+    games = dedupe_games(games)
+    os.makedirs(schedule_dir, exist_ok=True)
+    if rows:
+        path = schedule_path(league, season, schedule_dir)
+        games.to_parquet(f"{path}.tmp", index=False)
+        os.replace(f"{path}.tmp", path)
+    fetched = sum(result is not None for result in results)
+    if fetched == len(chunks) and chunks[0][0] <= first and chunks[-1][1] >= min(date.today(), last):
+        # Only an ingest of the whole season so far with no failed request counts as fresh
+        # (see gamelog_incremental.last_played_dates)
+        path = fetched_path(league, season, schedule_dir)
+        with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+            json.dump({"fetched_at": time.time(), "start": str(chunks[0][0]), "end": str(chunks[-1][1])}, f)
+        os.replace(f"{path}.tmp", path)
+    else:
+        print(f"{league} {season} schedule: {len(chunks) - fetched} requests failed or range incomplete, not marked as fresh")
+    print(f"{league} {season} schedule: {len(rows)} games from {fetched}/{len(chunks)} requests, "
+          f"{len(games)} saved in {time.perf_counter() - began:.1f}s")
+    return filter_season_types(games, season_types)
+
+
+def team_schedules(games, slug="teamrankings", league="nba"):
+    """Per-team view of a games table: two rows per game (team, date, opponent, location, home, played, ...).
+
+    slug="teamrankings" names teams by TeamRankings slug, as in the TeamRankings schedule files
+    and the rest index; slug="espn" keeps the ESPN slugs.
+    """
+    columns = ["team", "date", "opponent", "location", "home", "played", "team_score", "opp_score", "game_id"]
+    if games.empty:
+        return pd.DataFrame(columns=columns)
+    home = pd.DataFrame({"team": games["home"], "opponent": games["away"], "location": "Home", "home": True,
+                         "team_score": games["home_score"], "opp_score": games["away_score"]})
+    away = pd.DataFrame({"team": games["away"], "opponent": games["home"], "location": "Away", "home": False,
+                         "team_score": games["away_score"], "opp_score": games["home_score"]})
+    views = pd.concat([home.assign(date=games["date"], played=games["completed"], game_id=games["game_id"]),
+                       away.assign(date=games["date"], played=games["completed"], game_id=games["game_id"])],
+                      ignore_index=True)
+    neutral = games["neutral_site"].to_numpy(dtype=bool)
+    views.loc[np.concatenate([neutral, neutral]), "location"] = "Neutral"
+    if slug == "teamrankings":
+        registry = load_registry(league)
+        names = {team.espn_slug: team.teamrankings_slug for team in registry if team.espn_slug and team.teamrankings_slug}
+        views["team"] = views["team"].map(lambda team: names.get(team, team))
+        views["opponent"] = views["opponent"].map(lambda team: names.get(team, team))
+    return views.sort_values(["team", "date"], kind="stable").reset_index(drop=True)[columns]
+
+
+def game_sides(games, league="nba"):
+    """Both sides of every game keyed the way game-log rows are: date, opponent (ESPN abbreviation),
+    team (ESPN slug of the side facing that opponent), season_type and game_id."""
+    columns = ["date", "opponent", "team", "season_type", "game_id"]
+    if games.empty:
+        return pd.DataFrame(columns=columns)
+    registry = load_registry(league)
+    abbreviations = {team.espn_slug: team.abbreviation for team in registry if team.espn_slug}
+    sides = pd.concat([
+        pd.DataFrame({"date": games["date"], "opponent": games["away"], "team": games["home"]}),
+        pd.DataFrame({"date": games["date"], "opponent": games["home"], "team": games["away"]}),
+    ], ignore_index=True)
+    sides["opponent"] = sides["opponent"].map(lambda team: abbreviations.get(team, team))
+    sides["season_type"] = np.concatenate([games["season_type"].to_numpy()] * 2)
+    sides["game_id"] = np.concatenate([games["game_id"].to_numpy()] * 2)
+    return sides.drop_duplicates(["date", "opponent"], keep="last").reset_index(drop=True)[columns]
+
+
+def main():
+    # python -m common.league_schedule [nba|ncaam] [season]
+    args = sys.argv[1:]
+    league = args[0] if args and args[0] in CHUNK_DAYS else "nba"
+    seasons = [int(arg) for arg in args if arg.isdigit()]
+    games = ingest_schedule(league, seasons[0] if seasons else None)
+    print(games.tail(10).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
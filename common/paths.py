@@ -0,0 +1,72 @@
+# paths.py
+# Folder locations shared by the scrapers, relative to the repo root so the
+# modules work wherever the repo is checked out
+
+import os
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# ESPN player folders: nba_teams/<team>/<player>/<player>_splits.csv, _gamelog.csv
+ESPN_TEAMS_DIR = os.path.join(REPO_ROOT, "nba", "espn", "team_roster", "nba_team_rosters", "nba_teams")
+
+# TeamRankings schedules written by nba/teamrankings/Schedule/create_schedule.py: <team>_schedule_results.csv
+TEAMRANKINGS_SCHEDULE_DIR = os.path.join(REPO_ROOT, "nba", "teamrankings", "Schedule", "nba_team_schedule")
+
+# TeamRankings trend tables: <dir>/<team>/<team>_<ats_trends|over_under_trends|win_trends>.csv
+TEAMRANKINGS_TREND_DIRS = {
+    trend: os.path.join(REPO_ROOT, "nba", "teamrankings", "team_stats", f"team_{trend}_stats", "nba_teams")
+    for trend in ("ats", "ou", "win")
+}
+
+# Output folder per (league, page) for common/teamrankings_scraper.py
+TEAMRANKINGS_OUTPUT_DIRS = {
+    **{("nba", trend): folder for trend, folder in TEAMRANKINGS_TREND_DIRS.items()},
+    ("nba", "stats"): os.path.join(REPO_ROOT, "nba", "teamrankings", "team_stats", "team_overall_stats", "nba_teams"),
+    ("nba", "schedule"): TEAMRANKINGS_SCHEDULE_DIR,
+    ("nba", "roster"): os.path.join(REPO_ROOT, "nba", "teamrankings", "players", "roster", "nba_team_roster"),
+    **{("ncaam", trend): os.path.join(REPO_ROOT, "ncaam", "ncaam_stats", f"ncaam_{name}_stats")
+       for trend, name in (("ats", "ats"), ("ou", "ou"), ("win", "win"), ("stats", "team"))},
+    ("ncaam", "schedule"): os.path.join(REPO_ROOT, "ncaam", "ncaam_schedule", "ncaam_team_schedule"),
+    ("ncaam", "roster"): os.path.join(REPO_ROOT, "ncaam", "ncaam_roster", "ncaam_team_roster"),
+}
+
+# Local caches (ignored by git)
+CACHE_DIR = os.path.join(REPO_ROOT, ".cache")
+HTTP_CACHE_PATH = os.path.join(CACHE_DIR, "http_cache.sqlite")
+
+# Typed, columnar stores built from the scraped CSVs
+DATA_DIR = os.path.join(REPO_ROOT, "data")
+GAMELOG_STORE_DIR = os.path.join(DATA_DIR, "gamelogs")
+
+# Per-season player form features: form_<season>.parquet
+FORM_FEATURES_DIR = os.path.join(DATA_DIR, "form")
+
+# Dated JSON snapshots of the ESPN rosters: <YYYY-MM-DD>.json
+ROSTER_SNAPSHOT_DIR = os.path.join(DATA_DIR, "roster_snapshots")
+
+# Trained models (joblib bundles)
+MODEL_DIR = os.path.join(DATA_DIR, "models")
+
+# Closing betting lines for backtests (not scraped): date, team (ESPN slug), spread, total
+BETTING_LINES_PATH = os.path.join(DATA_DIR, "lines.csv")
+
+# Cached walk-forward backtest predictions, one Parquet file per (config, date range)
+BACKTEST_CACHE_DIR = os.path.join(CACHE_DIR, "backtests")
+
+# Hyperparameter sweep results, one CSV per sweep: data/sweeps/<name>.csv
+SWEEP_RESULTS_DIR = os.path.join(DATA_DIR, "sweeps")
+
+# Embedded SQLite warehouse over the scraped players, game logs, splits, trends and team stats
+WAREHOUSE_PATH = os.path.join(DATA_DIR, "warehouse.sqlite")
+
+# Daily versions of the TeamRankings trend and team stats tables (only changed rows are stored)
+TREND_HISTORY_PATH = os.path.join(DATA_DIR, "trend_history.sqlite")
+
+# TeamRankings league-wide stat pages, one long table per league: data/league_stats/<league>.parquet
+LEAGUE_STATS_DIR = os.path.join(DATA_DIR, "league_stats")
+
+# TeamRankings player-stat leaderboards, one long table per league: data/player_stats/<league>.parquet
+PLAYER_STATS_DIR = os.path.join(DATA_DIR, "player_stats")
+
+# League-wide season schedules from ESPN's scoreboard API: data/schedules/<league>_<season>.parquet
+SCHEDULE_DIR = os.path.join(DATA_DIR, "schedules")
@@ -0,0 +1,115 @@
+# roster_diff.py
+# Roster snapshots and the diff between runs, so per-player work is only redone where needed
+# Every roster update saves a dated JSON snapshot under data/roster_snapshots/. Comparing the new
+# rosters with the latest snapshot gives the players added to the league, removed from it and
+# traded between teams; only those players, plus players whose team has played since the last
+# snapshot, need their splits refreshed.
+
+import json
+import os
+from datetime import date
+
+from common.espn_splits import read_team_rosters
+from common.gamelog_incremental import last_played_dates
+from common.gamelog_store import current_season
+from common.paths import ESPN_TEAMS_DIR, ROSTER_SNAPSHOT_DIR, SCHEDULE_DIR, TEAMRANKINGS_SCHEDULE_DIR
+
+
+def snapshot_path(day, snapshot_dir=ROSTER_SNAPSHOT_DIR):
+    """JSON file holding the rosters saved on a given day."""
+    return os.path.join(snapshot_dir, f"{day.isoformat()}.json")
+
+
+def save_snapshot(team_rosters, day=None, snapshot_dir=ROSTER_SNAPSHOT_DIR):
+    """Write {team: [{"name", "id"}]} as the snapshot for day (today by default); a later run the same day replaces it."""
+    day = day or date.today()
+    os.makedirs(snapshot_dir, exist_ok=True)
+    path = snapshot_path(day, snapshot_dir)
+    with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+        json.dump({"date": day.isoformat(), "rosters": team_rosters}, f, indent=1, sort_keys=True)
+    os.replace(f"{path}.tmp", path)
+    return path
+
+
+def load_latest_snapshot(snapshot_dir=ROSTER_SNAPSHOT_DIR):
+    """Most recent snapshot as (date, team_rosters), or (None, None) if none has been saved."""
+    if not os.path.isdir(snapshot_dir):
+        return None, None
+    days = sorted(name[:-5] for name in os.listdir(snapshot_dir) if name.endswith(".json"))
+    if not days:
+        return None, None
+    with open(os.path.join(snapshot_dir, f"{days[-1]}.json"), "r", encoding="utf-8") as f:
+        snapshot = json.load(f)
+    return date.fromisoformat(snapshot["date"]), snapshot["rosters"]
+
+
+def _players_by_id(team_rosters):
+    return {player["id"]: (team, player["name"]) for team, players in team_rosters.items() for player in players}
+
+
+def diff_rosters(old_rosters, new_rosters):
+    """Compare two {team: [{"name", "id"}]} rosters by player ID.
+
+    Returns {"added": [...], "removed": [...], "traded": [...]} where added/removed entries are
+    {"id", "name", "team"} and traded entries are {"id", "name", "from", "to"}.
+    """
+    old = _players_by_id(old_rosters or {})
+    new = _players_by_id(new_rosters)
+
+    diff = {"added": [], "removed": [], "traded": []}
+    for player_id, (team, name) in new.items():
+        if player_id not in old:
+            diff["added"].append({"id": player_id, "name": name, "team": team})
+        elif old[player_id][0] != team:
+            diff["traded"].append({"id": player_id, "name": name, "from": old[player_id][0], "to": team})
+    for player_id, (team, name) in old.items():
+        if player_id not in new:
+            diff["removed"].append({"id": player_id, "name": name, "team": team})
+    return diff
+
+
+def print_diff(diff):
+    """Print the roster changes, one line per player."""
+    for player in diff["added"]:
+        print(f"  + {player['name']} ({player['team']})")
+    for player in diff["removed"]:
+        print(f"  - {player['name']} ({player['team']})")
+    for player in diff["traded"]:
+        print(f"  > {player['name']} ({player['from']} -> {player['to']})")
+    print(f"Roster changes: {len(diff['added'])} added, {len(diff['removed'])} removed, {len(diff['traded'])} traded")
+
+
+def plan_refresh(team_rosters, diff, since=None, schedule_dir=TEAMRANKINGS_SCHEDULE_DIR, season=None,
+                 league_schedule_dir=SCHEDULE_DIR):
+    """Subset of team_rosters whose splits need refreshing.
+
+    Includes every added or traded player, and everyone on a team that has played on or after
+    `since` (the previous snapshot's date), by the league schedule or the TeamRankings schedules
+    (see gamelog_incremental.last_played_dates). Teams without a schedule saved today count as having
+    played. With no previous snapshot (since=None) every player is included.
+    """
+    if since is None:
+        return team_rosters
+
+    changed = {player["id"] for player in diff["added"] + diff["traded"]}
+    last_played = last_played_dates(team_rosters, season or current_season(), schedule_dir, league_schedule_dir)
+
+    plan = {}
+    for team, players in team_rosters.items():
+        team_played = team not in last_played or last_played[team] >= since
+        selected = [player for player in players if team_played or player["id"] in changed]
+        if selected:
+            plan[team] = selected
+    return plan
+
+
+def main():
+    # python -m common.roster_diff -> compare the saved roster CSVs with the latest snapshot
+    since, old_rosters = load_latest_snapshot()
+    new_rosters = read_team_rosters(ESPN_TEAMS_DIR)
+    print(f"Comparing {len(new_rosters)} rosters with the snapshot from {since or 'never'}")
+    print_diff(diff_rosters(old_rosters, new_rosters))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+# split_engine.py
+# Computes ESPN-style player splits from the stored game logs instead of scraping the splits pages
+# Every game is tagged with the splits it belongs to (home/road, month, weekday, opponent, result,
+# division/conference, rest, All-Star break), the tags are stacked into one long table, and a
+# single groupby over (player, split) produces the totals for every player in the league at once.
+# Output rows use the same 18-column SPLIT,GP,MIN,FG,...,PTS schema as common/espn_splits.py.
+# Only regular-season games count (the season type stored with each game), and the All-Star break
+# is found in the league schedule. The game log has no offensive/defensive rebound split or
+# starter flag, so OR, DR and the "As Starter" row keep the values last scraped from ESPN (N/A
+# for players never scraped).
+
+import csv
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from common.espn_splits import DEFAULT_STATS, EXPECTED_HEADERS, PRESET_SPLITS, player_folder_name, save_splits
+from common.gamelog_store import current_season, load_gamelogs
+from common.league_schedule import load_schedule
+from common.paths import ESPN_TEAMS_DIR, GAMELOG_STORE_DIR, SCHEDULE_DIR
+from common.team_registry import NBA_TEAMS, SPLIT_ABBREVIATIONS
+
+MONTHS = {10: "October", 11: "November", 12: "December", 1: "January", 2: "February", 3: "March", 4: "April"}
+WEEKDAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+# Columns summed per split, in output order
+TOTALS = ["min", "fgm", "fga", "fg3m", "fg3a", "ftm", "fta", "reb", "ast", "blk", "stl", "pf", "tov", "pts"]
+
+# Splits the game log can't tell apart
+UNAVAILABLE_SPLITS = {"As Starter"}
+
+# Columns the game log can't compute
+UNAVAILABLE_COLUMNS = [EXPECTED_HEADERS.index("OR"), EXPECTED_HEADERS.index("DR")]
+
+
+def _tenths(values):
+    """Values as whole tenths, rounding halves up as ESPN does (9.25 -> 93)."""
+    return np.floor(values * 10 + 0.5 + 1e-9).astype(np.int64)
+
+
+def _fmt(tenths):
+    """Format whole tenths as "%.1f" strings through a lookup table instead of per-value formatting."""
+    labels = np.array([f"{i // 10}.{i % 10}" for i in range(int(tenths.max(initial=0)) + 1)], dtype=object)
+    return labels[tenths]
+
+
+def _pair(made, attempted):
+    return made + "-" + attempted
+
+
+def all_star_break(dates):
+    """First game day after the All-Star break: the end of the longest stretch without games in February.
+
+    dates are regular-season game days (the league schedule, or every stored game); None if there are none.
+    """
+    days = pd.Series(sorted(set(dates)))
+    if len(days) < 2:
+        return None
+    gaps = pd.to_datetime(days).diff().dt.days
+    february = pd.to_datetime(days.shift(1)).dt.month == 2
+    if not february.any():
+        return None
+    return days[gaps.where(february).idxmax()]
+
+
+def tag_games(games, all_star=None):
+    """Long (game row, split name) table: one entry per split each game counts towards.
+
+    Division and conference come from the team the player played each game for. all_star (from
+    all_star_break()) is the first game day after the break; without it there are no All-Star splits.
+    """
+    teams = pd.DataFrame.from_dict(NBA_TEAMS, orient="index", columns=["abbr", "conference", "division"])
+    by_abbr = teams.set_index("abbr")
+    played_for = games["played_for"].fillna(games["team"]) if "played_for" in games else games["team"]
+    own = teams.reindex(played_for).set_index(games.index)
+    opponent = games["opponent"].replace(SPLIT_ABBREVIATIONS)
+    opp = by_abbr.reindex(opponent).set_index(games.index)
+    day = pd.to_datetime(games["date"])
+    rest_days = day.groupby(games["player_id"]).diff().dt.days
+
+    tags = [
+        pd.Series("All Splits", index=games.index),
+        pd.Series(np.where(games["home"], "Home", "Road"), index=games.index),
+        pd.Series("vs. Division", index=games.index)[own["division"] == opp["division"]],
+        pd.Series("vs. Conference", index=games.index)[own["conference"] == opp["conference"]],
+        # A season opener counts as rested
+        pd.Series("3+ Days Rest", index=games.index)[rest_days.isna() | (rest_days >= 4)],
+        day.dt.month.map(MONTHS).dropna(),
+        pd.Series(np.where(games["win"], "Wins", "Losses"), index=games.index),
+        pd.Series(np.array(WEEKDAYS)[day.dt.weekday], index=games.index),
+        "vs " + opponent,
+    ]
+    if all_star is not None:
+        tags.append(pd.Series(np.where(games["date"] < all_star, "Pre All-Star", "Post All-Star"), index=games.index))
+
+    split = pd.concat(tags)
+    return pd.DataFrame({"row": split.index, "split": split.values})
+
+
+def compute_splits(games, all_star=None):
+    """Split rows for every player in games (a regular-season load_gamelogs() frame).
+
+    A player stored under two teams (traded since an earlier fetch) counts each game once, under the
+    team holding their latest game. Returns {player_id: (team, player, rows)} where rows follow
+    PRESET_SPLITS and EXPECTED_HEADERS; OR, DR and "As Starter" are N/A.
+    """
+    games = games.dropna(subset=["date", "min"])
+    games = games.sort_values(["player_id", "date"], kind="stable").drop_duplicates(["player_id", "date"], keep="last")
+    games = games.reset_index(drop=True)
+    if games.empty:
+        return {}
+
+    tagged = tag_games(games, all_star)
+    stats = games[TOTALS].astype("float64").fillna(0)
+    stats["player_id"] = games["player_id"]
+    grouped = stats.iloc[tagged["row"]].assign(split=tagged["split"].values).groupby(["player_id", "split"])
+    sums = grouped[TOTALS].sum()
+    gp = grouped.size()
+
+    sums_array = sums.to_numpy()
+    count = gp.to_numpy()
+    avg = _fmt(_tenths(sums_array / count[:, None]))
+    column = {name: avg[:, i] for i, name in enumerate(TOTALS)}
+    pct = {}
+    for made, att in [("fgm", "fga"), ("fg3m", "fg3a"), ("ftm", "fta")]:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = np.nan_to_num(sums[made].to_numpy() / sums[att].to_numpy() * 100)
+        pct[made] = _fmt(_tenths(ratio))
+
+    na = np.full(len(count), "N/A", dtype=object)
+    table = np.column_stack([
+        count.astype(str), column["min"],
+        _pair(column["fgm"], column["fga"]), pct["fgm"],
+        _pair(column["fg3m"], column["fg3a"]), pct["fg3m"],
+        _pair(column["ftm"], column["fta"]), pct["ftm"],
+        na, na,
+        column["reb"], column["ast"], column["blk"], column["stl"], column["pf"], column["tov"], column["pts"],
+    ]).tolist()
+
+    by_player = {}
+    for (player_id, split), stats in zip(sums.index, table):
+        by_player.setdefault(player_id, {})[split] = stats
+
+    players = games.groupby("player_id")[["team", "player"]].last()
+    missing = ["N/A"] * (len(EXPECTED_HEADERS) - 1)
+    results = {}
+    for player_id, team, player in zip(players.index, players["team"], players["player"]):
+        by_split = by_player[player_id]
+        rows = []
+        for split in PRESET_SPLITS:
+            if split in UNAVAILABLE_SPLITS:
+                rows.append([split] + missing)
+            else:
+                rows.append([split] + by_split.get(split, DEFAULT_STATS))
+        results[player_id] = (team, player, rows)
+    return results
+
+
+def keep_scraped(rows, splits_csv):
+    """Fill OR, DR and the "As Starter" row from a previously saved splits CSV where it has them."""
+    if not os.path.exists(splits_csv):
+        return rows
+    with open(splits_csv, mode="r", encoding="utf-8") as f:
+        scraped = {row[0]: row for row in csv.reader(f) if len(row) == len(EXPECTED_HEADERS)}
+    for row in rows:
+        old = scraped.get(row[0])
+        if old is None:
+            continue
+        if row[0] in UNAVAILABLE_SPLITS:
+            row[1:] = old[1:]
+            continue
+        for i in UNAVAILABLE_COLUMNS:
+            if row[i] == "N/A":
+                row[i] = old[i]
+    return rows
+
+
+def derive_splits(team_rosters=None, season=None, base_dir=ESPN_TEAMS_DIR, store_dir=GAMELOG_STORE_DIR,
+                  schedule_dir=SCHEDULE_DIR):
+    """Compute splits from the stored game logs and save each player's <player>_splits.csv.
+
+    team_rosters ({team: [{"name", "id"}]}) limits the work to those players, whichever team's
+    partition holds their games, and saves them under their roster team; by default every player in
+    the store is written. Values the game log can't compute are kept from the file being replaced.
+    Returns the number of players whose splits were saved.
+    """
+    season = season or current_season()
+    start = time.perf_counter()
+    games = load_gamelogs(season, store_dir=store_dir)
+    schedule = load_schedule("nba", season, schedule_dir, season_types=("regular",))
+    all_star = all_star_break(schedule["date"] if not schedule.empty else games["date"].dropna())
+    roster_teams = None
+    if team_rosters is not None:
+        roster_teams = {player["id"]: team for team, players in team_rosters.items() for player in players}
+        games = games[games["player_id"].isin(list(roster_teams))]
+
+    splits = compute_splits(games, all_star)
+    computed = time.perf_counter() - start
+    for player_id, (team, player, rows) in splits.items():
+        team = roster_teams.get(player_id, team) if roster_teams else team
+        folder = player_folder_name(player)
+        rows = keep_scraped(rows, os.path.join(base_dir, team, folder, f"{folder}_splits.csv"))
+        save_splits(rows, team, player, base_dir)
+
+    print(f"Derived splits for {len(splits)} players from {len(games)} games "
+          f"in {computed:.2f}s ({time.perf_counter() - start:.2f}s with CSV writes)")
+    return len(splits)
+
+
+def main():
+    # python -m common.split_engine [season]
+    derive_splits(season=int(sys.argv[1]) if len(sys.argv) > 1 else None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+# sweep.py
+# Hyperparameter sweeps over model types and feature sets for the game prediction models
+# The game dataset from common/backtest.py is built once and written as a .npy feature matrix.
+# Worker processes open it with mmap_mode="r", so every worker reads the same pages instead of
+# receiving a pickled copy. Each trial fits on the earlier games and scores the latest
+# holdout_fraction of game dates, and one results row is appended per trial (fit/predict seconds,
+# accuracy, log loss, Brier, ROI at -110). Trial IDs include a fingerprint of the data (store and
+# lines files, seasons, holdout), so trials already in the results file for the same data are
+# skipped and an interrupted sweep picks up where it stopped. Run the best configurations through
+# common/backtest.py for the full walk-forward numbers.
+
+import csv
+import hashlib
+import itertools
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+from sklearn.metrics import log_loss
+from threadpoolctl import threadpool_limits
+
+from common.backtest import FEATURES, ODDS_RISK, TEAM_FEATURES, _store_key, build_dataset, make_model, read_lines
+from common.gamelog_store import current_season, load_gamelogs
+from common.paths import BETTING_LINES_PATH, CACHE_DIR, GAMELOG_STORE_DIR, SWEEP_RESULTS_DIR
+
+# Named feature subsets to search over
+FEATURE_SETS = {
+    "all": FEATURES,
+    "season": ["home", "rest_days", "win_pct", "avg_margin", "opp_rest_days", "opp_win_pct", "opp_avg_margin"],
+    "recent": ["home", "rest_days"] + [name for name in FEATURES if "l10_" in name] + ["opp_rest_days"],
+    "team_only": ["home"] + TEAM_FEATURES,
+}
+
+# Model name -> parameter name -> candidate values
+SEARCH_SPACE = {
+    "random_forest": {
+        "n_estimators": [100, 200, 400],
+        "max_depth": [None, 6, 10],
+        "min_samples_leaf": [1, 5, 20],
+        "max_features": ["sqrt", 0.5, 1.0],
+    },
+    "hist_gradient_boosting": {
+        "learning_rate": [0.03, 0.1, 0.3],
+        "max_depth": [None, 3, 6],
+        "max_iter": [100, 300],
+        "l2_regularization": [0.0, 1.0],
+    },
+    "logistic": {
+        "C": [0.01, 0.1, 1.0, 10.0],
+    },
+}
+
+RESULT_COLUMNS = [
+    "trial", "target", "model", "feature_set", "params", "train_games", "test_games",
+    "fit_seconds", "predict_seconds", "accuracy", "log_loss", "brier", "roi",
+]
+
+
+def grid_trials(search_space=SEARCH_SPACE, feature_sets=FEATURE_SETS):
+    """Every combination of model, parameters and feature set."""
+    trials = []
+    for model, space in search_space.items():
+        names = list(space)
+        for values in itertools.product(*(space[name] for name in names)):
+            for feature_set in feature_sets:
+                trials.append({"model": model, "params": dict(zip(names, values)), "feature_set": feature_set})
+    return trials
+
+
+def random_trials(n_trials, seed=42, search_space=SEARCH_SPACE, feature_sets=FEATURE_SETS):
+    """n_trials distinct random draws from the grid (all of it if the grid is smaller)."""
+    trials = grid_trials(search_space, feature_sets)
+    return random.Random(seed).sample(trials, min(n_trials, len(trials)))
+
+
+def dataset_key(target, seasons, holdout_fraction, store_dir=GAMELOG_STORE_DIR, lines_path=BETTING_LINES_PATH):
+    """Fingerprint of the data a sweep runs on: target, seasons, holdout and the input files' sizes and times."""
+    key = json.dumps({"target": target, "seasons": sorted(seasons), "holdout_fraction": holdout_fraction,
+                      "data": _store_key(store_dir, lines_path)}, sort_keys=True, default=str)
+    return hashlib.sha1(key.encode()).hexdigest()[:12]
+
+
+def trial_id(target, trial, dataset=None):
+    """Stable ID of a trial on one dataset (see dataset_key), used to skip trials already in the results file."""
+    key = json.dumps({"target": target, "dataset": dataset, **trial}, sort_keys=True, default=str)
+    return hashlib.sha1(key.encode()).hexdigest()[:12]
+
+
+def _save_npy(path, array):
+    # Write then rename so a worker of another sweep never maps a half-written file
+    with open(f"{path}.tmp", "wb") as f:
+        np.save(f, array)
+    os.replace(f"{path}.tmp", path)
+
+
+def write_matrix(dataset, key, cache_dir=CACHE_DIR):
+    """Save the labelled games' FEATURES and labels as .npy files named by dataset key for memory mapping.
+
+    Returns their paths. Sweeps over different data (e.g. win and ats at once) get separate files.
+    """
+    labelled = dataset[dataset["label"].notna()]
+    sweep_dir = os.path.join(cache_dir, "sweeps")
+    os.makedirs(sweep_dir, exist_ok=True)
+    matrix_path = os.path.join(sweep_dir, f"features_{key}.npy")
+    labels_path = os.path.join(sweep_dir, f"labels_{key}.npy")
+    _save_npy(matrix_path, labelled[FEATURES].to_numpy(dtype="float64"))
+    _save_npy(labels_path, labelled["label"].to_numpy(dtype="int8"))
+    return matrix_path, labels_path
+
+
+# Per-worker state set by _init_worker: the memory-mapped matrix, labels and split point
+_WORKER_STATE = {}
+
+
+def _init_worker(matrix_path, labels_path, split, dataset):
+    _WORKER_STATE["X"] = np.load(matrix_path, mmap_mode="r")
+    _WORKER_STATE["y"] = np.load(labels_path, mmap_mode="r")
+    _WORKER_STATE["split"] = split
+    _WORKER_STATE["dataset"] = dataset
+    # One BLAS/OpenMP thread per worker; the pool already uses every core
+    threadpool_limits(1)
+
+
+def _run_trial(target, trial):
+    X, y, split = _WORKER_STATE["X"], _WORKER_STATE["y"], _WORKER_STATE["split"]
+    columns = [FEATURES.index(name) for name in FEATURE_SETS[trial["feature_set"]]]
+    model = make_model({"model": trial["model"], "params": trial["params"]})
+
+    start = time.perf_counter()
+    model.fit(X[:split, columns], y[:split])
+    fit_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    probability = model.predict_proba(X[split:, columns])[:, 1]
+    predict_seconds = time.perf_counter() - start
+
+    actual = np.asarray(y[split:])
+    hits = (probability >= 0.5) == (actual == 1)
+    return {
+        "trial": trial_id(target, trial, _WORKER_STATE["dataset"]), "target": target, "model": trial["model"],
+        "feature_set": trial["feature_set"], "params": json.dumps(trial["params"], sort_keys=True),
+        "train_games": split, "test_games": len(actual),
+        "fit_seconds": round(fit_seconds, 4), "predict_seconds": round(predict_seconds, 4),
+        "accuracy": round(float(hits.mean()), 4),
+        "log_loss": round(float(log_loss(actual, probability, labels=[0, 1])), 4),
+        "brier": round(float(np.mean((probability - actual) ** 2)), 4),
+        "roi": round(float(np.where(hits, 1.0, -ODDS_RISK).sum() / (ODDS_RISK * len(hits))), 4),
+    }
+
+
+def results_path(name, results_dir=SWEEP_RESULTS_DIR):
+    return os.path.join(results_dir, f"{name}.csv")
+
+
+def load_results(name, results_dir=SWEEP_RESULTS_DIR):
+    """A sweep's results table (empty frame if it hasn't run yet)."""
+    path = results_path(name, results_dir)
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=RESULT_COLUMNS)
+    return pd.read_csv(path, dtype={"trial": str})
+
+
+def run_sweep(trials, name="sweep", target="win", seasons=None, holdout_fraction=0.2, workers=None,
+              store_dir=GAMELOG_STORE_DIR, lines_path=BETTING_LINES_PATH, results_dir=SWEEP_RESULTS_DIR,
+              cache_dir=CACHE_DIR):
+    """Run every trial not yet in the results file for name. Returns the full results table.
+
+    trials come from grid_trials() or random_trials(); the games are split by date, training on
+    the first 1 - holdout_fraction and scoring the rest. Trials run on other data (new games
+    stored, other seasons or holdout) don't count as done.
+    """
+    seasons = seasons or [current_season()]
+    key = dataset_key(target, seasons, holdout_fraction, store_dir, lines_path)
+    done = set(load_results(name, results_dir)["trial"])
+    pending = [trial for trial in trials if trial_id(target, trial, key) not in done]
+    print(f"Sweep {name}: {len(trials)} trials, {len(trials) - len(pending)} already done")
+    if not pending:
+        return load_results(name, results_dir)
+
+    games = pd.concat([load_gamelogs(season, store_dir=store_dir) for season in seasons], ignore_index=True)
+    dataset = build_dataset(games, target, read_lines(lines_path) if target != "win" else None)
+    dataset = dataset[dataset["label"].notna()].sort_values("date", kind="stable").reset_index(drop=True)
+    dates = dataset["date"].drop_duplicates().to_numpy()
+    cutoff = dates[int(len(dates) * (1 - holdout_fraction))]
+    split = int((dataset["date"] < cutoff).sum())
+    matrix_path, labels_path = write_matrix(dataset, key, cache_dir)
+
+    path = results_path(name, results_dir)
+    os.makedirs(results_dir, exist_ok=True)
+    start = time.perf_counter()
+    with open(path, "a", newline="", encoding="utf-8") as f, \
+            ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                initargs=(matrix_path, labels_path, split, key)) as pool:
+        writer = csv.DictWriter(f, fieldnames=RESULT_COLUMNS)
+        if f.tell() == 0:
+            writer.writeheader()
+        futures = [pool.submit(_run_trial, target, trial) for trial in pending]
+        for count, future in enumerate(as_completed(futures), 1):
+            # Written as each trial finishes, so an interrupted sweep keeps its results
+            writer.writerow(future.result())
+            f.flush()
+            if count % 25 == 0 or count == len(futures):
+                print(f"{count}/{len(futures)} trials in {time.perf_counter() - start:.1f}s")
+    return load_results(name, results_dir)
+
+
+def main():
+    # python -m common.sweep [grid|random] [n_trials] [target]
+    mode = sys.argv[1] if len(sys.argv) > 1 else "random"
+    n_trials = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    target = sys.argv[3] if len(sys.argv) > 3 else "win"
+    trials = grid_trials() if mode == "grid" else random_trials(n_trials)
+    results = run_sweep(trials, name=f"{target}_{mode}", target=target)
+    columns = ["model", "feature_set", "params", "fit_seconds", "accuracy", "log_loss", "brier", "roi"]
+    print(results.sort_values("log_loss").head(10)[columns].to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+# team_registry.py
+# Every NBA and NCAAM Division I team with its ESPN ID/slug, TeamRankings slug, abbreviation and names
+# Teams are discovered once from ESPN's /teams API and the TeamRankings teams index, matched
+# on slug or display name, and cached in .cache/teams_<league>.json. The cache is refreshed when
+# it is older than REFRESH_DAYS; if a refresh fails the stale copy keeps being used. A registry
+# indexes the teams by slug (either site's), ESPN ID, abbreviation and display name, so scrapers
+# resolve teams with a dictionary lookup instead of hand-typed lists.
+# NBA conference/division and the split-page abbreviations are fixed, so they live in NBA_TEAMS
+# below, which also serves as the NBA team list when nothing has been discovered yet.
+
+import json
+import os
+import re
+import sys
+import time
+from collections import namedtuple
+
+from bs4 import BeautifulSoup
+
+from common.http_cache import cached_get
+from common.paths import CACHE_DIR
+from common.teamrankings_trends import LEAGUE_PATHS, TEAMRANKINGS_URL
+
+# Re-discover teams when the cached registry is older than this
+REFRESH_DAYS = 30
+
+# ESPN site API sport path per league
+ESPN_LEAGUE_PATHS = {"nba": "nba", "ncaam": "mens-college-basketball"}
+
+# ESPN team folder slug -> (abbreviation used in the splits, conference, division)
+NBA_TEAMS = {
+    "atlanta-hawks": ("ATL", "East", "Southeast"), "boston-celtics": ("BOS", "East", "Atlantic"),
+    "brooklyn-nets": ("BKN", "East", "Atlantic"), "charlotte-hornets": ("CHA", "East", "Southeast"),
+    "chicago-bulls": ("CHI", "East", "Central"), "cleveland-cavaliers": ("CLE", "East", "Central"),
+    "dallas-mavericks": ("DAL", "West", "Southwest"), "denver-nuggets": ("DEN", "West", "Northwest"),
+    "detroit-pistons": ("DET", "East", "Central"), "golden-state-warriors": ("GS", "West", "Pacific"),
+    "houston-rockets": ("HOU", "West", "Southwest"), "indiana-pacers": ("IND", "East", "Central"),
+    "la-clippers": ("LAC", "West", "Pacific"), "los-angeles-lakers": ("LAL", "West", "Pacific"),
+    "memphis-grizzlies": ("MEM", "West", "Southwest"), "miami-heat": ("MIA", "East", "Southeast"),
+    "milwaukee-bucks": ("MIL", "East", "Central"), "minnesota-timberwolves": ("MIN", "West", "Northwest"),
+    "new-orleans-pelicans": ("NO", "West", "Southwest"), "new-york-knicks": ("NY", "East", "Atlantic"),
+    "oklahoma-city-thunder": ("OKC", "West", "Northwest"), "orlando-magic": ("ORL", "East", "Southeast"),
+    "philadelphia-76ers": ("PHI", "East", "Atlantic"), "phoenix-suns": ("PHO", "West", "Pacific"),
+    "portland-trail-blazers": ("POR", "West", "Northwest"), "sacramento-kings": ("SAC", "West", "Pacific"),
+    "san-antonio-spurs": ("SA", "West", "Southwest"), "toronto-raptors": ("TOR", "East", "Atlantic"),
+    "utah-jazz": ("UTA", "West", "Northwest"), "washington-wizards": ("WAS", "East", "Southeast"),
+}
+
+# Game-log opponent abbreviations that the splits page (and NBA_TEAMS) spells differently
+SPLIT_ABBREVIATIONS = {"PHX": "PHO", "UTAH": "UTA", "WSH": "WAS"}
+
+# ESPN slug -> TeamRankings slug where the two sites disagree and names don't settle it
+TEAMRANKINGS_SLUGS = {"la-clippers": "los-angeles-clippers"}
+
+# abbreviation is ESPN's (PHX, not the splits page's PHO); conference/division are NBA only
+Team = namedtuple("Team", [
+    "league", "espn_id", "espn_slug", "teamrankings_slug", "abbreviation", "display_name",
+    "conference", "division",
+])
+
+
+def slugify(name):
+    """"St. John's Red Storm" -> "st-johns-red-storm"."""
+    return re.sub(r"[^a-z0-9]+", "-", name.lower().replace("'", "").replace("&", "")).strip("-")
+
+
+def _normalize(name):
+    return slugify(name or "").replace("-", "")
+
+
+def fetch_espn_teams(league):
+    """[{"id", "slug", "abbreviation", "display_name"}] from ESPN's teams API."""
+    url = f"https://site.api.espn.com/apis/site/v2/sports/basketball/{ESPN_LEAGUE_PATHS[league]}/teams?limit=1000"
+    response = cached_get(url)
+    if response.status_code != 200:
+        raise RuntimeError(f"ESPN teams request failed: {response.status_code}")
+    teams = response.json()["sports"][0]["leagues"][0]["teams"]
+    return [{"id": t["team"]["id"], "slug": t["team"]["slug"], "abbreviation": t["team"].get("abbreviation"),
+             "display_name": t["team"]["displayName"]} for t in teams]
+
+
+def parse_teamrankings_index(html, league):
+    """{slug: display name} for every /<league>/team/<slug> link on a TeamRankings teams page."""
+    pattern = re.compile(rf"^(?:{re.escape(TEAMRANKINGS_URL)})?/{LEAGUE_PATHS[league]}/team/([a-z0-9-]+)/?$")
+    teams = {}
+    for link in BeautifulSoup(html, "html.parser").find_all("a", href=True):
+        match = pattern.match(link["href"])
+        if match and match.group(1) not in teams:
+            teams[match.group(1)] = link.text.strip()
+    return teams
+
+
+def fetch_teamrankings_teams(league):
+    """{slug: display name} from the TeamRankings teams index."""
+    response = cached_get(f"{TEAMRANKINGS_URL}/{LEAGUE_PATHS[league]}/teams/")
+    if response.status_code != 200:
+        raise RuntimeError(f"TeamRankings teams request failed: {response.status_code}")
+    return parse_teamrankings_index(response.text, league)
+
+
+def match_teams(league, espn_teams, teamrankings_teams):
+    """Join the two sites' team lists into Team records.
+
+    A TeamRankings slug matches an ESPN team by TEAMRANKINGS_SLUGS, by identical slug, or by
+    display name. Teams found on only one site are kept with the other site's fields empty.
+    """
+    by_name = {_normalize(name): slug for slug, name in teamrankings_teams.items()}
+    unmatched = dict(teamrankings_teams)
+    teams = []
+    for espn in espn_teams:
+        slug = TEAMRANKINGS_SLUGS.get(espn["slug"]) if league == "nba" else None
+        if slug is None:
+            slug = espn["slug"] if espn["slug"] in teamrankings_teams else by_name.get(_normalize(espn["display_name"]))
+        unmatched.pop(slug, None)
+        _, conference, division = NBA_TEAMS.get(espn["slug"], (None, None, None)) if league == "nba" else (None, None, None)
+        teams.append(Team(league, espn["id"], espn["slug"], slug, espn["abbreviation"], espn["display_name"],
+                          conference, division))
+    for slug, name in unmatched.items():
+        teams.append(Team(league, None, None, slug, None, name or slug.replace("-", " ").title(), None, None))
+    return teams
+
+
+def seed_teams(league):
+    """Teams known without any request (the NBA from NBA_TEAMS; nothing for NCAAM)."""
+    if league != "nba":
+        return []
+    espn_abbreviations = {split: log for log, split in SPLIT_ABBREVIATIONS.items()}
+    return [Team("nba", None, slug, TEAMRANKINGS_SLUGS.get(slug, slug), espn_abbreviations.get(abbreviation, abbreviation),
+                 slug.replace("-", " ").title(), conference, division)
+            for slug, (abbreviation, conference, division) in NBA_TEAMS.items()]
+
+
+class TeamRegistry:
+    """Teams of one league with O(1) lookups by slug, ESPN ID, abbreviation or display name."""
+
+    def __init__(self, league, teams, fetched_at=None):
+        self.league = league
+        self.fetched_at = fetched_at
+        self._teams = list(teams)
+        self._index = {}
+        for team in self._teams:
+            # The splits pages spell a few NBA abbreviations differently (PHO for ESPN's PHX)
+            aliases = [SPLIT_ABBREVIATIONS.get(team.abbreviation)] if league == "nba" else []
+            # setdefault keeps the first team for a key, so an exact slug beats a name collision
+            for key in [team.teamrankings_slug, team.espn_slug, team.espn_id, team.abbreviation] + aliases:
+                if key:
+                    self._index.setdefault(str(key).lower(), team)
+            self._index.setdefault(_normalize(team.display_name), team)
+
+    def __len__(self):
+        return len(self._teams)
+
+    def __iter__(self):
+        return iter(self._teams)
+
+    def get(self, key, default=None):
+        """Team for a slug (ESPN or TeamRankings), ESPN ID, abbreviation or display name."""
+        key = str(key)
+        return self._index.get(key.lower()) or self._index.get(_normalize(key)) or default
+
+    def __getitem__(self, key):
+        team = self.get(key)
+        if team is None:
+            raise KeyError(f"Unknown {self.league} team: {key}")
+        return team
+
+    def teamrankings_slugs(self):
+        return [team.teamrankings_slug for team in self._teams if team.teamrankings_slug]
+
+    def espn_slugs(self):
+        return [team.espn_slug for team in self._teams if team.espn_slug]
+
+
+def registry_path(league, cache_dir=CACHE_DIR):
+    return os.path.join(cache_dir, f"teams_{league}.json")
+
+
+def discover(league, cache_dir=CACHE_DIR):
+    """Fetch both sites' team lists, match them and cache the result. Returns a TeamRegistry."""
+    start = time.perf_counter()
+    teams = match_teams(league, fetch_espn_teams(league), fetch_teamrankings_teams(league))
+    fetched_at = time.time()
+    os.makedirs(cache_dir, exist_ok=True)
+    path = registry_path(league, cache_dir)
+    with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+        json.dump({"fetched_at": fetched_at, "teams": [team._asdict() for team in teams]}, f, indent=1)
+    os.replace(f"{path}.tmp", path)
+    matched = sum(1 for team in teams if team.espn_id and team.teamrankings_slug)
+    print(f"Discovered {len(teams)} {league} teams ({matched} on both sites) in {time.perf_counter() - start:.1f}s")
+    return TeamRegistry(league, teams, fetched_at)
+
+
+_registries = {}
+
+
+def load_registry(league="nba", refresh=False, max_age_days=REFRESH_DAYS, cache_dir=CACHE_DIR):
+    """The league's registry: from memory, then the cache file, re-discovering when stale or asked to.
+
+    If discovery fails, a stale cache (or for the NBA, the built-in team list) is used instead.
+    """
+    if not refresh and league in _registries:
+        return _registries[league]
+
+    cached = None
+    path = registry_path(league, cache_dir)
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        cached = TeamRegistry(league, [Team(**team) for team in data["teams"]], data["fetched_at"])
+
+    registry = cached
+    if refresh or cached is None or time.time() - cached.fetched_at > max_age_days * 86400:
+        try:
+            registry = discover(league, cache_dir)
+        except Exception as e:
+            print(f"Team discovery for {league} failed ({e}); using the {'cached' if cached else 'built-in'} list")
+            registry = cached or TeamRegistry(league, seed_teams(league))
+    _registries[league] = registry
+    return registry
+
+
+def teamrankings_slug(espn_slug):
+    """TeamRankings slug of an NBA team given its ESPN slug (unchanged when the sites agree)."""
+    return TEAMRANKINGS_SLUGS.get(espn_slug, espn_slug)
+
+
+def main():
+    # python -m common.team_registry [nba|ncaam] [--refresh] [lookup ...]
+    args = [arg for arg in sys.argv[1:] if arg != "--refresh"]
+    league = args[0] if args and args[0] in ESPN_LEAGUE_PATHS else "nba"
+    registry = load_registry(league, refresh="--refresh" in sys.argv)
+    lookups = args[1:] if args and args[0] in ESPN_LEAGUE_PATHS else args
+    for team in ([registry[key] for key in lookups] if lookups else registry):
+        print(f"{team.espn_id or '-':>6}  {team.abbreviation or '-':<6} {team.teamrankings_slug or '-':<32} "
+              f"{team.espn_slug or '-':<32} {team.display_name}")
+
+
+if __name__ == "__main__":
+    main()
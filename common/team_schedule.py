@@ -0,0 +1,155 @@
+# team_schedule.py
+# Reads the TeamRankings schedules saved by nba/teamrankings/Schedule/create_schedule.py and
+# builds the rest / back-to-back / 3-in-4 / road-trip index for every team-game
+# The index is computed in one pass over all teams' games sorted by (team, date) and saved next
+# to the schedules as rest_index.parquet, so features and splits can look a team-game up
+# instead of re-parsing date strings.
+
+import os
+import re
+import sys
+import time
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from common.gamelog_store import current_season
+from common.paths import TEAMRANKINGS_SCHEDULE_DIR
+
+REST_INDEX_FILE = "rest_index.parquet"
+
+
+def schedule_date(text, season):
+    """Schedule "Date" cell ("3/9", "Mar 9", "Sun 3/9") -> date within the season, or None."""
+    match = re.search(r"(\d{1,2})/(\d{1,2})", text)
+    if match:
+        month, day = int(match.group(1)), int(match.group(2))
+    else:
+        parsed = pd.to_datetime(f"{text} 2000", errors="coerce", format="mixed")
+        if pd.isna(parsed):
+            return None
+        month, day = parsed.month, parsed.day
+    try:
+        return date(season - 1 if month >= 8 else season, month, day)
+    except ValueError:
+        return None
+
+
+def read_schedule(team, season, schedule_dir=TEAMRANKINGS_SCHEDULE_DIR):
+    """One team's saved schedule as a DataFrame (team, date, opponent, location, home, played), or None."""
+    schedule_csv = os.path.join(schedule_dir, f"{team}_schedule_results.csv")
+    if not os.path.exists(schedule_csv):
+        return None
+    raw = pd.read_csv(schedule_csv, dtype=str, keep_default_na=False)
+    location = raw.get("Location", pd.Series("", index=raw.index)).str.strip()
+    return pd.DataFrame({
+        "team": team,
+        "date": [schedule_date(text, season) for text in raw["Date"]],
+        "opponent": raw["Opponent"].str.strip(),
+        "location": location,
+        "home": location.str.lower().str.startswith("home"),
+        # Finished games have a result ("W 110-104"); upcoming ones show a time or nothing
+        "played": raw["Result"].str.strip().str.match(r"^[WL]\s*\d"),
+    }).dropna(subset=["date"])
+
+
+def read_all_schedules(season, schedule_dir=TEAMRANKINGS_SCHEDULE_DIR):
+    """Every saved team schedule in schedule_dir stacked into one frame."""
+    suffix = "_schedule_results.csv"
+    names = os.listdir(schedule_dir) if os.path.isdir(schedule_dir) else []
+    teams = sorted(name[:-len(suffix)] for name in names if name.endswith(suffix))
+    frames = [read_schedule(team, season, schedule_dir) for team in teams]
+    frames = [df for df in frames if df is not None]
+    if not frames:
+        return pd.DataFrame(columns=["team", "date", "opponent", "location", "home", "played"])
+    return pd.concat(frames, ignore_index=True)
+
+
+def build_rest_index(schedules):
+    """Rest features for every team-game, computed over all teams at once.
+
+    Columns: rest_days (full days off before the game; NaN for a team's first game),
+    back_to_back, games_in_4 (games in the 4 days ending with this one), three_in_four,
+    road_trip_game / home_stand_game (position in the current run of road / home games)
+    and travel (the team played its previous game somewhere else).
+    """
+    games = schedules.drop_duplicates(["team", "date"]).sort_values(["team", "date"]).reset_index(drop=True)
+    teams = games["team"].to_numpy()
+    index = np.arange(len(games))
+    first = np.ones(len(games), dtype=bool)
+    first[1:] = teams[1:] != teams[:-1]
+    starts = np.maximum.accumulate(np.where(first, index, 0))
+
+    days = pd.to_datetime(games["date"]).to_numpy().astype("datetime64[D]").astype(np.int64)
+    gap = np.where(first, np.nan, np.diff(days, prepend=days[:1]).astype("float64"))
+    rest_days = gap - 1
+
+    # Games inside [day - 3, day] for the same team: binary search on (team, day) keys
+    team_codes = pd.factorize(teams)[0].astype(np.int64)
+    keys = team_codes * 100_000 + days
+    games_in_4 = index - np.searchsorted(keys, keys - 3, side="left") + 1
+
+    home = games["home"].to_numpy(dtype=bool)
+    road = ~home
+    previous_home = np.roll(home, 1)
+    travel = ~first & (road | (home != previous_home))
+
+    index_frame = games[["team", "date", "opponent", "home"]].copy()
+    index_frame["rest_days"] = rest_days
+    index_frame["back_to_back"] = rest_days == 0
+    index_frame["games_in_4"] = games_in_4
+    index_frame["three_in_four"] = games_in_4 >= 3
+    index_frame["road_trip_game"] = _streak(road, starts)
+    index_frame["home_stand_game"] = _streak(home, starts)
+    index_frame["travel"] = travel
+    return index_frame
+
+
+def _streak(flags, starts):
+    """1-based position within the current run of True flags per team, 0 where the flag is False."""
+    index = np.arange(len(flags))
+    # A run starts at a team's first game or wherever the flag turns on
+    run_start = flags & ((index == starts) | ~np.roll(flags, 1))
+    last_start = np.maximum.accumulate(np.where(run_start, index, 0))
+    return np.where(flags, index - last_start + 1, 0)
+
+
+def rest_index_path(schedule_dir=TEAMRANKINGS_SCHEDULE_DIR):
+    """Where the rest index is saved, next to the schedules it was built from."""
+    return os.path.join(schedule_dir, REST_INDEX_FILE)
+
+
+def refresh_rest_index(season=None, schedule_dir=TEAMRANKINGS_SCHEDULE_DIR, schedules=None):
+    """Rebuild and save the rest index from the saved schedules (or the given per-team schedules). Returns the index.
+
+    schedules can be common.league_schedule.team_schedules() of the league schedule.
+    """
+    start = time.perf_counter()
+    if schedules is None:
+        schedules = read_all_schedules(season or current_season(), schedule_dir)
+    index_frame = build_rest_index(schedules)
+    os.makedirs(schedule_dir, exist_ok=True)
+    index_frame.to_parquet(rest_index_path(schedule_dir), index=False)
+    print(f"Rest index: {len(index_frame)} team-games for {index_frame['team'].nunique()} teams "
+          f"in {time.perf_counter() - start:.2f}s")
+    return index_frame
+
+
+def load_rest_index(schedule_dir=TEAMRANKINGS_SCHEDULE_DIR):
+    """Saved rest index as {(team, date): row dict} for constant-time lookups."""
+    path = rest_index_path(schedule_dir)
+    if not os.path.exists(path):
+        return {}
+    index_frame = pd.read_parquet(path)
+    rows = index_frame.drop(columns=["team", "date"]).to_dict("records")
+    return dict(zip(zip(index_frame["team"], index_frame["date"]), rows))
+
+
+def main():
+    # python -m common.team_schedule [season]
+    refresh_rest_index(int(sys.argv[1]) if len(sys.argv) > 1 else None)
+
+
+if __name__ == "__main__":
+    main()
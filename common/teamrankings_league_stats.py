@@ -0,0 +1,166 @@
+# teamrankings_league_stats.py
+# League-wide TeamRankings stat pages (/nba/stat/<name>, /ncaa-basketball/stat/<name>)
+# Each stat page ranks every team in the league, so one request per stat replaces fetching 30
+# full team pages. The catalog of stats comes from the model inputs in misc/notes (defensive
+# efficiency, opponent points per game, possessions, win % in close games, ...). Pages are
+# fetched concurrently over the shared HTTP session, parsed into one long table (one row per
+# team and stat, with the season, last 3, last 1, home, away and last-season columns) and saved
+# per league; stat_matrix() pivots it into a teams x stats matrix of values or ranks.
+
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+from bs4 import BeautifulSoup
+
+from common import http_client
+from common.paths import LEAGUE_STATS_DIR
+from common.teamrankings_trends import LEAGUE_PATHS, TEAMRANKINGS_URL
+
+# Stat page names fetched by default, per league
+STAT_CATALOG = {
+    "nba": [
+        "defensive-efficiency", "offensive-efficiency", "opponent-points-per-game", "points-per-game",
+        "possessions-per-game", "opponent-shooting-pct", "win-pct-all-games", "win-pct-close-games",
+        "opponent-win-pct-all-games", "opponent-win-pct-close-games",
+    ],
+    "ncaam": [
+        "defensive-efficiency", "offensive-efficiency", "opponent-points-per-game", "points-per-game",
+        "possessions-per-game", "opponent-shooting-pct", "win-pct-all-games", "win-pct-close-games",
+    ],
+}
+
+# Stat page header -> column; the two season headers ("2025", "2024") become value and last_season
+HEADER_COLUMNS = {"Rank": "rank", "Team": "name", "Last 3": "last_3", "Last 1": "last_1", "Home": "home", "Away": "away"}
+
+COLUMNS = ["league", "stat", "team", "name", "rank", "value", "last_3", "last_1", "home", "away", "last_season"]
+
+
+def stat_url(league, stat, day=None):
+    """URL of a league stat page; day (a date) asks for the table as it stood on that day."""
+    url = f"{TEAMRANKINGS_URL}/{LEAGUE_PATHS[league]}/stat/{stat}"
+    return f"{url}?date={day.isoformat()}" if day else url
+
+
+def _number(text):
+    """"115.2", "45.6%", "+3.1" and "--" -> float (None where not a number)."""
+    match = re.match(r"^[-+]?[\d.]+", text.replace(",", "").strip())
+    return float(match.group()) if match else None
+
+
+def parse_stat_page(html, league):
+    """[{name, team, rank, value, last_3, ...}] for every team row of a stat page's table.
+
+    team is the slug from the team link; the cell text is a short name such as "Okla City".
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    table = soup.find("table", class_="tr-table")
+    if table is None:
+        return []
+    headers = [th.text.strip() for th in table.find_all("th")]
+    seasons = [header for header in headers if re.fullmatch(r"\d{4}", header)]
+    columns = [HEADER_COLUMNS.get(header) or ("value" if seasons[:1] == [header] else "last_season")
+               for header in headers]
+    link = re.compile(rf"/{LEAGUE_PATHS[league]}/team/([a-z0-9-]+)")
+
+    rows = []
+    for tr in table.find_all("tr"):
+        cells = tr.find_all("td")
+        if len(cells) != len(columns):
+            continue
+        row = {}
+        for column, cell in zip(columns, cells):
+            text = cell.text.strip()
+            row[column] = text if column == "name" else _number(text)
+        anchor = tr.find("a", href=link)
+        # Rows without a team link keep the displayed name so they still show up in the matrix
+        row["team"] = link.search(anchor["href"]).group(1) if anchor else row.get("name")
+        rows.append(row)
+    return rows
+
+
+def fetch_stat(league, stat, day=None):
+    """One stat page as a DataFrame with COLUMNS, or None if it couldn't be read."""
+    url = stat_url(league, stat, day)
+    start = time.perf_counter()
+    try:
+        response = http_client.get(url)
+    except Exception as e:
+        print(f"Error: Unable to fetch {league} stat {stat} - {e}")
+        return None
+    if response.status_code != 200:
+        print(f"Error: Unable to fetch {league} stat {stat} - Status Code {response.status_code}")
+        return None
+    rows = parse_stat_page(response.text, league)
+    if not rows:
+        print(f"No stat table found for {league} {stat}")
+        return None
+    print(f"Fetched {league} {stat}: {len(rows)} teams in {time.perf_counter() - start:.2f}s")
+    df = pd.DataFrame(rows).assign(league=league, stat=stat).reindex(columns=COLUMNS)
+    numeric = COLUMNS[COLUMNS.index("rank"):]
+    df[numeric] = df[numeric].apply(pd.to_numeric, errors="coerce")
+    return df
+
+
+def stats_path(league, stats_dir=LEAGUE_STATS_DIR):
+    return os.path.join(stats_dir, f"{league}.parquet")
+
+
+def ingest(stats_by_league=None, day=None, workers=16, stats_dir=LEAGUE_STATS_DIR):
+    """Fetch every stat page in {league: [stat names]} (default STAT_CATALOG) as one concurrent job.
+
+    Each league's table is merged into its saved file, replacing the stats that were fetched, and
+    returned as {league: DataFrame}.
+    """
+    stats_by_league = stats_by_league or STAT_CATALOG
+    fetches = [(league, stat) for league, stats in stats_by_league.items() for stat in stats]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as threads:
+        frames = list(threads.map(lambda fetch: fetch_stat(*fetch, day), fetches))
+
+    os.makedirs(stats_dir, exist_ok=True)
+    tables = {}
+    for league in stats_by_league:
+        fetched = [df for (fetch_league, _), df in zip(fetches, frames) if fetch_league == league and df is not None]
+        if not fetched:
+            continue
+        new = pd.concat(fetched, ignore_index=True)
+        path = stats_path(league, stats_dir)
+        if os.path.exists(path):
+            old = pd.read_parquet(path)
+            new = pd.concat([old[~old["stat"].isin(new["stat"])], new], ignore_index=True)
+        new.to_parquet(f"{path}.tmp", index=False)
+        os.replace(f"{path}.tmp", path)
+        tables[league] = new
+
+    fetched = sum(df is not None for df in frames)
+    print(f"Saved {fetched}/{len(fetches)} stat pages in {time.perf_counter() - start:.1f}s")
+    return tables
+
+
+def load_stats(league="nba", stats_dir=LEAGUE_STATS_DIR):
+    """The saved long table for a league (empty frame if nothing has been ingested)."""
+    path = stats_path(league, stats_dir)
+    return pd.read_parquet(path) if os.path.exists(path) else pd.DataFrame(columns=COLUMNS)
+
+
+def stat_matrix(stats, column="value"):
+    """Teams x stats matrix of one column of a long stats table ("value", "rank", "home", ...)."""
+    return stats.pivot_table(index="team", columns="stat", values=column, aggfunc="first")
+
+
+def main():
+    # python -m common.teamrankings_league_stats [nba|ncaam] [stat ...]
+    args = sys.argv[1:]
+    league = args[0] if args and args[0] in LEAGUE_PATHS else "nba"
+    stats = [arg for arg in args if arg != league] or STAT_CATALOG[league]
+    tables = ingest({league: stats})
+    if league in tables:
+        print(stat_matrix(tables[league]).round(1).to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+# teamrankings_player_stats.py
+# League-wide TeamRankings player-stat leaderboards (/nba/player-stat/<stat>)
+# Each leaderboard lists every qualifying player, so the stats the player model uses (points,
+# FG%, minutes, TS%, eFG%, assist/turnover, from misc/notes) cost one request each instead of a
+# browser session per player. Pages are fetched concurrently over the shared HTTP session and
+# saved as one long table (data/player_stats/<league>.parquet); player_table() pivots it into
+# players x stats, and player_stats() looks one player up by name or slug.
+
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+from bs4 import BeautifulSoup
+
+from common import http_client
+from common.paths import PLAYER_STATS_DIR
+from common.team_registry import slugify
+from common.teamrankings_trends import LEAGUE_PATHS, TEAMRANKINGS_URL
+
+# Leaderboard page -> column name in the players x stats table
+PLAYER_STATS = {
+    "points": "pts",
+    "field-goal-percentage": "fg_pct",
+    "minutes-played": "min",
+    "ts-percentage": "ts_pct",
+    "efg-percentage": "efg_pct",
+    "assist-to-turnover-ratio": "ast_to",
+}
+
+# Leaderboard header -> column; the remaining header is the stat value
+HEADER_COLUMNS = {"Rank": "rank", "Player": "player", "Team": "team", "Pos": "position", "Position": "position"}
+
+COLUMNS = ["league", "stat", "slug", "player", "team", "position", "rank", "value"]
+
+
+def leaderboard_url(league, stat):
+    return f"{TEAMRANKINGS_URL}/{LEAGUE_PATHS[league]}/player-stat/{stat}"
+
+
+def parse_leaderboard(html, league):
+    """[{slug, player, team, position, rank, value}] for every row of a leaderboard table.
+
+    slug comes from the player link when there is one, otherwise from the name.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    table = soup.find("table", class_="tr-table")
+    if table is None:
+        return []
+    columns = [HEADER_COLUMNS.get(th.text.strip(), "value") for th in table.find_all("th")]
+    link = re.compile(rf"/{LEAGUE_PATHS[league]}/player/([a-z0-9-]+)")
+
+    rows = []
+    for tr in table.find_all("tr"):
+        cells = tr.find_all("td")
+        if len(cells) != len(columns):
+            continue
+        row = {column: cell.text.strip() for column, cell in zip(columns, cells)}
+        anchor = tr.find("a", href=link)
+        row["slug"] = link.search(anchor["href"]).group(1) if anchor else slugify(row.get("player", ""))
+        rows.append(row)
+    return rows
+
+
+def fetch_leaderboard(league, stat):
+    """One leaderboard as a DataFrame with COLUMNS, or None if it couldn't be read."""
+    start = time.perf_counter()
+    try:
+        response = http_client.get(leaderboard_url(league, stat))
+    except Exception as e:
+        print(f"Error: Unable to fetch {league} player stat {stat} - {e}")
+        return None
+    if response.status_code != 200:
+        print(f"Error: Unable to fetch {league} player stat {stat} - Status Code {response.status_code}")
+        return None
+    rows = parse_leaderboard(response.text, league)
+    if not rows:
+        print(f"No leaderboard table found for {league} {stat}")
+        return None
+    print(f"Fetched {league} {stat}: {len(rows)} players in {time.perf_counter() - start:.2f}s")
+    df = pd.DataFrame(rows).assign(league=league, stat=stat).reindex(columns=COLUMNS)
+    df["rank"] = pd.to_numeric(df["rank"], errors="coerce")
+    df["value"] = pd.to_numeric(df["value"].astype(str).str.replace(",", "").str.rstrip("%"), errors="coerce")
+    return df
+
+
+def stats_path(league, stats_dir=PLAYER_STATS_DIR):
+    return os.path.join(stats_dir, f"{league}.parquet")
+
+
+def ingest(stats=None, league="nba", workers=8, stats_dir=PLAYER_STATS_DIR):
+    """Fetch every leaderboard in stats (default PLAYER_STATS) concurrently and save them.
+
+    The fetched stats replace the same stats in the saved table. Returns the full long table.
+    """
+    stats = list(stats or PLAYER_STATS)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as threads:
+        frames = [df for df in threads.map(lambda stat: fetch_leaderboard(league, stat), stats) if df is not None]
+    table = load_leaderboards(league, stats_dir)
+    if frames:
+        new = pd.concat(frames, ignore_index=True)
+        table = pd.concat([table[~table["stat"].isin(new["stat"])], new], ignore_index=True)
+        os.makedirs(stats_dir, exist_ok=True)
+        path = stats_path(league, stats_dir)
+        table.to_parquet(f"{path}.tmp", index=False)
+        os.replace(f"{path}.tmp", path)
+        _tables.pop(path, None)
+    print(f"Saved {len(frames)}/{len(stats)} leaderboards in {time.perf_counter() - start:.1f}s")
+    return table
+
+
+def load_leaderboards(league="nba", stats_dir=PLAYER_STATS_DIR):
+    """The saved long leaderboard table (empty frame if nothing has been ingested)."""
+    path = stats_path(league, stats_dir)
+    return pd.read_parquet(path) if os.path.exists(path) else pd.DataFrame(columns=COLUMNS)
+
+
+def player_table(leaderboards):
+    """Players x stats: name, team and position, then each stat's value and <stat>_rank column."""
+    if leaderboards.empty:
+        return pd.DataFrame(columns=["player", "team", "position"])
+    leaderboards = leaderboards.assign(column=leaderboards["stat"].map(PLAYER_STATS).fillna(leaderboards["stat"]))
+    values = leaderboards.pivot_table(index="slug", columns="column", values="value", aggfunc="first")
+    ranks = leaderboards.pivot_table(index="slug", columns="column", values="rank", aggfunc="first").add_suffix("_rank")
+    info = leaderboards.groupby("slug")[["player", "team", "position"]].last()
+    return pd.concat([info, values, ranks[sorted(ranks.columns)]], axis=1)
+
+
+# Saved path -> (mtime, players x stats table), so lookups don't re-read the file
+_tables = {}
+
+
+def player_stats(name, league="nba", stats_dir=PLAYER_STATS_DIR):
+    """One player's row of the players x stats table as a dict, by name or slug (None if not listed)."""
+    path = stats_path(league, stats_dir)
+    mtime = os.path.getmtime(path) if os.path.exists(path) else None
+    if path not in _tables or _tables[path][0] != mtime:
+        _tables[path] = (mtime, player_table(load_leaderboards(league, stats_dir)))
+    table = _tables[path][1]
+    slug = slugify(name)
+    if slug not in table.index:
+        # Player links may carry an ID prefix or suffix around the name slug
+        matches = [index for index in table.index if re.search(rf"(^|-){re.escape(slug)}($|-)", index)]
+        if len(matches) != 1:
+            return None
+        slug = matches[0]
+    return {"slug": slug, **table.loc[slug].dropna().to_dict()}
+
+
+def main():
+    # python -m common.teamrankings_player_stats ingest [stat ...]
+    # python -m common.teamrankings_player_stats lookup "Jayson Tatum" [...]
+    command = sys.argv[1] if len(sys.argv) > 1 else "ingest"
+    if command == "ingest":
+        table = player_table(ingest(sys.argv[2:] or None))
+        print(f"{len(table)} players x {len(PLAYER_STATS)} stats")
+    elif command == "lookup":
+        for name in sys.argv[2:]:
+            print(f"{name}: {player_stats(name) or 'not on any saved leaderboard'}")
+    else:
+        print('Usage: python -m common.teamrankings_player_stats <ingest [stat ...]|lookup "<player name>" ...>')
+
+
+if __name__ == "__main__":
+    main()
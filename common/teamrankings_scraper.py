@@ -0,0 +1,198 @@
+# teamrankings_scraper.py
+# One TeamRankings team-page scraper for every league and page type
+# A job is a list of (league, page, team) fetches: ats / ou / win trends, team stats, schedule
+# and roster pages for NBA and NCAAM teams. Leagues differ only in URL prefix, team list and a
+# few column labels, so the per-league, per-page scripts become entries in PAGES and
+# paths.TEAMRANKINGS_OUTPUT_DIRS. Every fetch in a job shares one HTTP thread pool, and pages that need a
+# browser share one DriverPool, so adding teams adds network time instead of scripts and
+# Chrome launches.
+
+import os
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+from bs4 import BeautifulSoup
+
+from common import http_client
+from common.html_tables import extract_tables
+from common.paths import TEAMRANKINGS_OUTPUT_DIRS, TREND_HISTORY_PATH
+from common.teamrankings_trends import (LEAGUE_PATHS, TEAMRANKINGS_URL, TREND_COLUMNS, TREND_FILE_SUFFIXES,
+                                        TREND_PAGES, parse_trends)
+
+# path: URL suffix after /<league>/team/<team>; filename: output file under the page's folder;
+# mode: default fetch mode ("selenium" where the table has only been seen in a rendered page)
+Page = namedtuple("Page", ["path", "parse", "filename", "mode"])
+
+STATS_CATEGORIES = [
+    "Overall Statistics", "Shooting Statistics", "Scoring Statistics", "Rebounding Statistics",
+    "Blocks Statistics", "Steals Statistics", "Turnovers Statistics", "Fouls Statistics",
+]
+
+STATS_COLUMNS = ["Category", "MIN Offense", "Value (rank)", "MIN Defense", "Value (rank)"]
+SCHEDULE_COLUMNS = ["Date", "Opponent", "Result", "Location", "W/L", "Division"]
+ROSTER_COLUMNS = ["Player Name", "Position", "Games Played", "Minutes Played",
+                  "Points", "Rebounds", "Assists", "Steals", "Blocks"]
+
+
+def parse_team_stats(html):
+    """(category, stat, value, opponent stat, value) rows from the tables under each stats heading."""
+    soup = BeautifulSoup(html, "html.parser")
+    rows = []
+    for table in soup.find_all("table"):
+        heading = table.find_previous("h2")
+        category = heading.text.strip() if heading else "Unknown"
+        if category not in STATS_CATEGORIES:
+            continue
+        for tr in table.find_all("tr"):
+            cells = [td.text.strip() for td in tr.find_all("td")]
+            if len(cells) >= 4:
+                stat = cells[0] or "Unnamed Stat"
+                rows.append([category, stat, cells[1], cells[2] or f"Opp {stat}", cells[3]])
+    return rows
+
+
+def parse_schedule(html):
+    """Rows of the first tr-table that looks like the schedule (six or more columns)."""
+    for table in extract_tables(html, table_class="tr-table"):
+        data = [cells[:6] for cells in table if len(cells) >= 6]
+        if data:
+            return data
+    return []
+
+
+def parse_roster(html):
+    """Player rows (first nine columns) of the first tr-table on a roster page."""
+    tables = extract_tables(html, table_class="tr-table")
+    if not tables:
+        return []
+    return [cells[:9] for cells in tables[0] if len(cells) >= 10]
+
+
+PAGES = {
+    **{trend: Page(TREND_PAGES[trend], parse_trends, f"{{team}}/{{team}}_{TREND_FILE_SUFFIXES[trend]}.csv", "http")
+       for trend in TREND_PAGES},
+    "stats": Page("stats", parse_team_stats, "{team}/{team}_stats.csv", "http"),
+    "schedule": Page("", parse_schedule, "{team}_schedule_results.csv", "selenium"),
+    "roster": Page("roster", parse_roster, "{team}_roster.csv", "selenium"),
+}
+
+
+def page_columns(league, page):
+    """Column labels of a page's saved CSV."""
+    if page in TREND_PAGES:
+        return TREND_COLUMNS[(league, page)]
+    return {"stats": STATS_COLUMNS, "schedule": SCHEDULE_COLUMNS, "roster": ROSTER_COLUMNS}[page]
+
+
+def page_url(league, page, team):
+    """TeamRankings URL of a team page, e.g. /ncaa-basketball/team/bradley-braves/ats-trends."""
+    path = PAGES[page].path
+    return f"{TEAMRANKINGS_URL}/{LEAGUE_PATHS[league]}/team/{team}" + (f"/{path}" if path else "")
+
+
+def output_path(league, page, team, output_dirs=TEAMRANKINGS_OUTPUT_DIRS):
+    return os.path.join(output_dirs[(league, page)], PAGES[page].filename.format(team=team))
+
+
+def fetch_page(league, page, team, mode=None, pool=None):
+    """One team page parsed into a DataFrame, or None if it couldn't be read.
+
+    mode defaults to the page's own; mode="selenium" renders through pool (a DriverPool).
+    """
+    url = page_url(league, page, team)
+    mode = mode or PAGES[page].mode
+    start = time.perf_counter()
+    try:
+        if mode == "selenium":
+            html = pool.fetch(url)
+        else:
+            response = http_client.get(url)
+            if response.status_code != 200:
+                print(f"Error: Unable to fetch {league} {page} for {team} - Status Code {response.status_code}")
+                return None
+            html = response.text
+    except Exception as e:
+        # Network errors and browser failures alike just skip this team
+        print(f"Error: Unable to fetch {league} {page} for {team} - {e}")
+        return None
+
+    data = PAGES[page].parse(html)
+    if not data:
+        print(f"No {page} table found for {team} ({mode})")
+        return None
+    print(f"Fetched {league} {page} for {team}: {len(data)} rows in {time.perf_counter() - start:.2f}s")
+    return pd.DataFrame(data, columns=page_columns(league, page))
+
+
+def run_job(fetches, mode=None, workers=16, browsers=4, output_dirs=TEAMRANKINGS_OUTPUT_DIRS,
+            history_path=TREND_HISTORY_PATH):
+    """Fetch and save every (league, page, team) in fetches as one concurrent job.
+
+    HTTP pages run on `workers` threads over the shared session; pages fetched in Selenium mode
+    share `browsers` warm drivers, started only if the job has any. mode overrides every page's
+    default. Saved trend and stats tables are also recorded in the trend history at history_path
+    (None skips it). Returns {(league, page, team): DataFrame} for the fetches that succeeded.
+    """
+    fetches = list(dict.fromkeys(fetches))  # Drop duplicates, keep order
+    by_mode = {}
+    for fetch in fetches:
+        by_mode.setdefault(mode or PAGES[fetch[1]].mode, []).append(fetch)
+
+    start = time.perf_counter()
+    frames = {}
+    if by_mode.get("http"):
+        with ThreadPoolExecutor(max_workers=workers) as threads:
+            results = threads.map(lambda fetch: fetch_page(*fetch, mode="http"), by_mode["http"])
+            frames.update(zip(by_mode["http"], results))
+    if by_mode.get("selenium"):
+        # Imported here so HTTP-only jobs don't need selenium installed
+        from common.driver_pool import DriverPool
+        with DriverPool(size=browsers) as drivers:
+            results = drivers.map(lambda fetch: fetch_page(*fetch, mode="selenium", pool=drivers), by_mode["selenium"])
+        frames.update(zip(by_mode["selenium"], results))
+
+    saved = {}
+    for fetch, df in frames.items():
+        if df is None:
+            continue
+        csv_path = output_path(*fetch, output_dirs=output_dirs)
+        os.makedirs(os.path.dirname(csv_path), exist_ok=True)
+        df.to_csv(csv_path, index=False)
+        saved[fetch] = df
+
+    print(f"Saved {len(saved)}/{len(fetches)} TeamRankings pages in {time.perf_counter() - start:.1f}s")
+
+    if history_path and saved:
+        # Imported here so scrape jobs don't load the warehouse modules until something was saved
+        from common.trend_history import record_snapshot
+        from common.warehouse import find_team_sources
+        saved_paths = {output_path(*fetch, output_dirs=output_dirs) for fetch in saved}
+        sources = {path: source for path, source in find_team_sources(output_dirs).items() if path in saved_paths}
+        if sources:
+            record_snapshot(sources, path=history_path)
+    return saved
+
+
+def scrape(teams_by_league, pages, mode=None, workers=16, browsers=4, output_dirs=TEAMRANKINGS_OUTPUT_DIRS,
+           history_path=TREND_HISTORY_PATH):
+    """Every page type in pages for every team in {league: [team slugs]}, as one job."""
+    fetches = [(league, page, team) for league, teams in teams_by_league.items() for page in pages for team in teams]
+    return run_job(fetches, mode, workers, browsers, output_dirs, history_path)
+
+
+def main():
+    # python -m common.teamrankings_scraper <league> <page[,page...]> <team> [team ...] [--selenium|--http]
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    mode = "selenium" if "--selenium" in sys.argv else "http" if "--http" in sys.argv else None
+    if len(args) < 3:
+        print(f"Usage: python -m common.teamrankings_scraper <{'|'.join(LEAGUE_PATHS)}> "
+              f"<{'|'.join(PAGES)}>[,...] <team-slug> [...] [--selenium|--http]")
+        return
+    scrape({args[0]: args[2:]}, args[1].split(","), mode)
+
+
+if __name__ == "__main__":
+    main()
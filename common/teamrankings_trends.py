@@ -0,0 +1,132 @@
+# teamrankings_trends.py
+# Fetches TeamRankings ATS / over-under / win trend tables over plain HTTP
+# The trend tables (class "tr-table") are rendered on the server, so one GET through the shared
+# session replaces launching Chrome and sleeping for the page. Selenium is still available as an
+# explicit fallback mode (mode="selenium") for when the table stops coming back in the HTML.
+
+import os
+import sys
+import time
+
+import pandas as pd
+import requests
+
+from common import http_client
+from common.html_tables import extract_tables
+from common.paths import TEAMRANKINGS_OUTPUT_DIRS
+
+TEAMRANKINGS_URL = "https://www.teamrankings.com"
+
+# URL prefix per league
+LEAGUE_PATHS = {"nba": "nba", "ncaam": "ncaa-basketball"}
+
+# Page name per trend type
+TREND_PAGES = {"ats": "ats-trends", "ou": "over-under-trends", "win": "win-trends"}
+
+# CSV name suffix per trend type (<team>_<suffix>.csv)
+TREND_FILE_SUFFIXES = {"ats": "ats_trends", "ou": "over_under_trends", "win": "win_trends"}
+
+# Column labels used in the saved CSVs, per league and trend type
+TREND_COLUMNS = {
+    ("nba", "ats"): ["Trend", "ATS Record", "Cover %", "MOV", "ATS +/-"],
+    ("nba", "ou"): ["Trend", "Over/Under Record", "Over/Under %", "MOV", "Over/Under +/-"],
+    ("nba", "win"): ["Trend", "Win Record", "Win %", "MOV", "ATS +/-"],
+    ("ncaam", "ats"): ["Trend", "ATS Record", "Cover %", "MOV", "ATS +/-"],
+    ("ncaam", "ou"): ["Trend", "O/U Record", "Over %", "Avg Total Points", "O/U Margin"],
+    ("ncaam", "win"): ["Trend", "Win Record", "Win %", "Avg Win Margin", "Win +/-"],
+}
+
+def trends_url(team_slug, trend, league="nba"):
+    """TeamRankings URL for a team's trend page (e.g., /nba/team/miami-heat/ats-trends)."""
+    return f"{TEAMRANKINGS_URL}/{LEAGUE_PATHS[league]}/team/{team_slug}/{TREND_PAGES[trend]}"
+
+
+def parse_trends(html, backend=None):
+    """Rows of the first tr-table on a trends page, keeping the first five columns."""
+    tables = extract_tables(html, table_class="tr-table", backend=backend)
+    if not tables:
+        return []
+    return [cells[:5] for cells in tables[0] if len(cells) >= 5]
+
+
+def fetch_trends(team_slug, trend, league="nba", mode="http", pool=None):
+    """Fetch one team's trend table as a DataFrame, or None if it couldn't be read.
+
+    mode="http" reads the table from the server response; mode="selenium" renders the page in
+    Chrome, borrowing a driver from pool (a common.driver_pool.DriverPool) when one is given.
+    """
+    url = trends_url(team_slug, trend, league)
+    start = time.perf_counter()
+    if mode == "selenium":
+        # Imported here so plain HTTP runs don't need selenium installed
+        from common.driver_pool import DriverPool
+        if pool is None:
+            with DriverPool(size=1) as single:
+                html = single.fetch(url)
+        else:
+            html = pool.fetch(url)
+    else:
+        try:
+            response = http_client.get(url)
+        except requests.RequestException as e:
+            print(f"Error: Unable to fetch {trend} trends for {team_slug} - {e}")
+            return None
+        if response.status_code != 200:
+            print(f"Error: Unable to fetch {trend} trends for {team_slug} - Status Code {response.status_code}")
+            return None
+        html = response.text
+
+    data = parse_trends(html)
+    if not data:
+        print(f"No {trend} trends table found for {team_slug} ({mode}). Try mode='selenium' if the page changed.")
+        return None
+
+    print(f"Fetched {trend} trends for {team_slug}: {len(data)} rows in {time.perf_counter() - start:.2f}s")
+    return pd.DataFrame(data, columns=TREND_COLUMNS[(league, trend)])
+
+
+def save_trends(df, team_slug, trend, base_dir):
+    """Write a trend table to <base_dir>/<team>/<team>_<suffix>.csv."""
+    csv_filename = os.path.join(base_dir, team_slug, f"{team_slug}_{TREND_FILE_SUFFIXES[trend]}.csv")
+    os.makedirs(os.path.dirname(csv_filename), exist_ok=True)
+    df.to_csv(csv_filename, index=False)
+    return csv_filename
+
+
+def refresh_trends(teams, trend, base_dir, league="nba", mode="http", workers=8):
+    """Fetch and save one trend table for every team. Returns {team: DataFrame} for the teams that succeeded.
+
+    Runs as a common.teamrankings_scraper job: plain HTTP fetches share `workers` threads, and
+    in Selenium mode the same number of warm headless browsers are shared by all teams.
+    """
+    # Imported here because the scraper builds its page table from this module
+    from common.teamrankings_scraper import run_job
+    saved = run_job([(league, trend, team) for team in teams], mode, workers=workers, browsers=workers,
+                    output_dirs={(league, trend): base_dir})
+    return {team: df for (_, _, team), df in saved.items()}
+
+
+def main():
+    # python -m common.teamrankings_trends <ats|ou|win|all> [team-slug ...] [nba|ncaam] [--selenium]
+    # Saves to the repo's trend folders (common.paths.TEAMRANKINGS_OUTPUT_DIRS); every team when none is given
+    args = [arg for arg in sys.argv[1:] if arg != "--selenium"]
+    mode = "selenium" if "--selenium" in sys.argv else "http"
+    if not args or args[0] not in list(TREND_PAGES) + ["all"]:
+        print("Usage: python -m common.teamrankings_trends <ats|ou|win|all> [team-slug ...] [nba|ncaam] [--selenium]")
+        return
+    # Imported here: team_registry reads LEAGUE_PATHS from this module
+    from common.team_registry import load_registry
+    league = next((arg for arg in args[1:] if arg in LEAGUE_PATHS), "nba")
+    teams = [arg for arg in args[1:] if arg not in LEAGUE_PATHS] or load_registry(league).teamrankings_slugs()
+    if not teams:
+        print(f"No {league} teams known; pass team slugs or refresh the registry (python -m common.team_registry {league})")
+        return
+    for trend in list(TREND_PAGES) if args[0] == "all" else [args[0]]:
+        saved = refresh_trends(teams, trend, TEAMRANKINGS_OUTPUT_DIRS[(league, trend)], league, mode)
+        print(f"Saved {trend} trends for {len(saved)}/{len(teams)} {league} teams")
+        if len(teams) == 1 and saved:
+            print(next(iter(saved.values())).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+# trend_history.py
+# Daily, append-only version history of the TeamRankings trend and team stats tables
+# The trend CSVs and *_stats.csv are overwritten by every scrape, so how a situation such as
+# "As Home Underdog" moved over the season was lost. Each snapshot compares the saved tables with
+# the latest stored version of every row and writes only the rows that changed, tagged with the
+# day (valid_from); rows that disappear get a removed marker. A second snapshot the same day
+# replaces that day's version, so there is at most one version per team per day.
+# The primary keys end in valid_from, so the history of one team's situation, or of one situation
+# across the league, is a single index range scan, and as_of(day) rebuilds the tables as they
+# were on any day.
+
+import os
+import sqlite3
+import sys
+import time
+from datetime import date
+
+import pandas as pd
+
+from common.paths import TEAMRANKINGS_OUTPUT_DIRS, TREND_HISTORY_PATH
+from common.warehouse import _rows, add_columns, find_team_sources, load_tables
+
+# table -> (versions table, key columns, snapshot group columns, value columns)
+# A stat name such as "Points per Game" can appear under several categories, so category is part of the key
+VERSIONED = {
+    "team_trends": ("trend_versions", ["league", "team", "trend_type", "trend"], ["league", "team", "trend_type"],
+                    ["record", "wins", "losses", "pushes", "pct", "mov", "under_pct", "avg_total", "plus_minus"]),
+    "team_stats": ("stat_versions", ["league", "team", "category", "stat"], ["league", "team"],
+                   ["value", "rank", "opp_stat", "opp_value", "opp_rank"]),
+}
+
+# Value columns compared as text; the rest are compared as numbers
+TEXT_COLUMNS = {"record", "opp_stat"}
+
+STAT_VERSIONS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS stat_versions (
+    league TEXT NOT NULL,
+    team TEXT NOT NULL,
+    category TEXT NOT NULL,
+    stat TEXT NOT NULL,
+    valid_from TEXT NOT NULL,
+    removed INTEGER NOT NULL DEFAULT 0,
+    value REAL,
+    rank INTEGER,
+    opp_stat TEXT,
+    opp_value REAL,
+    opp_rank INTEGER,
+    PRIMARY KEY (league, team, category, stat, valid_from)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS stat_versions_stat ON stat_versions (league, stat, valid_from);
+"""
+
+SCHEMA = STAT_VERSIONS_SCHEMA + """
+CREATE TABLE IF NOT EXISTS trend_versions (
+    league TEXT NOT NULL,
+    team TEXT NOT NULL,
+    trend_type TEXT NOT NULL,
+    trend TEXT NOT NULL,
+    valid_from TEXT NOT NULL,
+    removed INTEGER NOT NULL DEFAULT 0,
+    record TEXT,
+    wins INTEGER,
+    losses INTEGER,
+    pushes INTEGER,
+    pct REAL,
+    mov REAL,
+    under_pct REAL,
+    avg_total REAL,
+    plus_minus REAL,
+    PRIMARY KEY (league, team, trend_type, trend, valid_from)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS trend_versions_trend ON trend_versions (league, trend_type, trend, valid_from);
+CREATE TABLE IF NOT EXISTS snapshots (
+    league TEXT NOT NULL,
+    team TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    day TEXT NOT NULL,
+    rows INTEGER NOT NULL,
+    changed INTEGER NOT NULL,
+    PRIMARY KEY (league, team, kind, day)
+) WITHOUT ROWID;
+"""
+
+
+def connect(path=TREND_HISTORY_PATH):
+    """Open (creating if needed) the history database."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    with conn:
+        add_columns(conn, {"trend_versions": [("under_pct", "REAL"), ("avg_total", "REAL")]})
+    _key_stats_by_category(conn)
+    return conn
+
+
+def _key_stats_by_category(conn):
+    """Rebuild a stat_versions table created without category in its primary key."""
+    primary_key = {row[1]: row[5] for row in conn.execute("PRAGMA table_info(stat_versions)")}
+    if primary_key.get("category"):
+        return
+    columns = ", ".join(["league", "team", "stat", "valid_from", "removed"] + VERSIONED["team_stats"][3])
+    conn.executescript(f"""
+        BEGIN;
+        ALTER TABLE stat_versions RENAME TO stat_versions_old;
+        DROP INDEX IF EXISTS stat_versions_stat;
+        {STAT_VERSIONS_SCHEMA}
+        INSERT INTO stat_versions (category, {columns})
+            SELECT COALESCE(category, ''), {columns} FROM stat_versions_old;
+        DROP TABLE stat_versions_old;
+        COMMIT;
+    """)
+
+
+def _latest(conn, versions, keys, group_keys, columns, groups, before):
+    """Latest version before day of every row in the given (league, team[, trend_type]) groups."""
+    where = " AND ".join(f"{key} = ?" for key in group_keys)
+    sql = (f"SELECT {', '.join(keys + ['removed'] + columns)} FROM ("
+           f"SELECT *, ROW_NUMBER() OVER (PARTITION BY {', '.join(keys)} ORDER BY valid_from DESC) AS version "
+           f"FROM {versions} WHERE {where} AND valid_from < ?) WHERE version = 1")
+    frames = [pd.read_sql_query(sql, conn, params=list(group) + [before]) for group in groups]
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=keys + ["removed"] + columns)
+
+
+def _changes(current, previous, keys, columns):
+    """Rows of current that are new or differ from previous, plus removed markers for rows that are gone."""
+    previous = previous[previous["removed"] == 0]
+    merged = current.merge(previous, on=keys, how="outer", suffixes=("", "_old"), indicator=True)
+    changed = merged["_merge"] == "left_only"
+    for column in columns:
+        new, old = merged[column], merged[f"{column}_old"]
+        if column in TEXT_COLUMNS:
+            differs = new.fillna("").astype(str) != old.fillna("").astype(str)
+        else:
+            # Numbers read back from SQLite may be int where the parsed CSV is float; NaN == NaN is unchanged
+            new, old = pd.to_numeric(new, errors="coerce"), pd.to_numeric(old, errors="coerce")
+            differs = (new != old) & ~(new.isna() & old.isna())
+        changed |= (merged["_merge"] == "both") & differs
+    rows = merged.loc[changed, keys + columns].assign(removed=0)
+    gone = merged.loc[merged["_merge"] == "right_only", keys].assign(removed=1)
+    return pd.concat([rows, gone], ignore_index=True)
+
+
+def record_snapshot(sources=None, day=None, path=TREND_HISTORY_PATH, output_dirs=TEAMRANKINGS_OUTPUT_DIRS):
+    """Store today's (or day's) version of the saved trend and stats tables. Returns the number of rows written.
+
+    sources ({path: (table, tags)} from warehouse.find_team_sources) limits the snapshot to those
+    files; by default every saved trend and stats file is read.
+    """
+    day = (day or date.today()).isoformat()
+    sources = find_team_sources(output_dirs) if sources is None else sources
+    start = time.perf_counter()
+    tables = load_tables(list(sources), sources)
+    conn = connect(path)
+    written = 0
+    with conn:
+        for table, current in tables.items():
+            versions, keys, group_keys, columns = VERSIONED[table]
+            # Key columns can't be NULL (stats files without a category column)
+            current = current.assign(**{key: current[key].fillna("") for key in keys})
+            current = current.drop_duplicates(keys, keep="first")[keys + columns]
+            groups = list(current[group_keys].drop_duplicates().itertuples(index=False, name=None))
+            previous = _latest(conn, versions, keys, group_keys, columns, groups, day)
+            changes = _changes(current, previous, keys, columns)
+
+            where = " AND ".join(f"{key} = ?" for key in group_keys)
+            # A re-run the same day replaces that day's version
+            conn.executemany(f"DELETE FROM {versions} WHERE {where} AND valid_from = ?",
+                             [group + (day,) for group in groups])
+            insert_columns = keys + ["valid_from", "removed"] + columns
+            conn.executemany(f"INSERT INTO {versions} ({', '.join(insert_columns)}) "
+                             f"VALUES ({', '.join('?' * len(insert_columns))})",
+                             _rows(changes.assign(valid_from=day)[insert_columns]))
+
+            rows = current.groupby(group_keys).size()
+            changed = changes.groupby(group_keys).size().reindex(rows.index, fill_value=0)
+            # kind is the trend type (ats / ou / win) or "stats"
+            conn.executemany("INSERT OR REPLACE INTO snapshots (league, team, kind, day, rows, changed) "
+                             "VALUES (?, ?, ?, ?, ?, ?)",
+                             [(group[0], group[1], group[2] if len(group) > 2 else "stats", day,
+                               int(rows[group]), int(changed[group])) for group in rows.index])
+            written += len(changes)
+    conn.close()
+    print(f"Trend history {day}: {written} changed rows from {len(sources)} files in {time.perf_counter() - start:.2f}s")
+    return written
+
+
+def as_of(table="team_trends", day=None, league="nba", team=None, path=TREND_HISTORY_PATH):
+    """The trend (or stats) table as it was on day (default today): the latest version of each row."""
+    versions, keys, _, columns = VERSIONED[table]
+    where, params = ["league = ?", "valid_from <= ?"], [league, (day or date.today()).isoformat()]
+    if team is not None:
+        where.append("team = ?")
+        params.append(team)
+    sql = (f"SELECT {', '.join(keys + ['valid_from'] + columns)} FROM ("
+           f"SELECT *, ROW_NUMBER() OVER (PARTITION BY {', '.join(keys)} ORDER BY valid_from DESC) AS version "
+           f"FROM {versions} WHERE {' AND '.join(where)}) WHERE version = 1 AND removed = 0 "
+           f"ORDER BY {', '.join(keys)}")
+    conn = connect(path)
+    try:
+        return pd.read_sql_query(sql, conn, params=params)
+    finally:
+        conn.close()
+
+
+def trend_history(trend, trend_type="ats", team=None, league="nba", path=TREND_HISTORY_PATH):
+    """Every stored version of one situation, for one team or (team=None) the whole league, by date.
+
+    Each row holds the values from valid_from until the next row for the same team.
+    """
+    params = [league, trend_type, trend]
+    columns = ", ".join(["team", "valid_from", "removed"] + VERSIONED["team_trends"][3])
+    if team is None:
+        sql = (f"SELECT {columns} FROM trend_versions WHERE league = ? AND trend_type = ? AND trend = ? "
+               "ORDER BY valid_from, team")
+    else:
+        sql = (f"SELECT {columns} FROM trend_versions WHERE league = ? AND team = ? AND trend_type = ? AND trend = ? "
+               "ORDER BY valid_from")
+        params.insert(1, team)
+    conn = connect(path)
+    try:
+        return pd.read_sql_query(sql, conn, params=params)
+    finally:
+        conn.close()
+
+
+def main():
+    # python -m common.trend_history snapshot
+    # python -m common.trend_history history "<trend>" [ats|ou|win] [team]
+    # python -m common.trend_history asof <YYYY-MM-DD> [team]
+    command = sys.argv[1] if len(sys.argv) > 1 else "snapshot"
+    if command == "snapshot":
+        record_snapshot()
+    elif command == "history" and len(sys.argv) > 2:
+        trend_type = sys.argv[3] if len(sys.argv) > 3 else "ats"
+        print(trend_history(sys.argv[2], trend_type, sys.argv[4] if len(sys.argv) > 4 else None).to_string(index=False))
+    elif command == "asof" and len(sys.argv) > 2:
+        day = date.fromisoformat(sys.argv[2])
+        print(as_of(day=day, team=sys.argv[3] if len(sys.argv) > 3 else None).to_string(index=False))
+    else:
+        print('Usage: python -m common.trend_history <snapshot|history "<trend>" [ats|ou|win] [team]|asof <date> [team]>')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,471 @@
+# warehouse.py
+# One embedded SQLite warehouse over every scraped table
+# Players and their game logs and splits (ESPN nba_teams/<team>/<player>/*.csv), the TeamRankings
+# ATS / O/U / win trends and team stats (CSV, or the older .xlsx where no CSV was saved) for
+# every league are loaded into indexed tables:
+#   players       one row per player folder, keyed by ESPN player ID
+#   player_games  one typed row per player game log line
+#   games         one row per team game (team, date), rebuilt from player_games; team is the team
+#                 actually played for and preseason games are left out
+#   splits        one typed row per player split line
+#   team_trends   one row per (league, team, trend type, situation)
+#   team_stats    one row per (league, team, stat) with value and rank for the team and its opponents
+# Every row remembers the file it came from and each file's size and mtime are stored, so a
+# rebuild only re-reads the files that changed. Questions like "every player's PTS vs BOS on the
+# road" become one indexed query instead of a walk over hundreds of CSVs.
+
+import os
+import sqlite3
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from common.espn_gamelog import EXPECTED_HEADERS as GAMELOG_HEADERS
+from common.espn_splits import EXPECTED_HEADERS as SPLIT_HEADERS
+from common.espn_splits import player_folder_name, read_team_rosters
+from common.gamelog_store import SCHEMA as GAMELOG_SCHEMA
+from common.gamelog_store import current_season, schedule_sides, typed_gamelog
+from common.paths import ESPN_TEAMS_DIR, TEAMRANKINGS_OUTPUT_DIRS, WAREHOUSE_PATH
+from common.team_registry import SPLIT_ABBREVIATIONS
+from common.teamrankings_trends import TREND_FILE_SUFFIXES
+
+# player_games stat columns, as in the game-log store
+GAME_STATS = GAMELOG_SCHEMA.names[GAMELOG_SCHEMA.names.index("min"):]
+
+# splits stat columns: "9.0-20.3" pairs are split into made / attempted averages
+SPLIT_STATS = {
+    "GP": ["gp"], "MIN": ["min"], "FG": ["fgm", "fga"], "FG%": ["fg_pct"], "3PT": ["fg3m", "fg3a"],
+    "3P%": ["fg3_pct"], "FT": ["ftm", "fta"], "FT%": ["ft_pct"], "OR": ["oreb"], "DR": ["dreb"],
+    "REB": ["reb"], "AST": ["ast"], "BLK": ["blk"], "STL": ["stl"], "PF": ["pf"], "TO": ["tov"], "PTS": ["pts"],
+}
+SPLIT_COLUMNS = [column for header in SPLIT_HEADERS[1:] for column in SPLIT_STATS[header]]
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS sources (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    loaded_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS players (
+    player_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    team TEXT NOT NULL,
+    folder TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS players_team ON players (team);
+CREATE TABLE IF NOT EXISTS player_games (
+    source TEXT NOT NULL,
+    player_id TEXT NOT NULL,
+    team TEXT NOT NULL,
+    season INTEGER NOT NULL,
+    date TEXT,
+    season_type TEXT,
+    played_for TEXT,
+    home INTEGER,
+    opponent TEXT,
+    win INTEGER,
+    team_score INTEGER,
+    opp_score INTEGER,
+    margin INTEGER,
+    overtimes INTEGER,
+    {", ".join(f"{column} REAL" for column in GAME_STATS)}
+);
+CREATE INDEX IF NOT EXISTS player_games_source ON player_games (source);
+CREATE INDEX IF NOT EXISTS player_games_opponent ON player_games (opponent, home);
+CREATE INDEX IF NOT EXISTS player_games_player ON player_games (player_id, date);
+CREATE INDEX IF NOT EXISTS player_games_team ON player_games (team, date);
+CREATE TABLE IF NOT EXISTS games (
+    team TEXT NOT NULL,
+    date TEXT NOT NULL,
+    season INTEGER NOT NULL,
+    season_type TEXT,
+    home INTEGER,
+    opponent TEXT,
+    win INTEGER,
+    team_score INTEGER,
+    opp_score INTEGER,
+    margin INTEGER,
+    overtimes INTEGER,
+    PRIMARY KEY (team, date)
+);
+CREATE INDEX IF NOT EXISTS games_opponent ON games (opponent, date);
+CREATE TABLE IF NOT EXISTS splits (
+    source TEXT NOT NULL,
+    player_id TEXT NOT NULL,
+    team TEXT NOT NULL,
+    split TEXT NOT NULL,
+    {", ".join(f"{column} REAL" for column in SPLIT_COLUMNS)}
+);
+CREATE INDEX IF NOT EXISTS splits_source ON splits (source);
+CREATE INDEX IF NOT EXISTS splits_split ON splits (split, player_id);
+CREATE INDEX IF NOT EXISTS splits_player ON splits (player_id, split);
+CREATE TABLE IF NOT EXISTS team_trends (
+    source TEXT NOT NULL,
+    league TEXT NOT NULL,
+    team TEXT NOT NULL,
+    trend_type TEXT NOT NULL,
+    trend TEXT NOT NULL,
+    record TEXT,
+    wins INTEGER,
+    losses INTEGER,
+    pushes INTEGER,
+    pct REAL,
+    mov REAL,
+    under_pct REAL,
+    avg_total REAL,
+    plus_minus REAL
+);
+CREATE INDEX IF NOT EXISTS team_trends_source ON team_trends (source);
+CREATE INDEX IF NOT EXISTS team_trends_trend ON team_trends (league, trend_type, trend);
+CREATE INDEX IF NOT EXISTS team_trends_team ON team_trends (league, team, trend_type);
+CREATE TABLE IF NOT EXISTS team_stats (
+    source TEXT NOT NULL,
+    league TEXT NOT NULL,
+    team TEXT NOT NULL,
+    category TEXT,
+    stat TEXT NOT NULL,
+    value REAL,
+    rank INTEGER,
+    opp_stat TEXT,
+    opp_value REAL,
+    opp_rank INTEGER
+);
+CREATE INDEX IF NOT EXISTS team_stats_source ON team_stats (source);
+CREATE INDEX IF NOT EXISTS team_stats_stat ON team_stats (league, stat);
+CREATE INDEX IF NOT EXISTS team_stats_team ON team_stats (league, team);
+"""
+
+# Tables whose rows are replaced per source file
+SOURCE_TABLES = ["player_games", "splits", "team_trends", "team_stats"]
+
+# Expected headers of the ESPN CSVs (missing columns are read as "N/A")
+RAW_HEADERS = {"player_games": GAMELOG_HEADERS, "splits": SPLIT_HEADERS}
+
+# Positional column names for the TeamRankings tables, whose headers differ by league and team
+SOURCE_COLUMNS = {
+    "team_trends": ["trend", "record", "pct", "mov", "plus_minus"],
+    "team_stats": ["category", "stat", "value", "opp_stat", "opp_value"],
+}
+
+# Trend pages whose fourth column isn't a margin: the NBA O/U page shows Under %, the NCAAM one the
+# average total (the NCAAM win page's average win margin is stored as mov)
+TREND_SOURCE_COLUMNS = {
+    ("nba", "ou"): ["trend", "record", "pct", "under_pct", "plus_minus"],
+    ("ncaam", "ou"): ["trend", "record", "pct", "avg_total", "plus_minus"],
+}
+
+# Columns added since the first release: table -> [(column, type)], added to older databases on connect
+ADDED_COLUMNS = {
+    "player_games": [("season_type", "TEXT"), ("played_for", "TEXT")],
+    "games": [("season_type", "TEXT")],
+    "team_trends": [("under_pct", "REAL"), ("avg_total", "REAL")],
+}
+
+
+def add_columns(conn, added_columns):
+    """Add missing columns to tables created by an older schema. Returns the tables that changed."""
+    changed = []
+    for table, columns in added_columns.items():
+        existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        for column, column_type in columns:
+            if column not in existing:
+                conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+                changed.append(table)
+    return changed
+
+
+def connect(path=WAREHOUSE_PATH):
+    """Open (creating if needed) the warehouse."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    with conn:
+        # Files loaded before a table gained columns are reloaded by the next build. Their rows go
+        # too, so a file that was moved or deleted in the meantime doesn't leave them behind
+        for table in set(add_columns(conn, ADDED_COLUMNS)) & set(SOURCE_TABLES):
+            conn.execute(f"DELETE FROM sources WHERE path IN (SELECT DISTINCT source FROM {table})")
+            conn.execute(f"DELETE FROM {table}")
+    return conn
+
+
+def _number(series):
+    """"44.2", "83.5%", "+12.2" and "N/A" -> floats (NaN where not a number)."""
+    return pd.to_numeric(series.astype(str).str.replace(",", "").str.rstrip("%"), errors="coerce")
+
+
+def _rows(df):
+    """DataFrame rows as tuples with NaN/NA turned into NULL."""
+    return list(df.astype(object).where(df.notna(), None).itertuples(index=False, name=None))
+
+
+def read_source(path, columns=None):
+    """A saved CSV (or .xlsx) as strings; columns renames the leading columns by position."""
+    if path.endswith(".xlsx"):
+        raw = pd.read_excel(path, dtype=str).fillna("")
+    else:
+        raw = pd.read_csv(path, dtype=str, keep_default_na=False)
+    if columns is not None:
+        # Trend and stats headers vary by league and carry the team abbreviation ("MIN Offense")
+        raw = raw.iloc[:, :len(columns)]
+        raw.columns = columns[:raw.shape[1]]
+        raw = raw.reindex(columns=columns, fill_value="")
+    return raw
+
+
+def parse_player_games(raw, season, sides=None):
+    """Typed player_games rows from concatenated game-log CSV rows (with source/team/player_id columns).
+
+    sides (gamelog_store.schedule_sides()) fills season_type and played_for.
+    """
+    raw = raw.reset_index(drop=True)
+    games = typed_gamelog(raw[GAMELOG_HEADERS].values.tolist(), season, None, sides=sides)
+    # Opponents spelled as on the splits pages (PHO, not PHX), so both tables filter alike
+    games["opponent"] = games["opponent"].replace(SPLIT_ABBREVIATIONS)
+    games["date"] = games["date"].astype(str).where(games["date"].notna())
+    games = games.assign(source=raw["source"], player_id=raw["player_id"], team=raw["team"], season=season)
+    return games[["source", "player_id", "team", "season"] + GAMELOG_SCHEMA.names[2:]]
+
+
+def parse_splits(raw):
+    """Typed splits rows from concatenated split CSV rows."""
+    splits = raw[["source", "player_id", "team"]].assign(split=raw["SPLIT"])
+    for header, columns in SPLIT_STATS.items():
+        if len(columns) == 2:
+            pair = raw[header].str.extract(r"^([\d.]+)-([\d.]+)$")
+            splits[columns[0]] = pd.to_numeric(pair[0], errors="coerce")
+            splits[columns[1]] = pd.to_numeric(pair[1], errors="coerce")
+        else:
+            splits[columns[0]] = _number(raw[header])
+    return splits
+
+
+def parse_team_trends(raw):
+    """team_trends rows from concatenated trend CSV rows (columns SOURCE_COLUMNS / TREND_SOURCE_COLUMNS).
+
+    The five columns are positional: situation, record, percentage, a fourth column that depends on
+    the page (margin, Under % or average total) and +/-.
+    """
+    record = raw["record"].str.extract(r"^(\d+)-(\d+)-?(\d*)$").apply(pd.to_numeric, errors="coerce")
+    optional = lambda column: _number(raw[column]) if column in raw else np.nan
+    return pd.DataFrame({
+        "source": raw["source"], "league": raw["league"], "team": raw["team"], "trend_type": raw["trend_type"],
+        "trend": raw["trend"], "record": raw["record"], "wins": record[0], "losses": record[1],
+        "pushes": record[2].fillna(0), "pct": _number(raw["pct"]), "mov": optional("mov"),
+        "under_pct": optional("under_pct"), "avg_total": optional("avg_total"), "plus_minus": _number(raw["plus_minus"]),
+    })
+
+
+def parse_team_stats(raw):
+    """team_stats rows from concatenated stats rows; "112.8 (#19)" becomes value 112.8, rank 19."""
+    value = raw["value"].str.extract(r"^\s*([-+\d.,%]+)\s*(?:\(#(\d+)\))?")
+    opp_value = raw["opp_value"].str.extract(r"^\s*([-+\d.,%]+)\s*(?:\(#(\d+)\))?")
+    return pd.DataFrame({
+        "source": raw["source"], "league": raw["league"], "team": raw["team"], "category": raw["category"],
+        "stat": raw["stat"], "value": _number(value[0]), "rank": pd.to_numeric(value[1], errors="coerce"),
+        "opp_stat": raw["opp_stat"], "opp_value": _number(opp_value[0]),
+        "opp_rank": pd.to_numeric(opp_value[1], errors="coerce"),
+    })
+
+
+def _team_folders(base_dir):
+    if not os.path.isdir(base_dir):
+        return []
+    return [team for team in sorted(os.listdir(base_dir)) if os.path.isdir(os.path.join(base_dir, team))]
+
+
+def find_team_sources(output_dirs=TEAMRANKINGS_OUTPUT_DIRS):
+    """Every saved TeamRankings trend and team stats file: {path: (table, {column: value})}."""
+    sources = {}
+    for (league, page), base_dir in output_dirs.items():
+        if page != "stats" and page not in TREND_FILE_SUFFIXES:
+            continue
+        for team in _team_folders(base_dir):
+            if page == "stats":
+                path = os.path.join(base_dir, team, f"{team}_stats.csv")
+                if not os.path.exists(path):
+                    path = os.path.join(base_dir, team, f"{team}_stats.xlsx")
+                sources[path] = ("team_stats", {"league": league, "team": team})
+            else:
+                path = os.path.join(base_dir, team, f"{team}_{TREND_FILE_SUFFIXES[page]}.csv")
+                sources[path] = ("team_trends", {"league": league, "team": team, "trend_type": page})
+    return {path: source for path, source in sources.items() if os.path.exists(path)}
+
+
+def find_sources(espn_dir=ESPN_TEAMS_DIR, output_dirs=TEAMRANKINGS_OUTPUT_DIRS):
+    """Every file the warehouse ingests and the players found in the ESPN folders.
+
+    Returns ({path: (table, {column: value} tagged onto the file's rows)}, [(player_id, name, team, folder)]).
+    """
+    sources = {}
+    players = []
+    rosters = read_team_rosters(espn_dir)
+    for team in _team_folders(espn_dir):
+        known = {player_folder_name(p["name"]): p for p in rosters.get(team, [])}
+        for folder in _team_folders(os.path.join(espn_dir, team)):
+            player = known.get(folder, {"name": folder.replace("_", " ").title(), "id": None})
+            # Players missing from the roster CSV get a folder-based ID so their rows still join
+            player_id = player["id"] or f"{team}/{folder}"
+            players.append((player_id, player["name"], team, folder))
+            for table, suffix in [("player_games", "gamelog"), ("splits", "splits")]:
+                path = os.path.join(espn_dir, team, folder, f"{folder}_{suffix}.csv")
+                if os.path.exists(path):
+                    sources[path] = (table, {"team": team, "player_id": player_id})
+    sources.update(find_team_sources(output_dirs))
+    return sources, players
+
+
+def load_tables(paths, sources, season=None):
+    """Read and parse the given source files, one vectorised pass per table: {table: DataFrame}."""
+    raw_by_table = {}
+    for path in paths:
+        table, tags = sources[path]
+        columns = SOURCE_COLUMNS.get(table)
+        if table == "team_trends":
+            columns = TREND_SOURCE_COLUMNS.get((tags["league"], tags["trend_type"]), columns)
+        try:
+            raw = read_source(path, columns)
+        except Exception as e:
+            # A malformed file is skipped instead of failing the build
+            print(f"Error: Unable to read {path} - {e}")
+            continue
+        if table in RAW_HEADERS:
+            raw = raw.reindex(columns=RAW_HEADERS[table], fill_value="N/A")
+        raw_by_table.setdefault(table, []).append((raw, {"source": path, **tags}))
+
+    season = season or current_season()
+    parsers = {"player_games": lambda raw: parse_player_games(raw, season, schedule_sides(season)),
+               "splits": parse_splits, "team_trends": parse_team_trends, "team_stats": parse_team_stats}
+    tables = {}
+    for table, frames in raw_by_table.items():
+        raw = pd.concat([frame for frame, _ in frames], ignore_index=True)
+        # Tag columns are repeated per file after the concat; assigning them per file costs more than the read
+        lengths = [len(frame) for frame, _ in frames]
+        for key in frames[0][1]:
+            raw[key] = np.repeat([file_tags[key] for _, file_tags in frames], lengths)
+        tables[table] = parsers[table](raw)
+    return tables
+
+
+def rebuild_games(conn):
+    """Replace games with one row per (team, date) from player_games.
+
+    Rows are grouped by played_for (the team the player was on that day, per the league schedule),
+    so a traded player's old games stay with their old team; rows the schedule couldn't place and
+    preseason games are left out. Each game is copied whole from one player row with a result.
+    """
+    conn.execute("DELETE FROM games")
+    conn.execute("""
+        INSERT INTO games (team, date, season, season_type, home, opponent, win, team_score, opp_score, margin, overtimes)
+        SELECT played_for, date, season, season_type, home, opponent, win, team_score, opp_score, margin, overtimes
+        FROM (
+            SELECT *, ROW_NUMBER() OVER (PARTITION BY played_for, date ORDER BY team_score IS NULL, rowid) AS n
+            FROM player_games
+            WHERE date IS NOT NULL AND played_for IS NOT NULL AND season_type != 'preseason'
+        ) WHERE n = 1
+    """)
+
+
+def build(path=WAREHOUSE_PATH, espn_dir=ESPN_TEAMS_DIR, output_dirs=TEAMRANKINGS_OUTPUT_DIRS, season=None, full=False):
+    """Load every new or changed source file into the warehouse and drop rows of deleted files.
+
+    Game-log dates have no year, so they are placed in season (default: the current one).
+    full=True reloads every file. Returns the number of files (re)loaded.
+    """
+    season = season or current_season()
+    start = time.perf_counter()
+    sources, players = find_sources(espn_dir, output_dirs)
+    conn = connect(path)
+    with conn:
+        if full:
+            for table in SOURCE_TABLES + ["sources"]:
+                conn.execute(f"DELETE FROM {table}")
+        known = {row[0]: (row[1], row[2]) for row in conn.execute("SELECT path, size, mtime_ns FROM sources")}
+
+        removed = [source for source in known if source not in sources]
+        changed = {}
+        for source in sources:
+            stat = os.stat(source)
+            if known.get(source) != (stat.st_size, stat.st_mtime_ns):
+                changed[source] = stat
+
+        for source in removed + list(changed):
+            for table in SOURCE_TABLES:
+                conn.execute(f"DELETE FROM {table} WHERE source = ?", (source,))
+            conn.execute("DELETE FROM sources WHERE path = ?", (source,))
+
+        for table, df in load_tables(changed, sources, season).items():
+            conn.executemany(f"INSERT INTO {table} ({', '.join(df.columns)}) VALUES ({', '.join('?' * len(df.columns))})",
+                             _rows(df))
+        conn.executemany("INSERT INTO sources (path, size, mtime_ns, loaded_at) VALUES (?, ?, ?, ?)",
+                         [(source, stat.st_size, stat.st_mtime_ns, time.time()) for source, stat in changed.items()])
+
+        conn.execute("DELETE FROM players")
+        conn.executemany("INSERT OR REPLACE INTO players (player_id, name, team, folder) VALUES (?, ?, ?, ?)", players)
+        if changed or removed:
+            rebuild_games(conn)
+    conn.execute("ANALYZE")
+    conn.close()
+    print(f"Warehouse: loaded {len(changed)} changed files, dropped {len(removed)} removed, "
+          f"{len(sources) - len(changed)} unchanged in {time.perf_counter() - start:.2f}s")
+    return len(changed)
+
+
+def query(sql, params=(), path=WAREHOUSE_PATH):
+    """Run a SELECT against the warehouse and return a DataFrame."""
+    conn = connect(path)
+    try:
+        return pd.read_sql_query(sql, conn, params=params)
+    finally:
+        conn.close()
+
+
+def vs_opponent(opponent, home=None, stats=("pts",), path=WAREHOUSE_PATH):
+    """Every player's games and per-game averages of stats against one opponent.
+
+    opponent is an abbreviation (either spelling, e.g. PHX or PHO); home=True/False keeps only
+    home or road games. Only regular-season games count.
+    """
+    unknown = [stat for stat in stats if stat not in GAME_STATS]
+    if unknown:
+        raise ValueError(f"Unknown stats {unknown}; choose from {GAME_STATS}")
+    sql = (
+        "SELECT p.name AS player, g.team, COUNT(*) AS games, "
+        + ", ".join(f"ROUND(AVG(g.{stat}), 1) AS {stat}" for stat in stats)
+        + " FROM player_games g JOIN players p ON p.player_id = g.player_id"
+        " WHERE g.opponent = ? AND g.min > 0 AND COALESCE(g.season_type, 'regular') = 'regular'"
+    )
+    params = [SPLIT_ABBREVIATIONS.get(opponent.upper(), opponent.upper())]
+    if home is not None:
+        sql += " AND g.home = ?"
+        params.append(int(home))
+    sql += f" GROUP BY g.player_id ORDER BY {stats[0]} DESC"
+    return query(sql, params, path)
+
+
+def main():
+    # python -m common.warehouse build [season] [--full]
+    # python -m common.warehouse vs <ABBR> [home|road] [stat ...]
+    # python -m common.warehouse sql "<SELECT ...>"
+    command = sys.argv[1] if len(sys.argv) > 1 else "build"
+    if command == "build":
+        seasons = [int(arg) for arg in sys.argv[2:] if arg.isdigit()]
+        build(season=seasons[0] if seasons else None, full="--full" in sys.argv)
+    elif command == "vs" and len(sys.argv) > 2:
+        args = sys.argv[3:]
+        home = {"home": True, "road": False}.get(args[0]) if args else None
+        stats = tuple(args[1:] if args and args[0] in ("home", "road") else args) or ("pts",)
+        start = time.perf_counter()
+        df = vs_opponent(sys.argv[2], home, stats)
+        print(df.to_string(index=False))
+        print(f"{len(df)} players in {(time.perf_counter() - start) * 1000:.1f} ms")
+    elif command == "sql" and len(sys.argv) > 2:
+        print(query(sys.argv[2]).to_string(index=False))
+    else:
+        print('Usage: python -m common.warehouse <build [season] [--full]|vs <ABBR> [home|road] [stat ...]|sql "<query>">')
+
+
+if __name__ == "__main__":
+    main()
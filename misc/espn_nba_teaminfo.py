@@ -1,21 +1,19 @@
 # Script to fetch team ID, team name, team abbreviation
+# Teams come from common/team_registry.py, which discovers them from ESPN's /teams API (and the
+# TeamRankings teams index) once and caches them; pass --refresh to re-discover.
 
-import requests
+import os
+import sys
 
-# ESPN NBA teams API endpoint
-url = "http://site.api.espn.com/apis/site/v2/sports/basketball/nba/teams"
+# Make the shared modules in <repo>/common importable when run as a script
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from common.team_registry import load_registry
 
-# Make the API request
-response = requests.get(url)
-data = response.json()
-
-# Extract all NBA teams
-teams = data["sports"][0]["leagues"][0]["teams"]
+registry = load_registry("nba", refresh="--refresh" in sys.argv)
 
 # Print each team's ID, slug, and abbreviation
-for team in teams:
-    team_data = team["team"]
-    print(f"ID: {team_data['id']}")
-    print(f"Slug: {team_data['slug']}")
-    print(f"Abbreviation: {team_data['abbreviation']}")
-    print()
\ No newline at end of file
+for team in registry:
+    print(f"ID: {team.espn_id}")
+    print(f"Slug: {team.espn_slug}")
+    print(f"Abbreviation: {team.abbreviation}")
+    print()
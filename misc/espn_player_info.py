@@ -1,19 +1,27 @@
 # Script to gather player info
 
-import requests
+import os
+import sys
+
+# Make the shared modules in <repo>/common importable when run as a script
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from common.espn_embedded import extract_fitt, iter_key
+from common.http_cache import cached_get
 
 def get_player_stats(player_id, player_name):
     url = f"https://www.espn.com/nba/player/splits/_/id/{player_id}/{player_name}"
     
-    response = requests.get(url)
+    response = cached_get(url)
     if response.status_code != 200:
         print(f"Failed to retrieve data for {player_name} (ID: {player_id})")
         return None
     
-    data = response.json()
+    # The splits page is HTML; the "tbl" payload lives in its embedded window['__espnfitt__'] JSON
+    data = extract_fitt(response.text) or {}
+    tbl = next(iter_key(data, "tbl"), [])
     extracted_data = {}
     
-    for category in data.get("tbl", []):
+    for category in tbl:
         category_name = category.get("dspNm")
         
         if category_name in ["split", "Month", "Result", "Position", "Day", "Opponent"]:
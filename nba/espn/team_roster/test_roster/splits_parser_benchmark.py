@@ -0,0 +1,122 @@
+# splits_parser_benchmark.py
+# Parity check and benchmark for the splits parser backends in common/html_tables.py
+# Rebuilds an ESPN-style splits page from anthony_edwards_splits_local.csv, checks that every
+# installed backend parses it back to exactly the saved CSV rows, then reports rows parsed per second.
+# The same check and timing is run for the embedded __espnfitt__ JSON path.
+
+import csv
+import json
+import os
+import sys
+import time
+
+# Make the shared modules in <repo>/common importable when run as a script
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "..")))
+from common.espn_splits import EXPECTED_HEADERS, parse_splits, parse_splits_html
+from common.html_tables import available_backends
+
+LOCAL_CSV = os.path.join(os.path.dirname(os.path.abspath(__file__)), "anthony_edwards_splits_local.csv")
+
+# Sections as ESPN groups them; each starts with a subheader row in both tables
+SECTIONS = [
+    ("split", ["All Splits", "Home", "Road", "vs. Division", "vs. Conference", "3+ Days Rest"]),
+    ("Month", ["October", "November", "December", "January", "February", "March", "Pre All-Star", "Post All-Star"]),
+    ("Result", ["Wins", "Losses"]),
+    ("Position", ["As Starter"]),
+    ("Day", ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]),
+    ("Opponent", None),  # Every remaining "vs XXX" split
+]
+
+
+def load_local_rows():
+    """Rows of the saved splits CSV (without the header)."""
+    with open(LOCAL_CSV, mode="r", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        next(reader)
+        return [row for row in reader]
+
+
+def build_page(rows):
+    """Render rows the way ESPN does: split names and stats in two tables paired by position."""
+    by_split = {row[0]: row[1:] for row in rows}
+    opponents = [row[0] for row in rows if row[0].startswith("vs ")]
+
+    names = ['<table class="Table Table--align-right Table--fixed Table--fixed-left">',
+             '<thead><tr><th class="Table__TH">Split</th></tr></thead><tbody>']
+    stats = ['<div class="Table__Scroller"><table class="Table Table--align-right">',
+             "<thead><tr>" + "".join(f'<th class="Table__TH">{h}</th>' for h in EXPECTED_HEADERS[1:]) + "</tr></thead><tbody>"]
+
+    for section, splits in SECTIONS:
+        names.append(f'<tr class="Table__TR Table__sub-header"><td class="Table__TD">{section}</td></tr>')
+        stats.append('<tr class="Table__TR Table__sub-header">' + "".join(f'<td class="Table__TD">{h}</td>' for h in EXPECTED_HEADERS[1:]) + "</tr>")
+        for split in splits or opponents:
+            names.append(f'<tr class="Table__TR"><td class="Table__TD">\n  <span>{split}</span>\n</td></tr>')
+            stats.append('<tr class="Table__TR">' + "".join(f'<td class="Table__TD"> {value} </td>' for value in by_split[split]) + "</tr>")
+
+    names.append("</tbody></table>")
+    stats.append("</tbody></table></div>")
+    return f"<html><head><title>Splits</title></head><body><div class=\"ResponsiveTable\">{''.join(names)}{''.join(stats)}</div></body></html>"
+
+
+def build_fitt_page(rows):
+    """Render rows as the embedded window['__espnfitt__'] "tbl" payload, grouped like SECTIONS."""
+    opponents = [row for row in rows if row[0].startswith("vs ")]
+    by_split = {row[0]: row for row in rows}
+    tbl = [{"dspNm": section, "row": [by_split[split] for split in splits] if splits else opponents}
+           for section, splits in SECTIONS]
+    blob = json.dumps({"page": {"content": {"player": {"splts": {"tbl": tbl}}}}})
+    return f"<html><body><script>window['__espnfitt__']={blob};</script></body></html>"
+
+
+def check_parity(html, expected):
+    """Parse html with every installed backend and compare against the saved CSV rows."""
+    ok = True
+    for backend in available_backends():
+        parsed = parse_splits_html(html, backend=backend)
+        if parsed == expected:
+            print(f"[parity] {backend:<10} OK ({len(parsed)} rows)")
+            continue
+        ok = False
+        mismatches = [(want[0], got) for want, got in zip(expected, parsed or []) if want != got]
+        print(f"[parity] {backend:<10} MISMATCH: {len(mismatches)} rows differ, first: {mismatches[:1]}")
+    return ok
+
+
+def check_fitt_parity(fitt_html, expected):
+    """Parse the embedded JSON page and compare against the saved CSV rows."""
+    parsed = parse_splits(fitt_html)
+    print(f"[parity] {'json':<10} {'OK' if parsed == expected else 'MISMATCH'} ({len(parsed or [])} rows)")
+    return parsed == expected
+
+
+def time_parser(name, parse, html, rows_per_page, pages):
+    """Run parse(html) `pages` times and print rows parsed per second."""
+    start = time.perf_counter()
+    for _ in range(pages):
+        parse(html)
+    elapsed = time.perf_counter() - start
+    rate = rows_per_page * pages / elapsed
+    print(f"[bench]  {name:<10} {rate:>10,.0f} rows/s  ({elapsed / pages * 1000:.2f} ms/page)")
+    return rate
+
+
+def benchmark(html, fitt_html, rows_per_page, pages=200):
+    """Parse the pages `pages` times per backend and print rows parsed per second."""
+    results = {"json": time_parser("json", parse_splits, fitt_html, rows_per_page, pages)}
+    for backend in available_backends():
+        results[backend] = time_parser(backend, lambda page: parse_splits_html(page, backend=backend), html, rows_per_page, pages)
+    return results
+
+
+def main():
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    expected = load_local_rows()
+    html = build_page(expected)
+    fitt_html = build_fitt_page(expected)
+    if not (check_parity(html, expected) and check_fitt_parity(fitt_html, expected)):
+        sys.exit(1)
+    benchmark(html, fitt_html, len(expected), pages)
+
+
+if __name__ == "__main__":
+    main()
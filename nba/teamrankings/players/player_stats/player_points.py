@@ -1,62 +1,41 @@
-import time
-import re
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+# player_points.py
+# Looks up players' TeamRankings stats and writes <player-slug>_stats.csv for each name given
+# The numbers come from the league-wide player-stat leaderboards saved by
+# common/teamrankings_player_stats.py (one request per stat for every player), so no browser is
+# launched and no name has to be typed in. The leaderboards are fetched first if none are saved
+# yet, or when --refresh is passed.
+#   python player_points.py "Jayson Tatum" "Anthony Edwards" [--refresh]
+
+import os
+import sys
+
 import pandas as pd
-from webdriver_manager.chrome import ChromeDriverManager
-
-def format_player_name(player_name):
-    """ Converts player name to URL-friendly format """
-    formatted_name = player_name.lower().replace(" ", "-")
-    formatted_name = re.sub(r"[^a-zA-Z0-9-]", "", formatted_name)  # Remove special characters
-    return formatted_name
-
-def get_player_stats(player_name):
-    """ Scrapes player stats from TeamRankings.com """
-    
-    formatted_name = format_player_name(player_name)
-    url = f"https://www.teamrankings.com/nba/player/{formatted_name}/stats"
-
-    # Set up Selenium WebDriver
-    options = Options()
-    options.headless = False
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
-
-    driver.get(url)
-    time.sleep(5)  # Allow page to load
-
-    data = []
-
-    try:
-        # Wait for stats table to be visible
-        WebDriverWait(driver, 20).until(
-            EC.presence_of_element_located((By.XPATH, '//table[contains(@class, "tr-table")]'))
-        )
-
-        # Locate stats table
-        table = driver.find_element(By.XPATH, '//table[contains(@class, "tr-table")]')
-        rows = table.find_elements(By.TAG_NAME, "tr")
-
-        for row in rows:
-            columns = row.find_elements(By.TAG_NAME, "td")
-            if len(columns) >= 2:
-                stat_category = columns[0].text.strip()
-                stat_value = columns[1].text.strip()
-                data.append([stat_category, stat_value])
-
-        # Save data to CSV
-        df = pd.DataFrame(data, columns=["Stat Category", "Value"])
-        df.to_csv(f"{formatted_name}_stats.csv", index=False)
-
-        print(f"CSV file saved: {formatted_name}_stats.csv")
-
-    finally:
-        driver.quit()
-
-# Example: Pull stats for Jayson Tatum
-player_name = input("Enter the player's full name: ")
-get_player_stats(player_name)
\ No newline at end of file
+
+# Make the shared modules in <repo>/common importable when run as a script
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "..")))
+from common.teamrankings_player_stats import ingest, load_leaderboards, player_stats
+
+# Directory to save the per-player CSVs
+output_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+def main():
+    names = [arg for arg in sys.argv[1:] if arg != "--refresh"]
+    if not names:
+        print('Usage: python player_points.py "<player name>" [...] [--refresh]')
+        return
+    if "--refresh" in sys.argv or load_leaderboards().empty:
+        ingest()
+
+    for name in names:
+        stats = player_stats(name)
+        if stats is None:
+            print(f"{name} is not on any saved leaderboard")
+            continue
+        csv_path = os.path.join(output_dir, f"{stats['slug']}_stats.csv")
+        pd.DataFrame(list(stats.items()), columns=["Stat Category", "Value"]).to_csv(csv_path, index=False)
+        print(f"CSV file saved: {csv_path}")
+
+
+if __name__ == "__main__":
+    main()
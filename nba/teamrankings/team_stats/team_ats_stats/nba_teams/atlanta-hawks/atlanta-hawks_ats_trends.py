@@ -9,8 +9,8 @@ from webdriver_manager.chrome import ChromeDriverManager
 import pandas as pd
 import os
 
-# Base directory for saving files
-BASE_DIR = "/Users/kamahl/Sports/scripts/nba/teamrankings/team_stats/team_ats_stats/nba_teams"
+# Base directory for saving files (the nba_teams folder this script sits in)
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 os.makedirs(BASE_DIR, exist_ok=True)
 
 def fetch_and_save_atlanta_hawks_ats_stats():
@@ -1,9 +1,14 @@
 # generate_team_stats_scripts.py
 import os
 import csv
+import sys
+
+# Make the shared modules in <repo>/common importable when run as a script
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "..")))
+from common.paths import TEAMRANKINGS_OUTPUT_DIRS
 
 # Base directory where team folders will be created
-BASE_DIR = "/Users/kamahl/Sports/scripts/nba/teamrankings/team_stats/team_overall_stats/nba_teams"
+BASE_DIR = TEAMRANKINGS_OUTPUT_DIRS[("nba", "stats")]
 os.makedirs(BASE_DIR, exist_ok=True)
 
 # Template for the team_stats.py script
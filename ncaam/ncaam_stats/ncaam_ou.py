@@ -1,100 +0,0 @@
-import os
-import time
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-import pandas as pd
-from webdriver_manager.chrome import ChromeDriverManager
-
-# List of NCAAM teams
-ncaam_teams = [
-    "bradley-braves", "rider-broncos", "radford-highlanders", "missouri-tigers", 
-    "st-johns-red-storm"
-]
-
-# Define the target folder (lowercase)
-output_folder = "ncaam_ou_stats"
-
-# Ensure the folder exists
-os.makedirs(output_folder, exist_ok=True)
-
-# Function to generate the script for each team
-def generate_team_script(team_slug):
-    # Create the Python script template
-    script_content = f"""
-import time
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-import pandas as pd
-from webdriver_manager.chrome import ChromeDriverManager
-
-# Set up the ChromeDriver with webdriver-manager
-options = Options()
-options.headless = False  # Set to True if you want to run it in headless mode
-
-driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
-
-# Open the page
-driver.get("https://www.teamrankings.com/ncaa-basketball/team/{team_slug}/over-under-trends")
-
-# Give some extra time for the page to load
-time.sleep(5)  # Wait for 5 seconds
-
-# Increase the timeout for waiting
-data = []  # List to store the rows
-
-try:
-    # Wait for the table to be visible
-    WebDriverWait(driver, 20).until(
-        EC.presence_of_element_located((By.XPATH, '//table[contains(@class, "tr-table")]'))
-    )
-    
-    # Find the table
-    table = driver.find_element(By.XPATH, '//table[contains(@class, "tr-table")]')
-    
-    # Find the rows of the table
-    rows = table.find_elements(By.TAG_NAME, "tr")
-
-    # Loop through the rows and extract the data
-    for row in rows:
-        columns = row.find_elements(By.TAG_NAME, "td")
-        
-        # Only process rows with the expected number of columns
-        if len(columns) >= 5:
-            trend = columns[0].text.strip()
-            ou_record = columns[1].text.strip()
-            over_percent = columns[2].text.strip()
-            avg_total_points = columns[3].text.strip()
-            avg_ou_margin = columns[4].text.strip()
-
-            # Add the row data to the list
-            data.append([trend, ou_record, over_percent, avg_total_points, avg_ou_margin])
-
-    # Create a DataFrame from the data
-    df = pd.DataFrame(data, columns=["Trend", "O/U Record", "Over %", "Avg Total Points", "O/U Margin"])
-
-    # Print the DataFrame (table-like format)
-    print(df)
-
-finally:
-    driver.quit()  # Close the browser after scraping
-"""
-    # Define full file path inside the folder
-    script_filename = os.path.join(output_folder, f"{team_slug}_ou_trends.py")
-
-    # Write the script content to a Python file
-    with open(script_filename, "w") as f:
-        f.write(script_content.strip())
-
-    print(f"Script for {team_slug} generated successfully in {output_folder}/")
-
-# Generate a script for each team in the list
-for team in ncaam_teams:
-    generate_team_script(team)
\ No newline at end of file
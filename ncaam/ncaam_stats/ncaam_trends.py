@@ -0,0 +1,27 @@
+# ncaam_trends.py
+# Scrapes the TeamRankings ATS, over/under and win trends for every NCAAM team in one job
+# Replaces ncaam_ats.py / ncaam_ou.py / ncaam_wins.py, which differed only in the page fetched.
+# Output goes to ncaam_<ats|ou|win>_stats/<team>/. Other pages (stats, schedule, roster) can be
+# added on the command line: python ncaam_trends.py ats ou win stats [--selenium] [--teams slug ...]
+
+import os
+import sys
+
+# Make the shared modules in <repo>/common importable when run as a script
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from common.team_registry import load_registry
+from common.teamrankings_scraper import scrape
+
+# TeamRankings slugs of every Division I team (common/team_registry.py); list slugs after
+# --teams to scrape only some of them
+ncaam_teams = load_registry("ncaam").teamrankings_slugs()
+
+DEFAULT_PAGES = ["ats", "ou", "win"]
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    teams = args[args.index("--teams") + 1:] if "--teams" in args else ncaam_teams
+    args = args[:args.index("--teams")] if "--teams" in args else args
+    pages = [arg for arg in args if not arg.startswith("--")] or DEFAULT_PAGES
+    # Tables are read from the plain HTTP response; pass --selenium to render pages in Chrome instead
+    scrape({"ncaam": teams}, pages, mode="selenium" if "--selenium" in sys.argv else None)